@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""SHARD BENCHMARK - concurrent write throughput, single store.db vs N shards
+
+Usage: python scripts/bench_shards.py [messages] [threads]
+"""
+
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from cogency.lib.shards import Sharded
+from cogency.lib.storage import SQLite
+
+
+def run(name, storage, messages: int, threads: int):
+    def write(i):
+        user = f"user_{i % 64}"
+        return storage.save_message(f"{user}_conv", user, "user", f"message {i} " + "x" * 200)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        saved = sum(pool.map(write, range(messages)))
+    rate = messages / (time.perf_counter() - start)
+    print(f"{name:<9} {rate:>9,.0f} msg/s ({saved}/{messages} saved)")
+
+
+def main():
+    messages = int(sys.argv[1]) if len(sys.argv) > 1 else 4_000
+    threads = int(sys.argv[2]) if len(sys.argv) > 2 else 32
+
+    print("📊 SHARD BENCHMARK")
+    print(f"{messages} messages from {threads} threads, 64 users")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # Baseline: one connection and commit per message on one file
+        run("sqlite", SQLite(str(Path(tmp) / "single")), messages, threads)
+
+        for count in [1, 2, 4, 8]:
+            storage = Sharded(str(Path(tmp) / f"sharded_{count}"), shards=count)
+            run(f"shards={count}", storage, messages, threads)
+            storage.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""STORAGE BENCHMARK - v1 TEXT-keyed conversations table vs interned v2 schema vs Memory
+
+Usage: python scripts/bench_storage.py [messages] [conversations]
+"""
+
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from cogency.lib import storage
+
+V1_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS conversations (
+        conversation_id TEXT NOT NULL,
+        user_id TEXT NOT NULL,
+        type TEXT NOT NULL,
+        content TEXT NOT NULL,
+        timestamp REAL NOT NULL,
+        PRIMARY KEY (conversation_id, timestamp)
+    );
+    CREATE INDEX IF NOT EXISTS idx_conversations_id ON conversations(conversation_id);
+    CREATE INDEX IF NOT EXISTS idx_conversations_type ON conversations(type);
+    CREATE INDEX IF NOT EXISTS idx_conversations_user ON conversations(user_id);
+    CREATE INDEX IF NOT EXISTS idx_conversations_composite ON conversations(conversation_id, type, timestamp);
+    CREATE INDEX IF NOT EXISTS idx_conversations_user_type ON conversations(user_id, type, timestamp);
+"""
+
+TYPES = ["user", "think", "calls", "result", "respond"]
+
+
+def workload(messages: int, conversations: int):
+    """Deterministic stream of (conversation_id, user_id, type, content, timestamp)."""
+    for i in range(messages):
+        conv = i % conversations
+        yield (
+            f"user_{conv % 10}_{conv:08d}-uuid-conversation",
+            f"user_{conv % 10}",
+            TYPES[i % len(TYPES)],
+            f"message {i} " + "x" * 200,
+            1_700_000_000 + i * 0.001,
+        )
+
+
+def v1_save(db_path, conversation_id, user_id, type, content, timestamp):
+    with sqlite3.connect(db_path) as db:
+        db.execute(
+            "INSERT INTO conversations (conversation_id, user_id, type, content, timestamp) VALUES (?, ?, ?, ?, ?)",
+            (conversation_id, user_id, type, content, timestamp),
+        )
+
+
+def v1_load(db_path, conversation_id):
+    with sqlite3.connect(db_path) as db:
+        db.row_factory = sqlite3.Row
+        rows = db.execute(
+            "SELECT type, content FROM conversations WHERE conversation_id = ? ORDER BY timestamp",
+            (conversation_id,),
+        ).fetchall()
+        return [{"type": row["type"], "content": row["content"]} for row in rows]
+
+
+V2_INSERT = """
+    INSERT INTO messages (conversation_key, seq, user_key, type, content, timestamp)
+    SELECT ?, COALESCE(MAX(seq), 0) + 1, ?, ?, ?, ?
+    FROM messages WHERE conversation_key = ?
+"""
+
+
+def bulk(name, db_path, insert, rows):
+    """One transaction - index maintenance and row encoding only, no per-commit fsync."""
+    with sqlite3.connect(db_path) as db:
+        start = time.perf_counter()
+        for row in rows:
+            insert(db, *row)
+        db.commit()
+        rate = len(rows) / (time.perf_counter() - start)
+    print(f"{name:<4} bulk   {rate:>9,.0f} msg/s")
+
+
+def v1_insert(db, conversation_id, user_id, type, content, timestamp):
+    db.execute(
+        "INSERT INTO conversations (conversation_id, user_id, type, content, timestamp) VALUES (?, ?, ?, ?, ?)",
+        (conversation_id, user_id, type, content, timestamp),
+    )
+
+
+def v2_insert(base_dir):
+    def insert(db, conversation_id, user_id, type, content, timestamp):
+        conversation_key = storage._key(db, base_dir, "conversation_keys", conversation_id)
+        user_key = storage._key(db, base_dir, "users", user_id)
+        db.execute(
+            V2_INSERT, (conversation_key, user_key, type, content, timestamp, conversation_key)
+        )
+
+    return insert
+
+
+def bench(name, save, load, rows, conversation_ids):
+    start = time.perf_counter()
+    for row in rows:
+        save(*row)
+    insert = len(rows) / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    loaded = sum(len(load(conversation_id)) for conversation_id in conversation_ids)
+    load_rate = len(conversation_ids) / (time.perf_counter() - start)
+
+    print(
+        f"{name:<4} insert {insert:>9,.0f} msg/s | load {load_rate:>7,.0f} conv/s ({loaded} msgs)"
+    )
+
+
+def main():
+    messages = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    conversations = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    rows = list(workload(messages, conversations))
+    conversation_ids = sorted({row[0] for row in rows})
+
+    print("📊 STORAGE BENCHMARK")
+    print(f"{messages} messages across {conversations} conversations")
+    print("=" * 60)
+    print("Per call - storage API, one connection and commit per message:")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        v1_path = Path(tmp) / "v1.db"
+        with sqlite3.connect(v1_path) as db:
+            db.executescript(V1_SCHEMA)
+        bench(
+            "v1",
+            lambda *row: v1_save(v1_path, *row),
+            lambda conversation_id: v1_load(v1_path, conversation_id),
+            rows,
+            conversation_ids,
+        )
+        v1_size = v1_path.stat().st_size
+
+        v2_dir = Path(tmp) / "v2"
+        v2_dir.mkdir()
+        bench(
+            "v2",
+            lambda conv, user, type, content, ts: storage.save_message(
+                conv, user, type, content, str(v2_dir), ts
+            ),
+            lambda conversation_id: storage.load_messages(conversation_id, str(v2_dir)),
+            rows,
+            conversation_ids,
+        )
+        v2_size = storage.get_db_path(str(v2_dir)).stat().st_size
+
+        # Zero-I/O baseline
+        memory = storage.Memory()
+        bench("mem", memory.save_message, memory.load_messages, rows, conversation_ids)
+
+        print("Bulk - same statements in one transaction:")
+        v1_bulk = Path(tmp) / "v1_bulk.db"
+        with sqlite3.connect(v1_bulk) as db:
+            db.executescript(V1_SCHEMA)
+        bulk("v1", v1_bulk, v1_insert, rows)
+
+        v2_bulk = Path(tmp) / "v2_bulk"
+        v2_bulk.mkdir()
+        storage.DB.connect(str(v2_bulk)).close()
+        bulk("v2", storage.get_db_path(str(v2_bulk)), v2_insert(str(v2_bulk)), rows)
+
+    print(f"size v1 {v1_size / 1e6:.1f} MB | v2 {v2_size / 1e6:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -40,6 +40,20 @@ def main():
         show_stats()
         return
 
+    # Per-shard balance
+    if len(sys.argv) > 1 and sys.argv[1] == "shards":
+        from .admin import show_shards
+
+        show_shards()
+        return
+
+    # Usage ledger
+    if len(sys.argv) > 1 and sys.argv[1] == "usage":
+        from .admin import usage_main
+
+        usage_main()
+        return
+
     # User profiles
     if len(sys.argv) > 1 and sys.argv[1] == "users":
         from .admin import users_main
@@ -63,6 +77,20 @@ def main():
             print("📭 No profile found")
         return
 
+    # Retention and vacuum
+    if len(sys.argv) > 1 and sys.argv[1] == "compact":
+        from .admin import compact
+
+        compact()
+        return
+
+    # Conversation retention
+    if len(sys.argv) > 1 and sys.argv[1] == "archive":
+        from .admin import archive_main
+
+        archive_main()
+        return
+
     # Nuclear cleanup
     if len(sys.argv) > 1 and sys.argv[1] == "nuke":
         from .admin import nuke_everything
@@ -85,6 +113,8 @@ def main():
         print("  cogency prompt [conv_id]             # Show exact LLM prompt sent")
         print("  cogency db                           # Interactive database inspection")
         print("  cogency stats                        # Database health stats")
+        print("  cogency shards                       # Per-shard balance (sharded storage)")
+        print("  cogency usage [days]                 # Cost, tokens and latency (default 7d)")
         print("  cogency profile                      # Show user memory profile")
         print()
         print("⚙️ OPTIONS:")
@@ -108,6 +138,8 @@ def main():
         print("  cogency prompt                       # See exact LLM context")
         print()
         print("🗑️  ADMIN:")
+        print("  cogency archive [--days=90]          # Export + delete old messages")
+        print("  cogency compact                      # Prune old profile versions + vacuum")
         print("  cogency nuke                         # Delete all data")
         return
 
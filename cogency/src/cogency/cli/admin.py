@@ -4,21 +4,73 @@ import json
 import sqlite3
 import sys
 import time
+from pathlib import Path
 
-from ..lib.storage import get_cogency_dir, get_db_path, load_profile
+from ..lib.shards import shard_dirs
+from ..lib.storage import (
+    DB,
+    PROFILE_RETENTION,
+    clear_profile_cache,
+    compact_profiles,
+    get_cogency_dir,
+    get_db_path,
+    load_profile,
+    load_usage,
+    vacuum,
+)
 
 
-def show_stats():
-    """Show database statistics and conversation analytics."""
-    db_path = get_db_path()
+def _stores() -> list[tuple[str, str | None]]:
+    """Existing (label, base_dir) stores - the main database, then each shard."""
+    stores = [("main", None)] if get_db_path().exists() else []
+    stores.extend((f"shard {path.name}", str(path)) for path in shard_dirs())
+    return stores
 
-    if not db_path.exists():
+
+def show_stats():
+    """Show database statistics, then a per-shard summary when sharded."""
+    if not _stores():
         print("✅ No conversation database found")
         return
 
+    if get_db_path().exists():
+        _show_database_stats()
+    if shard_dirs():
+        show_shards()
+
+
+def show_shards():
+    """Per-shard record counts and balance."""
+    dirs = shard_dirs()
+    if not dirs:
+        print("✅ No shards found")
+        return
+
+    print(f"\n🗂️ Shards: {dirs[0].parent} ({len(dirs)} files)")
+    counts = []
+    for shard_dir in dirs:
+        with DB.connect(str(shard_dir)) as db:
+            messages = db.execute("SELECT COUNT(*) FROM messages").fetchone()[0]
+            conversations = db.execute("SELECT COUNT(*) FROM conversation_keys").fetchone()[0]
+            users = db.execute("SELECT COUNT(*) FROM users").fetchone()[0]
+        size = get_db_path(str(shard_dir)).stat().st_size
+        counts.append(messages)
+        print(
+            f"  {shard_dir.name} | {messages:>7} msgs | {conversations:>5} convs | "
+            f"{users:>4} users | {size / 1024:.1f}KB"
+        )
+
+    total = sum(counts)
+    skew = max(counts) / (total / len(counts)) if total else 1.0
+    print(f"📊 Total: {total} records across {len(dirs)} shards (max/mean {skew:.2f})")
+
+
+def _show_database_stats():
+    """Statistics for the main database."""
+    db_path = get_db_path()
     print(f"🗃️ Database: {db_path}")
 
-    with sqlite3.connect(db_path) as db:
+    with DB.connect() as db:
         # Total records
         total = db.execute("SELECT COUNT(*) FROM conversations").fetchone()[0]
         print(f"📊 Total records: {total}")
@@ -54,6 +106,91 @@ def show_stats():
             print(f"  {record_type:<15} | {count:>4} records")
 
 
+def _percentile(values: list[float], pct: float) -> float | None:
+    """Nearest-rank percentile (None for no values)."""
+    if not values:
+        return None
+    values = sorted(values)
+    return values[max(0, -(-len(values) * pct // 100) - 1)]
+
+
+def _seconds(value: float | None) -> str:
+    return f"{value:.2f}s" if value is not None else "-"
+
+
+def show_usage(days: float = 7):
+    """Usage ledger: cost per user/day, tokens and latency per model/day."""
+    stores = _stores()
+    if not stores:
+        print("✅ No database found")
+        return
+
+    since = time.time() - days * 86400
+    records = [r for _, base_dir in stores for r in load_usage(since, base_dir)]
+    if not records:
+        print(f"✅ No usage recorded in the last {days:g}d")
+        return
+
+    estimated = sum(r["estimated"] for r in records)
+    print(
+        f"💰 Usage: last {days:g}d | {len(records)} requests | "
+        f"${sum(r['cost'] for r in records):.4f} | {estimated} estimated locally"
+    )
+
+    users: dict[tuple, list] = {}
+    models: dict[tuple, list] = {}
+    for r in records:
+        day = time.strftime("%Y-%m-%d", time.localtime(r["timestamp"]))
+        users.setdefault((day, r["user_id"]), []).append(r)
+        models.setdefault((day, r["model"]), []).append(r)
+
+    print("\n👤 Cost per user/day:")
+    by_cost = sorted(users.items(), key=lambda item: sum(r["cost"] for r in item[1]), reverse=True)
+    for (day, user_id), rows in sorted(by_cost, key=lambda item: item[0][0], reverse=True):
+        tokens_in = sum(r["input"] for r in rows)
+        tokens_out = sum(r["output"] for r in rows)
+        print(
+            f"  {day} | {user_id:<20} | {len(rows):>4} req | "
+            f"{tokens_in:>8}→{tokens_out:<7} tok | ${sum(r['cost'] for r in rows):.4f}"
+        )
+
+    # Per-request averages - regressions in tokens per turn show up day over day
+    print("\n🤖 Per model/day:")
+    for (day, model), rows in sorted(models.items(), reverse=True):
+        tokens_in = sum(r["input"] for r in rows)
+        cached = sum(r["cached"] for r in rows)
+        ttft = _percentile([r["ttft"] for r in rows if r["ttft"] is not None], 95)
+        latency = _percentile([r["latency"] for r in rows], 95)
+        print(
+            f"  {day} | {model:<24} | {len(rows):>4} req | "
+            f"{tokens_in / len(rows):>7.0f} in/req | "
+            f"{sum(r['output'] for r in rows) / len(rows):>6.0f} out/req | "
+            f"cache {cached / tokens_in if tokens_in else 0:>4.0%} | "
+            f"p95 ttft {_seconds(ttft)} | p95 latency {_seconds(latency)}"
+        )
+
+    keys: dict[tuple, int] = {}
+    for r in records:
+        if r["key"] is not None:
+            keys[(r["model"], r["key"])] = keys.get((r["model"], r["key"]), 0) + 1
+    if len(keys) > 1:
+        print("\n🔑 Requests per API key:")
+        for (model, key), count in sorted(keys.items()):
+            print(f"  {model:<24} | key {key} | {count:>5} req")
+
+
+def usage_main():
+    """Handle usage command: cogency usage [days]."""
+    days = 7.0
+    if len(sys.argv) > 2:
+        try:
+            days = float(sys.argv[2])
+        except ValueError:
+            print(f"❌ Invalid days: {sys.argv[2]}")
+            return
+    show_usage(days)
+
+
 def show_users():
     """Show all user profiles."""
     db_path = get_db_path()
@@ -62,7 +199,7 @@ def show_users():
         print("✅ No database found")
         return
 
-    with sqlite3.connect(db_path) as db:
+    with DB.connect() as db:
         try:
             profiles = db.execute("""
                 SELECT user_id, MAX(version) as latest_version, MAX(created_at) as last_updated, char_count
@@ -104,7 +241,7 @@ def show_user(user_id: str):
         print(f"❌ Error fetching profile: {e}")
 
     # Show conversations
-    with sqlite3.connect(db_path) as db:
+    with DB.connect() as db:
         conversations = db.execute(
             """
             SELECT conversation_id, COUNT(*) as records, MIN(timestamp) as first, MAX(timestamp) as last
@@ -156,12 +293,19 @@ def nuke_everything():
     # Count what we're about to nuke
     db_records = 0
     if db_path.exists():
-        with sqlite3.connect(db_path) as db:
+        with DB.connect() as db:
             db_records = db.execute("SELECT COUNT(*) FROM conversations").fetchone()[0]
             print(f"🗃️ Database: {db_path} ({db_records} records)")
     else:
         print("🗃️ Database: No database found")
 
+    shards = shard_dirs()
+    for shard_dir in shards:
+        with DB.connect(str(shard_dir)) as db:
+            db_records += db.execute("SELECT COUNT(*) FROM messages").fetchone()[0]
+    if shards:
+        print(f"🗂️ Shards: {shards[0].parent} ({len(shards)} files)")
+
     sandbox_files = nuke_sandbox()
 
     total_items = db_records + sandbox_files
@@ -175,14 +319,103 @@ def nuke_everything():
     confirm = input("Type 'yes' to confirm nuclear cleanup: ")
 
     if confirm.lower() == "yes":
-        if db_path.exists():
-            db_path.unlink()
+        if db_path.exists() or shards:
+            if db_path.exists():
+                db_path.unlink()
+            if shards:
+                import shutil
+
+                shutil.rmtree(shards[0].parent)
+            clear_profile_cache()
             print(f"✅ Nuked database - {db_records} records deleted")
         print(f"✅ NUCLEAR CLEANUP COMPLETE - {total_items} items deleted")
     else:
         print("❌ Nuclear cleanup cancelled")
 
 
+def compact():
+    """Apply profile retention and reclaim free pages - main database and every shard."""
+    stores = _stores()
+    if not stores:
+        print("✅ No database found")
+        return
+
+    for label, base_dir in stores:
+        db_path = get_db_path(base_dir)
+        size_before = db_path.stat().st_size
+        deleted = compact_profiles(base_dir)
+        print(
+            f"🧹 {label}: {deleted} old profile versions deleted "
+            f"(keeping last {PROFILE_RETENTION['keep_versions']} + {PROFILE_RETENTION['keep_days']}d)"
+        )
+
+        vacuum(base_dir)
+        size_after = db_path.stat().st_size
+        print(f"✅ {label}: {size_before / 1024:.1f}KB → {size_after / 1024:.1f}KB")
+
+
+def archive_main():
+    """Archive CLI - export and delete expired messages.
+
+    cogency archive [--days=N] [--user=NAME:DAYS|NAME:keep] [--format=jsonl|columnar]
+                    [--summarize] [--dry-run]
+    """
+    from ..lib.retention import Policy, archive, summarize
+
+    days = 90.0
+    users = {}
+    format = "jsonl"
+    summarizer = None
+    dry_run = False
+
+    for arg in sys.argv[2:]:
+        if arg.startswith("--days="):
+            days = float(arg.split("=", 1)[1])
+        elif arg.startswith("--user="):
+            user_id, _, user_days = arg.split("=", 1)[1].partition(":")
+            users[user_id] = None if user_days == "keep" else float(user_days or days)
+        elif arg.startswith("--format="):
+            format = arg.split("=", 1)[1]
+        elif arg == "--summarize":
+            summarizer = summarize
+        elif arg == "--dry-run":
+            dry_run = True
+        else:
+            print(f"❌ Unknown archive option: {arg}")
+            return
+
+    stores = _stores()
+    if not stores:
+        print("✅ No database found")
+        return
+
+    archive_dir = get_cogency_dir() / "archive"
+    total = 0
+    for label, base_dir in stores:
+        stats = archive(
+            Policy(max_age_days=days, users=users),
+            base_dir=base_dir,
+            out_dir=str(archive_dir / Path(base_dir).name) if base_dir else str(archive_dir),
+            format=format,
+            summarizer=summarizer,
+            dry_run=dry_run,
+        )
+        total += stats["rows"]
+        if not stats["rows"]:
+            continue
+
+        verb = "Would archive" if dry_run else "Archived"
+        print(
+            f"📦 {label}: {verb} {stats['rows']} messages "
+            f"from {stats['conversations']} conversations"
+        )
+        if stats["path"]:
+            print(f"🗄️ Cold storage: {stats['path']}")
+
+    if not total:
+        print(f"✅ Nothing older than {days:g}d to archive")
+
+
 def users_main():
     """Users CLI main entry."""
     if len(sys.argv) < 3:
@@ -25,10 +25,8 @@ try:
 except ImportError:
     pass
 
-import sqlite3
-
 from .. import Agent
-from ..lib.storage import get_db_path
+from ..lib.storage import get_db_path, last_conversation
 from ..tools import TOOLS
 
 
@@ -43,18 +41,13 @@ def get_last_conversation_id(user_id: str) -> str:
         return str(uuid.uuid4())
 
     try:
-        with sqlite3.connect(db_path) as db:
-            result = db.execute(
-                "SELECT conversation_id FROM conversations WHERE user_id = ? ORDER BY timestamp DESC LIMIT 1",
-                (user_id,),
-            ).fetchone()
-
-            if result:
-                return result[0]  # Continue last conversation
-            # No conversations for this user - create first one
-            import uuid
-
-            return str(uuid.uuid4())
+        conversation_id = last_conversation(user_id)
+        if conversation_id:
+            return conversation_id  # Continue last conversation
+        # No conversations for this user - create first one
+        import uuid
+
+        return str(uuid.uuid4())
 
     except Exception:
         # Database error - create new conversation
@@ -1,12 +1,11 @@
 """Core debugging - what agent did vs what should have happened."""
 
 import json
-import sqlite3
 import sys
 import time
 
 from ..core.protocols import Event
-from ..lib.storage import get_db_path
+from ..lib.storage import DB, get_db_path
 
 
 def show_conversation(conversation_id: str = None):
@@ -17,11 +16,11 @@ def show_conversation(conversation_id: str = None):
         print("❌ No conversations found")
         return
 
-    with sqlite3.connect(db_path) as db:
+    with DB.connect() as db:
         if not conversation_id:
             # Get last conversation
             result = db.execute(
-                "SELECT conversation_id FROM conversations ORDER BY timestamp DESC LIMIT 1"
+                "SELECT conversation_id FROM conversations ORDER BY id DESC LIMIT 1"
             ).fetchone()
             if not result:
                 print("❌ No conversations found")
@@ -30,7 +29,7 @@ def show_conversation(conversation_id: str = None):
 
         # Get full conversation
         messages = db.execute(
-            "SELECT type, content, timestamp FROM conversations WHERE conversation_id = ? ORDER BY timestamp",
+            "SELECT type, content, timestamp FROM conversations WHERE conversation_id = ? ORDER BY seq",
             (conversation_id,),
         ).fetchall()
 
@@ -86,10 +85,10 @@ def show_context(conversation_id: str = None):
         print("❌ No conversations found")
         return
 
-    with sqlite3.connect(db_path) as db:
+    with DB.connect() as db:
         if not conversation_id:
             result = db.execute(
-                "SELECT conversation_id FROM conversations ORDER BY timestamp DESC LIMIT 1"
+                "SELECT conversation_id FROM conversations ORDER BY id DESC LIMIT 1"
             ).fetchone()
             if not result:
                 print("❌ No conversations found")
@@ -110,7 +109,7 @@ def show_context(conversation_id: str = None):
 
         # Get the user query
         user_msg = db.execute(
-            "SELECT content FROM conversations WHERE conversation_id = ? AND type = 'user' ORDER BY timestamp DESC LIMIT 1",
+            "SELECT content FROM conversations WHERE conversation_id = ? AND type = 'user' ORDER BY seq DESC LIMIT 1",
             (conversation_id,),
         ).fetchone()
 
@@ -160,7 +159,7 @@ def query_main():
     print("📊 Commands: conversations, messages <id>, sql <query>, exit")
     print()
 
-    with sqlite3.connect(db_path) as db:
+    with DB.connect() as db:
         while True:
             try:
                 cmd = input("db> ").strip()
@@ -197,7 +196,7 @@ def query_main():
                             conv_id = result[0]
 
                     messages = db.execute(
-                        "SELECT type, content FROM conversations WHERE conversation_id = ? ORDER BY timestamp",
+                        "SELECT type, content FROM conversations WHERE conversation_id = ? ORDER BY seq",
                         (conv_id,),
                     ).fetchall()
 
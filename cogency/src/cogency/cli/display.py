@@ -32,6 +32,8 @@ class Renderer:
 
     def __init__(self, show_stream: bool = False):
         self.pending_calls = None
+        self.rendered = set()  # Call indexes already shown through result_done
+        self.streamed = set()  # Call indexes whose output was shown chunk by chunk
         self.thinking_started = False
         self.show_stream = show_stream
         self.token_count = 0
@@ -64,6 +66,7 @@ class Renderer:
                         print()  # Newline after thinking
                         self.thinking_started = False
                     self.pending_calls = event["calls"]
+                    self.rendered, self.streamed = set(), set()
                     for call in event["calls"]:
                         name = call.get("name", "unknown")
                         args = call.get("args", {})
@@ -72,12 +75,28 @@ class Renderer:
                             print(f"○ {name}({arg_str})")
                         else:
                             print(f"○ {name}()")
+                case Event.RESULT_CHUNK:
+                    # Live output while the call runs
+                    self.streamed.add(event["index"])
+                    for line in event["content"].splitlines():
+                        if line.strip():
+                            print(f"  {line}", flush=True)
+                case Event.RESULT_DONE:
+                    # Each result as soon as its call finishes - just the outcome if streamed
+                    result = event["content"]
+                    if event["index"] in self.streamed:
+                        result = result.split("\n", 1)[0]
+                    _render_tools([{"result": result}])
+                    self.rendered.add(event["index"])
                 case Event.RESULTS:
-                    # Zip with pending calls for display
+                    # Zip with pending calls for display - anything not already shown
                     if self.pending_calls and event.get("results"):
                         executions = []
-                        for call, result in zip(self.pending_calls, event["results"], strict=False):
-                            executions.append({"call": call, "result": result})
+                        for i, (call, result) in enumerate(
+                            zip(self.pending_calls, event["results"], strict=False)
+                        ):
+                            if i not in self.rendered:
+                                executions.append({"call": call, "result": result})
                         _render_tools(executions)
                         self.pending_calls = None
                 case Event.RESPOND:
@@ -60,25 +60,30 @@ class Context:
         if user_id is None:
             raise ValueError("user_id cannot be None")
 
+        storage = config.storage if config else None
+
         # Build system message with all context
         system_sections = []
 
         # Core instructions and tools (with optional user instructions)
         instructions = config.instructions if config else None
+        parallel = getattr(config, "parallel", False) is True
         system_sections.append(
-            system_prompt(tools=tools, instructions=instructions, include_security=True)
+            system_prompt(
+                tools=tools, instructions=instructions, include_security=True, parallel=parallel
+            )
         )
 
         # User profile context
         profile = config.profile if config else True
         if profile:
-            profile_content = profile_format(user_id)
+            profile_content = profile_format(user_id, storage)
             if profile_content:
                 system_sections.append("USER CONTEXT:")
                 system_sections.append(profile_content)
 
         # Conversation history (past cycles only)
-        history_content = history(conversation_id)
+        history_content = history(conversation_id, storage)
         if history_content:
             system_sections.append("CONVERSATION HISTORY:")
             system_sections.append(history_content)
@@ -98,14 +103,14 @@ class Context:
         ]
 
         # Add current cycle messages for replay mode continuity
-        current_cycle = current_cycle_messages(conversation_id)
+        current_cycle = current_cycle_messages(conversation_id, storage)
         messages.extend(current_cycle)
 
         return messages
 
-    def learn(self, user_id: str, llm) -> None:
-        """Trigger profile learning (fire and forget)."""
-        learn(user_id, llm)
+    def learn(self, user_id: str, llm, storage=None) -> None:
+        """Queue profile learning on the background learner (non-blocking)."""
+        learn(user_id, llm, storage)
 
 
 # Singleton instance
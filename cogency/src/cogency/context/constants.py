@@ -18,3 +18,11 @@ PROFILE_LIMITS = {
     "learning_trigger": 5,  # Check every N new user messages
     "learning_window": 10,  # Learn from last N messages for context
 }
+
+# LEARNER: Background profile learning worker
+LEARNER_LIMITS = {
+    "debounce": 2.0,  # Seconds of quiet before a user's profile is checked
+    "concurrency": 2,  # Max learning LLM calls in flight
+    "batch_size": 1,  # Users folded into one LLM request (1 = no batching)
+    "counters": 4096,  # Users whose unlearned count stays cached (evicted ones re-seed)
+}
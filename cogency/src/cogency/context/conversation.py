@@ -1,11 +1,14 @@
 """Conversation history construction for context assembly."""
 
+import json
+
 from ..core.protocols import Event
+from ..lib.retention import ARCHIVE
 from ..lib.storage import load_messages
 from .constants import DEFAULT_CONVERSATION_ID, HISTORY_LIMIT
 
 
-def history(conversation_id: str) -> str:
+def history(conversation_id: str, storage=None) -> str:
     """Context assembly algorithm:
 
     - Single system message with all context
@@ -17,7 +20,7 @@ def history(conversation_id: str) -> str:
     if not conversation_id or conversation_id == DEFAULT_CONVERSATION_ID:
         return ""
 
-    all_messages = load_messages(conversation_id)
+    all_messages = _load(conversation_id, storage)
     if not all_messages:
         return ""
 
@@ -25,14 +28,60 @@ def history(conversation_id: str) -> str:
     if not past_messages:
         return ""
 
+    # Archive records summarize expired history - always shown, never counted
+    archived = [f"ARCHIVED: {msg['content']}" for msg in past_messages if msg["type"] == ARCHIVE]
+
     # Filter out 'think' messages BEFORE applying history limit
-    conversational_messages = [msg for msg in past_messages if msg["type"] != Event.THINK]
+    conversational_messages = [
+        msg for msg in past_messages if msg["type"] not in (Event.THINK, ARCHIVE)
+    ]
     if not conversational_messages:
-        return ""
+        return "\n".join(archived)
 
     # Take last N conversational messages (user/assistant/tools only)
     history_messages = conversational_messages[-HISTORY_LIMIT:]
-    return _format_messages(history_messages)
+    return "\n".join([*archived, _format_messages(history_messages)])
+
+
+def _load(conversation_id: str, storage=None) -> list[dict]:
+    """Conversation messages from the configured storage (default SQLite)."""
+    messages = storage.load_messages(conversation_id) if storage else load_messages(conversation_id)
+    return _fold_results(messages)
+
+
+def _fold_results(messages: list[dict]) -> list[dict]:
+    """Drop RESULT_DONE checkpoints - folded into a RESULTS message only when none followed.
+
+    The RESULTS row is missing only for a turn cut short mid-batch; its checkpoints then
+    stand in for it, one result per call of the CALLS row before them.
+    """
+    folded = []
+    done = {}
+    last = None
+    calls = None
+    for msg in [*messages, None]:
+        if msg is not None and msg["type"] == Event.RESULT_DONE:
+            row = json.loads(msg["content"])
+            done[row["index"]] = row["result"]
+            last = msg
+            continue
+        if done and (msg is None or msg["type"] != Event.RESULTS):
+            count = max(_call_count(calls), max(done) + 1)
+            results = [done.get(i, "No result") for i in range(count)]
+            folded.append({**last, "type": Event.RESULTS, "content": json.dumps(results)})
+        done = {}
+        if msg is not None:
+            if msg["type"] == Event.CALLS:
+                calls = msg
+            folded.append(msg)
+    return folded
+
+
+def _call_count(calls: dict | None) -> int:
+    try:
+        return len(json.loads(calls["content"])) if calls else 0
+    except (json.JSONDecodeError, TypeError):
+        return 0
 
 
 def _past_messages(all_messages):
@@ -51,8 +100,6 @@ def _past_messages(all_messages):
 
 def _format_messages(history_messages):
     """Pair calls with results for history display."""
-    import json
-
     formatted = []
 
     i = 0
@@ -95,7 +142,7 @@ def _format_messages(history_messages):
     return "\n".join(formatted) if formatted else ""
 
 
-def current_cycle_messages(conversation_id: str) -> list[dict]:
+def current_cycle_messages(conversation_id: str, storage=None) -> list[dict]:
     """Get current cycle messages for replay mode continuity.
 
     Current cycle reconstruction:
@@ -106,7 +153,7 @@ def current_cycle_messages(conversation_id: str) -> list[dict]:
     if not conversation_id or conversation_id == DEFAULT_CONVERSATION_ID:
         return []
 
-    all_messages = load_messages(conversation_id)
+    all_messages = _load(conversation_id, storage)
     if not all_messages:
         return []
 
@@ -151,8 +198,6 @@ def format(current_cycle):
                 lines.append(f"Thinking: {content}")
             case Event.CALLS:
                 # Parse tools for natural description
-                import json
-
                 try:
                     tools = json.loads(content) if content else []
                     if tools:
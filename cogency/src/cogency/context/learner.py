@@ -0,0 +1,170 @@
+"""Background profile learning worker.
+
+Keeps learning off the turn's critical path:
+- Dirty queue: users whose debounce window closed, waiting for a check
+- Debounce: a burst of turns from one user collapses into one check
+- Counter: unlearned user messages cached per user (LRU-bounded), bumped on every user turn
+- Concurrency: bounded number of learning LLM calls in flight
+- Batching: several due users folded into one LLM request (batch_size > 1)
+"""
+
+import asyncio
+from functools import partial
+
+from ..lib.cache import LRU
+from ..lib.logger import logger
+from . import profile
+from .constants import LEARNER_LIMITS
+
+
+class Learner:
+    """Debounced, bounded profile learning on the running event loop."""
+
+    def __init__(
+        self,
+        debounce: float = None,
+        concurrency: int = None,
+        batch_size: int = None,
+        counters: int = None,
+    ):
+        self.debounce = LEARNER_LIMITS["debounce"] if debounce is None else debounce
+        self.concurrency = concurrency or LEARNER_LIMITS["concurrency"]
+        self.batch_size = batch_size or LEARNER_LIMITS["batch_size"]
+
+        # Survives loop changes - seeded from storage, then kept incrementally; an
+        # evicted user is simply seeded again on their next check
+        self._unlearned = LRU(counters or LEARNER_LIMITS["counters"])
+        self._llms: dict[str, tuple[object, object]] = {}  # user_id -> (llm, storage)
+        self._bind(None)
+
+    def _bind(self, loop):
+        """Reset loop-bound state (timers, queue, worker) for a new event loop."""
+        self._loop = loop
+        self._timers: dict[str, asyncio.TimerHandle] = {}
+        self._dirty: asyncio.Queue | None = asyncio.Queue() if loop else None
+        self._queued: set[str] = set()
+        self._slots = asyncio.Semaphore(self.concurrency) if loop else None
+        self._tasks: set[asyncio.Task] = set()
+        self._worker: asyncio.Task | None = None
+
+    def submit(self, user_id: str, llm, storage=None) -> None:
+        """Record a user turn and restart the user's debounce window.
+
+        Called once per persisted user message - O(1), no storage access.
+        Raises RuntimeError outside a running event loop.
+        """
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            self._bind(loop)
+
+        count = self._unlearned.get(user_id)
+        if count is not None:
+            self._unlearned.put(user_id, count + 1)
+        self._llms[user_id] = (llm, storage)
+
+        timer = self._timers.pop(user_id, None)
+        if timer:
+            timer.cancel()
+        self._timers[user_id] = loop.call_later(self.debounce, self._mark, user_id)
+
+        if self._worker is None or self._worker.done():
+            self._worker = loop.create_task(self._run())
+
+    def pending(self, user_id: str) -> int | None:
+        """Cached unlearned message count (None until seeded from storage)."""
+        return self._unlearned.get(user_id)
+
+    async def flush(self) -> None:
+        """Close all debounce windows now and wait for queued learning to finish."""
+        if self._loop is not asyncio.get_running_loop():
+            return
+        for user_id, timer in list(self._timers.items()):
+            timer.cancel()
+            self._mark(user_id)
+        await self._dirty.join()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    async def close(self) -> None:
+        """Drop pending windows and cancel the worker and in-flight learning."""
+        if self._loop is not asyncio.get_running_loop():
+            self._bind(None)
+            return
+        for timer in self._timers.values():
+            timer.cancel()
+        tasks = [t for t in [self._worker, *self._tasks] if t]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._bind(None)
+
+    def _mark(self, user_id: str) -> None:
+        """Debounce window closed - queue the user for a learning check."""
+        self._timers.pop(user_id, None)
+        if user_id not in self._queued:
+            self._queued.add(user_id)
+            self._dirty.put_nowait(user_id)
+
+    async def _run(self) -> None:
+        """Drain dirty users, check each, and dispatch learning within the slot limit."""
+        while True:
+            user_ids = [await self._dirty.get()]
+            while len(user_ids) < self.batch_size and not self._dirty.empty():
+                user_ids.append(self._dirty.get_nowait())
+            self._queued.difference_update(user_ids)
+
+            try:
+                groups: dict[tuple[int, int], tuple[object, object, list[str]]] = {}
+                for user_id in user_ids:
+                    llm, storage = self._llms.pop(user_id, (None, None))
+                    if llm and await self._due(user_id, storage):
+                        key = (id(llm), id(storage))
+                        groups.setdefault(key, (llm, storage, []))[2].append(user_id)
+
+                for llm, storage, due in groups.values():
+                    await self._slots.acquire()
+                    task = asyncio.create_task(self._learn(due, llm, storage))
+                    self._tasks.add(task)
+                    task.add_done_callback(partial(self._done, self._slots))
+            except Exception as e:
+                logger.debug(f"⚠️ Learner check failed for {user_ids}: {e}")
+            finally:
+                for _ in user_ids:
+                    self._dirty.task_done()
+
+    async def _due(self, user_id: str, storage=None) -> bool:
+        """Learning decision from the cached counter - storage is read only to seed it."""
+        current = await asyncio.to_thread(profile.get, user_id, storage)
+        if not current:
+            return False
+
+        count = self._unlearned.get(user_id)
+        if count is None:
+            since = current.get("_meta", {}).get("last_learned_at", 0)
+            count = await asyncio.to_thread(profile._count_unlearned, user_id, since, storage)
+            self._unlearned.put(user_id, count)
+
+        return profile._should_learn(current, count)
+
+    async def _learn(self, user_ids: list[str], llm, storage=None) -> None:
+        """Run one learning request for one or more users."""
+        try:
+            if len(user_ids) == 1:
+                await profile._learn(user_ids[0], llm, storage)
+            else:
+                await profile._learn_batch(user_ids, llm, storage)
+        finally:
+            # Learning moves last_learned_at - re-seed the counters on next check
+            for user_id in user_ids:
+                self._unlearned.pop(user_id)
+
+    def _done(self, slots: asyncio.Semaphore, task: asyncio.Task) -> None:
+        """Release the concurrency slot and surface failures to the debug log."""
+        self._tasks.discard(task)
+        slots.release()
+        if not task.cancelled() and task.exception():
+            logger.debug(f"⚠️ Profile learning failed: {task.exception()}")
+
+
+# Singleton worker
+learner = Learner()
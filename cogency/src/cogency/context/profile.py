@@ -2,8 +2,9 @@
 
 import json
 
+from ..lib.cache import LRU
 from ..lib.logger import logger
-from ..lib.storage import load_profile, save_profile
+from ..lib.storage import PROFILE_CACHE, load_profile, profile_version, save_profile
 from .constants import PROFILE_LIMITS
 
 # =============================================================================
@@ -32,43 +33,67 @@ def prompt(profile: dict, user_messages: list, compress: bool = False) -> str:
     )
 
 
-def get(user_id: str) -> dict | None:
+BATCH_TEMPLATE = """{users}
+Update each profile from its user's messages. Return one JSON object keyed by user id, with "SKIP" for users with nothing new. JSON only.
+Example: {{"alice": {{"who":"developer","style":"direct","focus":"AI projects","interests":"tech","misc":"likes cats"}}, "bob": "SKIP"}}"""
+
+
+def batch_prompt(batch: dict[str, tuple[dict, list[str]]]) -> str:
+    """Generate one learning prompt covering several users."""
+    sections = [
+        f"User {user_id}:\nCurrent: {json.dumps(profile)}\nMessages: " + "\n".join(messages)
+        for user_id, (profile, messages) in batch.items()
+    ]
+    return BATCH_TEMPLATE.format(users="\n\n".join(sections))
+
+
+def get(user_id: str, storage=None) -> dict | None:
     """Get latest user profile."""
     if not user_id or user_id == "default":
         return None
     try:
-        return load_profile(user_id)
+        return storage.load_profile(user_id) if storage else load_profile(user_id)
     except Exception as e:
         logger.debug(f"⚠️ Profile fetch failed for {user_id}: {e}")
         return None
 
 
-def format(user_id: str) -> str:
-    """Format user profile for context display."""
+# (storage, user_id) -> (version, rendered) - re-rendered only when the profile version moves
+_rendered = LRU(PROFILE_CACHE["size"])
+
+
+def format(user_id: str, storage=None) -> str:
+    """Format user profile for context display - pre-rendered per profile version."""
     try:
-        profile_data = get(user_id)
-        if not profile_data:
+        if not user_id or user_id == "default":
             return ""
 
-        return f"USER PROFILE:\n{json.dumps(profile_data, indent=2)}"
+        version = storage.profile_version(user_id) if storage else profile_version(user_id)
+        cached = _rendered.get((storage, user_id))
+        if cached and cached[0] == version:
+            return cached[1]
+
+        profile_data = get(user_id, storage)
+        rendered = f"USER PROFILE:\n{json.dumps(profile_data, indent=2)}" if profile_data else ""
+        _rendered.put((storage, user_id), (version, rendered))
+        return rendered
     except Exception as e:
         logger.debug(f"⚠️ Profile format failed for {user_id}: {e}")
         return ""
 
 
-def _delta(user_id: str) -> bool:
+def _delta(user_id: str, storage=None) -> bool:
     """Check if 5+ new user messages since last learning."""
-    current = get(user_id)
+    current = get(user_id, storage)
     if not current:
         return False
 
-    import sqlite3
-
-    from ..lib.storage import get_db_path
-
-    # Get metadata from embedded profile
     last_learned = current.get("_meta", {}).get("last_learned_at", 0)
+    return _should_learn(current, _count_unlearned(user_id, last_learned, storage))
 
+
+def _should_learn(current: dict, unlearned: int) -> bool:
+    """Learning decision from profile size and unlearned message count."""
     # Emergency: Profile over compression threshold
     current_chars = len(json.dumps(current))
     if current_chars > PROFILE_LIMITS["compress_threshold"]:
@@ -77,20 +102,6 @@ def _delta(user_id: str) -> bool:
         )
         return True
 
-    # Count unlearned messages
-    db_path = get_db_path()
-    if not db_path.exists():
-        return False
-
-    with sqlite3.connect(db_path) as db:
-        unlearned = db.execute(
-            """
-                SELECT COUNT(*) FROM conversations
-                WHERE user_id = ? AND type = 'user' AND timestamp > ?
-            """,
-            (user_id, last_learned),
-        ).fetchone()[0]
-
     # Trigger: 5+ new USER messages only
     if unlearned >= PROFILE_LIMITS["learning_trigger"]:
         logger.debug(
@@ -101,8 +112,21 @@ def _delta(user_id: str) -> bool:
     return False
 
 
-def learn(user_id: str, llm):
-    """Profile learning - handles everything internally (non-blocking)."""
+def _count_unlearned(user_id: str, since: float, storage=None) -> int:
+    """Count user messages newer than the last learning pass."""
+    if storage:
+        return storage.count_user_messages(user_id, since)
+
+    from ..lib.storage import count_user_messages, get_db_path
+
+    if not get_db_path().exists():
+        return 0
+
+    return count_user_messages(user_id, since)
+
+
+def learn(user_id: str, llm, storage=None):
+    """Profile learning - queued on the background learner (non-blocking)."""
     if not user_id or user_id == "default" or not llm:
         return
 
@@ -113,36 +137,80 @@ def learn(user_id: str, llm):
         logger.debug(f"🧠 Profile learning skipped in test environment for {user_id}")
         return
 
-    # Check if learning needed (internal responsibility)
-    if not _delta(user_id):
-        return
-
-    # Background execution (non-blocking)
-    import asyncio
+    from .learner import learner
 
-    # Fire-and-forget background learning
+    # Debounce, delta check and LLM call all happen on the worker
     try:
-        loop = asyncio.get_running_loop()
-        task = loop.create_task(_learn(user_id, llm))
+        learner.submit(user_id, llm, storage)
+    except RuntimeError:
+        # No event loop (e.g., sync callers) - skip background learning
+        return
+    logger.debug(f"🧠 Profile learning queued for {user_id}")
 
-        # Prevent "task not awaited" warning by adding done callback that handles exceptions
-        def handle_task_done(task):
-            import contextlib
 
-            with contextlib.suppress(Exception):
-                task.result()  # This will raise any exception that occurred
+async def _learn(user_id: str, llm, storage=None) -> bool:
+    """Internal async learning implementation."""
+    gathered = _gather(user_id, storage)
+    if not gathered:
+        return False
+    current, message_texts = gathered
 
-        task.add_done_callback(handle_task_done)
-    except RuntimeError:
-        # No event loop (e.g., in tests) - skip background learning
-        pass
-    logger.debug(f"🧠 Profile learning triggered for {user_id}")
+    logger.debug(f"🧠 LEARNING: {len(message_texts)} new messages for {user_id}")
 
+    # Check if compression needed
+    compress = len(json.dumps(current)) > PROFILE_LIMITS["compress_threshold"]
+    updated = await _process_profile(current, message_texts, llm, compress=compress)
+    return _apply(user_id, current, updated, len(message_texts), storage)
+
+
+async def _learn_batch(user_ids: list[str], llm, storage=None) -> dict[str, bool]:
+    """Learn several profiles from one LLM request.
+
+    Profiles over the compression threshold are learned individually - compression
+    needs its own instruction and a single-profile answer.
+    """
+    outcomes = {}
+    batch = {}
+    for user_id in user_ids:
+        gathered = _gather(user_id, storage)
+        if not gathered:
+            outcomes[user_id] = False
+        elif len(json.dumps(gathered[0])) > PROFILE_LIMITS["compress_threshold"]:
+            outcomes[user_id] = await _learn(user_id, llm, storage)
+        else:
+            batch[user_id] = gathered
+
+    if len(batch) == 1:
+        user_id = next(iter(batch))
+        outcomes[user_id] = await _learn(user_id, llm, storage)
+        return outcomes
+    if not batch:
+        return outcomes
+
+    logger.debug(f"🧠 BATCH LEARNING: {len(batch)} users in one request")
+
+    messages = [{"role": "user", "content": batch_prompt(batch)}]
+    result = await llm.generate(messages)
+    updates = {}
+    if result.success:
+        try:
+            updates = _clean_json(result.unwrap() or "{}")
+        except json.JSONDecodeError:
+            logger.debug(f"🚨 BATCH JSON ERROR: {result.unwrap()[:100]}...")
+    else:
+        logger.debug(f"🚨 GENERATE ERROR: {result.error}")
+
+    for user_id, (current, message_texts) in batch.items():
+        updated = updates.get(user_id) if isinstance(updates, dict) else None
+        if not isinstance(updated, dict):
+            updated = None
+        outcomes[user_id] = _apply(user_id, current, updated, len(message_texts), storage)
+    return outcomes
 
-async def _learn(user_id: str, llm) -> bool:
-    """Internal async learning implementation."""
 
-    current = get(user_id) or {
+def _gather(user_id: str, storage=None) -> tuple[dict, list[str]] | None:
+    """Current profile plus the unlearned user messages to learn from."""
+    current = get(user_id, storage) or {
         "who": "",
         "style": "",
         "focus": "",
@@ -152,48 +220,36 @@ async def _learn(user_id: str, llm) -> bool:
     }
     last_learned = current.get("_meta", {}).get("last_learned_at", 0)
 
-    # Get unlearned messages
-    import sqlite3
-    import time
-
-    from ..lib.storage import get_db_path
-
-    db_path = get_db_path()
-    if not db_path.exists():
-        return False
+    # Get ONLY user messages for profile learning
+    window = PROFILE_LIMITS["learning_window"]
+    if storage:
+        messages = storage.load_user_messages(user_id, last_learned, window)
+    else:
+        from ..lib.storage import get_db_path, load_user_messages
 
-    with sqlite3.connect(db_path) as db:
-        # Get ONLY user messages for profile learning
-        messages = db.execute(
-            """
-                SELECT content, timestamp FROM conversations
-                WHERE user_id = ? AND type = 'user' AND timestamp > ?
-                ORDER BY timestamp ASC
-                LIMIT ?
-            """,
-            (user_id, last_learned, PROFILE_LIMITS["learning_window"]),
-        ).fetchall()
+        if not get_db_path().exists():
+            return None
+        messages = load_user_messages(user_id, last_learned, window)
 
     if not messages:
-        return False
+        return None
 
-    # Create learning prompt from message batch
-    message_texts = [msg[0] for msg in messages]
+    return current, messages
 
-    logger.debug(f"🧠 LEARNING: {len(messages)} new messages for {user_id}")
 
-    # Check if compression needed
-    current_chars = len(json.dumps(current))
-    compress = current_chars > PROFILE_LIMITS["compress_threshold"]
-    updated = await _process_profile(current, message_texts, llm, compress=compress)
+def _apply(user_id: str, current: dict, updated: dict | None, processed: int, storage=None) -> bool:
+    """Persist a learned profile with embedded metadata."""
+    import time
 
     if updated and updated != current:
         # Embed metadata in profile
         updated["_meta"] = {
             "last_learned_at": time.time(),
-            "messages_processed": len(messages),
+            "messages_processed": processed,
         }
-        success = save_profile(user_id, updated)
+        success = (
+            storage.save_profile(user_id, updated) if storage else save_profile(user_id, updated)
+        )
 
         final_chars = len(json.dumps(updated))
         logger.debug(f"💾 DELTA SAVE: {'✅' if success else '❌'} {final_chars} chars")
@@ -6,6 +6,8 @@ Usage:
   async for event in agent.stream(query):  # Raw event stream
 """
 
+from functools import partial
+
 from ..context import context
 from ..lib.logger import logger
 from ..lib.storage import SQLite
@@ -28,6 +30,9 @@ class Agent:
         max_iterations: int = 3,
         profile: bool = True,
         sandbox: bool = True,
+        parallel: bool = False,
+        cache: bool = False,
+        security: tuple[str, ...] | None = None,
     ):
         # LLM setup
         self.llm = self._create_llm(llm)
@@ -49,6 +54,9 @@ class Agent:
         self.max_iterations = max_iterations
         self.profile = profile
         self.sandbox = sandbox
+        self.parallel = parallel
+        self.cache = cache
+        self.security = None if security is None else tuple(security)
 
         # Logger configured globally - no parameter needed
 
@@ -90,6 +98,9 @@ class Agent:
             max_iterations=self.max_iterations,
             sandbox=self.sandbox,
             profile=self.profile,
+            parallel=self.parallel,
+            cache=self.cache,
+            security=self.security,
         )
 
     def _conversation_id(self, user_id: str, conversation_id: str | None) -> str:
@@ -115,7 +126,7 @@ class Agent:
                 user_id,
                 conversation_id,
                 on_complete=context.record,
-                on_learn=context.learn,
+                on_learn=partial(context.learn, storage=config.storage),
             ):
                 if event["type"] == Event.RESPOND:
                     respond_events.append(event["content"])
@@ -144,7 +155,7 @@ class Agent:
                 user_id,
                 conversation_id,
                 on_complete=context.record,
-                on_learn=context.learn,
+                on_learn=partial(context.learn, storage=config.storage),
             ):
                 yield event
         except Exception as e:
@@ -1,5 +1,6 @@
 """Agent execution configuration."""
 
+import inspect
 from dataclasses import dataclass
 
 from .protocols import LLM, Storage, Tool
@@ -26,3 +27,21 @@ class Config:
     mode: str = "auto"
     profile: bool = True
     sandbox: bool = True
+    parallel: bool = False  # Fan out side-effect free calls in one CALLS batch
+    cache: bool = False  # Reuse results of repeated idempotent tool calls
+    security: tuple[str, ...] | None = None  # Input patterns tools refuse - None: defaults
+
+    def __post_init__(self):
+        # Storage is called inline - an async backend's coroutines would never be awaited
+        methods = [name for name in vars(Storage) if not name.startswith("_")]
+        coroutines = [
+            name
+            for name in methods
+            if inspect.iscoroutinefunction(getattr(self.storage, name, None))
+        ]
+        if coroutines:
+            raise TypeError(
+                f"Storage must be synchronous - {type(self.storage).__name__} defines async "
+                f"{', '.join(coroutines)}. Wrap it with sync methods (e.g. run the coroutine "
+                "on its own loop or thread)."
+            )
@@ -1,26 +1,126 @@
-"""Tool execution - pure tool running logic."""
+"""Tool execution - pure tool running logic.
 
+Progress: stream_tools() yields result_started / result_chunk / result_done per call
+(carrying the call index) as work happens, then the aggregate RESULTS event. Tools that
+produce output over time opt into chunks by declaring an on_chunk parameter.
+
+CPU-bound work inside a tool goes through offload(): a shared process pool with warm
+workers and a bounded number of calls in flight, so parsing and extraction run on other
+cores while the event loop keeps streaming tokens.
+"""
+
+import asyncio
+import inspect
 import json
+import multiprocessing
+import threading
 import time
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import suppress
+from importlib import import_module
 
 from .protocols import Event
 from .result import Err, Ok, Result
 
 
-async def execute_tools(calls: list, config, user_id: str = None) -> list[str]:
-    """Execute tool call array sequentially - returns individual results."""
-    results = []
-    for call in calls:
-        result = await _execute(call, config, user_id)
-        if result.failure:
-            # Store error as result instead of raising - errors go in "result" field
-            results.append(result.error)
-        else:
-            results.append(result.unwrap())
+async def execute_tools(
+    calls: list, config, user_id: str = None, emit=None, conversation_id: str = None
+) -> list[str]:
+    """Execute tool call array - returns individual results in call order.
+
+    Sequential by default. With config.parallel, each run of consecutive
+    side-effect free calls fans out concurrently; other calls run alone, in order.
+    emit, when given, receives each call's progress events - from any thread.
+    """
+    context = {"user_id": user_id, "conversation_id": conversation_id}
+    if getattr(config, "parallel", False) is not True:
+        return [await _run(i, call, config, context, emit) for i, call in enumerate(calls)]
 
+    results = []
+    branch = []
+    for i, call in enumerate(calls):
+        if _parallel(call, config):
+            branch.append((i, call))
+            continue
+        results.extend(await _fan_out(branch, config, context, emit))
+        branch = []
+        results.append(await _run(i, call, config, context, emit))
+    results.extend(await _fan_out(branch, config, context, emit))
     return results
 
 
+def _text(result: Result[str]) -> str:
+    # Store error as result instead of raising - errors go in "result" field
+    return result.error if result.failure else result.unwrap()
+
+
+def _progress(emit, kind: str, index: int, **fields) -> None:
+    if emit:
+        emit({"type": kind, "index": index, **fields, "timestamp": time.time()})
+
+
+def _chunks(emit, index: int):
+    """on_chunk callback for one call - None when nobody is listening."""
+    if not emit:
+        return None
+    return lambda text: _progress(emit, Event.RESULT_CHUNK, index, content=text)
+
+
+def _finish(emit, index: int, result: Result[str]) -> str:
+    text = _text(result)
+    _progress(emit, Event.RESULT_DONE, index, content=text, success=result.success)
+    return text
+
+
+async def _run(index: int, call, config, context: dict, emit=None) -> str:
+    """One call in the calling task - wrapped in its progress events."""
+    _progress(emit, Event.RESULT_STARTED, index, name=_name(call))
+    result = await _execute(call, config, **context, on_chunk=_chunks(emit, index))
+    return _finish(emit, index, result)
+
+
+def _name(call) -> str | None:
+    return call.get("name") if isinstance(call, dict) else None
+
+
+def _parallel(call, config) -> bool:
+    if not isinstance(call, dict):
+        return False
+    tool = next((t for t in config.tools if t.name == call.get("name")), None)
+    return bool(tool) and tool.parallel is True
+
+
+async def _fan_out(branch: list, config, context: dict, emit=None) -> list[str]:
+    """Run independent (index, call) pairs concurrently - bounded, each under its own time budget.
+
+    Tools keep their blocking work off the loop (worker threads, subprocesses), so branches
+    are plain coroutines: a branch over budget is cancelled and reported as failed, and
+    cancelling the turn cancels every branch still running.
+    """
+    if len(branch) < 2:
+        return [await _run(i, call, config, context, emit) for i, call in branch]
+
+    from ..tools.constants import PARALLEL_TOOL_LIMIT, PARALLEL_TOOL_TIMEOUT
+
+    slots = asyncio.Semaphore(PARALLEL_TOOL_LIMIT)
+
+    async def run(index: int, call: dict) -> str:
+        async with slots:
+            _progress(emit, Event.RESULT_STARTED, index, name=_name(call))
+            try:
+                result = await asyncio.wait_for(
+                    _execute(call, config, **context, on_chunk=_chunks(emit, index)),
+                    PARALLEL_TOOL_TIMEOUT,
+                )
+            except asyncio.TimeoutError:
+                result = Err(f"Tool {call['name']} timed out after {PARALLEL_TOOL_TIMEOUT}s")
+            return _finish(emit, index, result)
+
+    return await asyncio.gather(*(run(i, call) for i, call in branch))
+
+
 def create_results_event(individual_results: list) -> dict:
     """Create results event dict."""
     return {
@@ -33,10 +133,51 @@ def create_results_event(individual_results: list) -> dict:
 
 async def execute_tools_and_save(calls, config, user_id, conversation_id):
     """Core tool execution + event creation + DB save - shared across resume/replay."""
+    results_event = None
+    async for event in stream_tools(calls, config, user_id, conversation_id):
+        results_event = event
+    return results_event["results"], results_event
+
+
+async def stream_tools(calls, config, user_id, conversation_id):
+    """Execute calls, yielding each call's progress as it happens, then the RESULTS event.
+
+    Each finished result is saved the moment it completes (a RESULT_DONE checkpoint, so
+    a turn cut short keeps what already ran); the aggregate RESULTS row follows once all
+    are in, as before - it is what history and direct readers of the store use, and the
+    checkpoints only stand in for it when it was never written.
+    """
     from ..lib.resilience import resilient_save
 
-    # Execute tools
-    individual_results = await execute_tools(calls, config, user_id)
+    loop = asyncio.get_running_loop()
+    queue = asyncio.Queue()
+
+    def emit(event: dict) -> None:
+        loop.call_soon_threadsafe(queue.put_nowait, event)
+
+    task = asyncio.create_task(
+        execute_tools(calls, config, user_id, emit=emit, conversation_id=conversation_id)
+    )
+    try:
+        while True:
+            waiter = asyncio.ensure_future(queue.get())
+            await asyncio.wait({waiter, task}, return_when=asyncio.FIRST_COMPLETED)
+            if not waiter.done():
+                waiter.cancel()
+                break
+            event = waiter.result()
+            _save_progress(event, conversation_id, user_id, config, resilient_save)
+            yield event
+
+        # Events emitted before the last call returned are already queued
+        while not queue.empty():
+            event = queue.get_nowait()
+            _save_progress(event, conversation_id, user_id, config, resilient_save)
+            yield event
+        individual_results = task.result()
+    finally:
+        if not task.done():
+            task.cancel()
 
     # Create and save results event
     results_event = create_results_event(individual_results)
@@ -46,12 +187,21 @@ async def execute_tools_and_save(calls, config, user_id, conversation_id):
         Event.RESULTS,
         results_event["content"],
         results_event["timestamp"],
+        config.storage,
     )
+    yield results_event
 
-    return individual_results, results_event
 
+def _save_progress(event: dict, conversation_id, user_id, config, save) -> None:
+    if event["type"] != Event.RESULT_DONE:
+        return
+    content = json.dumps({"index": event["index"], "result": event["content"]})
+    save(conversation_id, user_id, Event.RESULT_DONE, content, event["timestamp"], config.storage)
 
-async def _execute(call: dict, config, user_id: str = None) -> Result[str]:
+
+async def _execute(
+    call: dict, config, user_id: str = None, on_chunk=None, conversation_id: str = None
+) -> Result[str]:
     """Execute single JSON call - pure function."""
     if not isinstance(call, dict):
         return Err("Call must be JSON object")
@@ -68,6 +218,7 @@ async def _execute(call: dict, config, user_id: str = None) -> Result[str]:
     args = call.get("args", {})
     if not isinstance(args, dict):
         return Err("Tool 'args' must be JSON object")
+    args = {**args}  # Injected context stays out of the call as recorded (CALLS event)
 
     try:
         # Global context injection - all tools get access to agent context
@@ -75,14 +226,130 @@ async def _execute(call: dict, config, user_id: str = None) -> Result[str]:
             args["sandbox"] = config.sandbox
         if user_id:
             args["user_id"] = user_id
+        params = inspect.signature(tool.execute).parameters
+        # Storage-backed tools (recall) opt in by declaring a storage parameter
+        if "storage" in params:
+            args["storage"] = getattr(config, "storage", None)
+        # Input-checking tools (write, edit, scrape) opt into the agent's security policy
+        if "security" in params:
+            args["security"] = getattr(config, "security", None)
+        # Per-conversation state (the shell worker) keys on the conversation
+        if conversation_id and "conversation_id" in params:
+            args["conversation_id"] = conversation_id
+
+        cached, store = _cached(tool, args, config)
+        if cached is not None:
+            return Ok(cached)
+
+        # Tools with output over time (shell) opt into progress chunks the same way
+        if on_chunk and "on_chunk" in params:
+            args["on_chunk"] = on_chunk
 
         result = await tool.execute(**args)
 
         if result.success:
             tool_result = result.unwrap()
             # Convert ToolResult to string for agent consumption
-            return Ok(tool_result.for_agent())
+            text = tool_result.for_agent()
+            store(text)
+            return Ok(text)
         return Err(f"Tool {tool_name} failed: {result.error}")
 
     except Exception as e:
         return Err(f"Tool {tool_name} execution failed: {str(e)}")
+
+
+def _cached(tool, args: dict, config) -> tuple:
+    """Result cache lookup (Config.cache) - (hit or None, store for a fresh result).
+
+    Calls without a policy to tools that are not side-effect free invalidate the cache.
+    """
+    if getattr(config, "cache", False) is not True:
+        return None, _skip
+
+    from ..tools.cache import results
+
+    policy = tool.cache_policy(args)
+    if not policy:
+        if tool.parallel is not True:
+            results.invalidate()
+        return None, _skip
+
+    key = results.key(tool.name, args)
+    if key is None:
+        return None, _skip
+    return results.get(key, policy), lambda text: results.put(key, policy, text)
+
+
+def _skip(text: str) -> None:
+    pass
+
+
+_pool = None
+_pool_lock = threading.Lock()
+_slots = weakref.WeakKeyDictionary()  # Event loop -> its in-flight slots
+
+
+def _warm(modules: tuple) -> None:
+    """Worker initializer - heavy imports happen once per process, not on the first call."""
+    for name in modules:
+        with suppress(Exception):
+            import_module(name)
+
+
+def _executor():
+    """Shared process pool - None when disabled."""
+    global _pool
+    from ..tools.constants import CPU_POOL_WARM, CPU_POOL_WORKERS
+
+    if CPU_POOL_WORKERS < 1:
+        return None
+    with _pool_lock:
+        if _pool is None:
+            # spawn: workers never inherit the parent's threads or held locks
+            _pool = ProcessPoolExecutor(
+                CPU_POOL_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_warm,
+                initargs=(CPU_POOL_WARM,),
+            )
+            for _ in range(CPU_POOL_WORKERS):
+                _pool.submit(int)  # Start every worker now, so the first real call finds it warm
+        return _pool
+
+
+def _queue() -> asyncio.Semaphore:
+    """This loop's in-flight slots - an asyncio semaphore, so a cancelled waiter holds none."""
+    from ..tools.constants import CPU_POOL_QUEUE
+
+    loop = asyncio.get_running_loop()
+    slots = _slots.get(loop)
+    if slots is None:
+        slots = _slots[loop] = asyncio.Semaphore(CPU_POOL_QUEUE)
+    return slots
+
+
+def _reset(pool) -> None:
+    global _pool
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+async def offload(fn, *args):
+    """Run CPU-bound fn(*args) in the shared process pool and await the result.
+
+    fn must be a module-level function and args picklable - plain strings, bytes, dicts.
+    Runs in a worker thread instead when the pool is disabled or a worker died.
+    """
+    pool = _executor()
+    if pool is None:
+        return await asyncio.to_thread(fn, *args)
+
+    async with _queue():  # Queue full - wait here, on the loop
+        try:
+            return await asyncio.get_running_loop().run_in_executor(pool, fn, *args)
+        except BrokenProcessPool:
+            _reset(pool)
+            return await asyncio.to_thread(fn, *args)
@@ -100,6 +100,8 @@ async def parse_stream(
         if error:
             yield {"type": "error", "content": error}
             return
+        if not isinstance(token, str):
+            continue  # Out-of-band items (e.g. provider usage) carry no text
 
         buffer += token
 
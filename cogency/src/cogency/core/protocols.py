@@ -38,6 +38,11 @@ class Event(str, Enum):
     RESPOND = "respond"
     USER = "user"
     YIELD = "yield"  # Control signal - not persisted, just execution handover
+    # Per-call tool progress - stream events, not delimiters; RESULT_DONE rows are also
+    # stored as checkpoints so a turn cut short keeps the results that finished
+    RESULT_STARTED = "result_started"
+    RESULT_CHUNK = "result_chunk"
+    RESULT_DONE = "result_done"
 
     @property
     def delimiter(self) -> str:
@@ -75,28 +80,59 @@ class LLM(Protocol):
 
 @runtime_checkable
 class Storage(Protocol):
-    """Storage protocol for conversation messages and user profiles."""
+    """Storage protocol for conversation messages and user profiles.
 
-    async def save_message(
+    Synchronous - context assembly, persistence callbacks and profile learning all
+    call it inline, from the event loop or a worker thread. Config refuses a storage
+    with async methods rather than drop their unawaited writes.
+    """
+
+    def save_message(
         self, conversation_id: str, user_id: str, type: str, content: str, timestamp: float = None
     ) -> bool:
         """Save single message to conversation."""
         ...
 
-    async def load_messages(
-        self, conversation_id: str, include: list[str] = None, exclude: list[str] = None
+    def load_messages(
+        self,
+        conversation_id: str,
+        include: list[str] = None,
+        exclude: list[str] = None,
+        limit: int = None,
     ) -> list[dict]:
-        """Load conversation messages with optional type filtering."""
+        """Load conversation messages in order - newest `limit` only if given."""
+        ...
+
+    def count_user_messages(self, user_id: str, since: float = 0) -> int:
+        """Count a user's turns newer than a timestamp."""
+        ...
+
+    def load_user_messages(self, user_id: str, since: float = 0, limit: int = -1) -> list[str]:
+        """Load a user's turns newer than a timestamp, oldest first."""
+        ...
+
+    def search_user_messages(
+        self, user_id: str, query: str, limit: int = 3, exclude_conversation: str = None
+    ) -> list[tuple[str, float, str]]:
+        """Keyword search over a user's turns - (content, timestamp, conversation_id)."""
         ...
 
-    async def save_profile(self, user_id: str, profile: dict) -> bool:
+    def save_usage(self, conversation_id: str, user_id: str, records: list[dict]) -> bool:
+        """Append a turn's LLM request records (see lib.tokens.Meter)."""
+        ...
+
+    def save_profile(self, user_id: str, profile: dict) -> bool:
         """Save user profile (with embedded metadata)."""
         ...
 
-    async def load_profile(self, user_id: str) -> dict:
+    def load_profile(self, user_id: str) -> dict:
         """Load latest user profile."""
         ...
 
+    def profile_version(self, user_id: str) -> int:
+        """Latest profile version (0 if none)."""
+        ...
+
 
 class Tool(ABC):
     """Tool interface with agent assistance capabilities."""
@@ -119,6 +155,18 @@ class Tool(ABC):
     def examples(self) -> list[dict]:
         return []
 
+    @property
+    def parallel(self) -> bool:
+        """Side-effect free - may run concurrently with other calls (Config.parallel)."""
+        return False
+
+    def cache_policy(self, args: dict) -> dict | None:
+        """How a result for these args may be reused (Config.cache) - None: never.
+
+        {"state": fingerprint compared on every hit, "ttl": seconds or None}
+        """
+        return None
+
     @abstractmethod
     async def execute(self, **kwargs) -> Result[ToolResult]:
         pass
@@ -14,31 +14,29 @@ Features:
 import json
 
 from ..context import context
+from ..lib.llms.adapters import TOOL
 from ..lib.logger import logger
 from .parser import parse_stream
 from .protocols import Event
 
 
 async def _handle_execute_yield_replay(calls, config, user_id, conversation_id, messages):
-    """Execute tools and add results to message context for next HTTP iteration."""
-    from .execute import execute_tools_and_save
-
-    individual_results, results_event = await execute_tools_and_save(
-        calls, config, user_id, conversation_id
-    )
-
-    # Add results to message context for next iteration
-    messages.append(
-        {
-            "role": "system",
-            "content": json.dumps(individual_results),
-        }
-    )
-
-    return individual_results, results_event
-
-
-async def stream(config, query: str, user_id: str, conversation_id: str):
+    """Execute tools - yield progress as it happens, add results to context for next HTTP iteration."""
+    from .execute import stream_tools
+
+    async for event in stream_tools(calls, config, user_id, conversation_id):
+        if event["type"] == Event.RESULTS:
+            # Add results to message context for next iteration
+            messages.append(
+                {
+                    "role": TOOL,
+                    "content": json.dumps(event["results"]),
+                }
+            )
+        yield event
+
+
+async def stream(config, query: str, user_id: str, conversation_id: str, meter=None):
     """Stateless HTTP iterations with context rebuild per request."""
     if config.llm is None:
         raise ValueError("LLM provider required")
@@ -63,9 +61,13 @@ async def stream(config, query: str, user_id: str, conversation_id: str):
             # Parse LLM stream with immediate persistence
             from ..lib.persist import create_event_persister
 
-            persist_event = create_event_persister(conversation_id, user_id)
+            persist_event = create_event_persister(conversation_id, user_id, config.storage)
+
+            tokens = config.llm.stream(messages)
+            if meter:
+                tokens = meter.wrap(messages, tokens)
 
-            async for event in parse_stream(config.llm.stream(messages), on_complete=persist_event):
+            async for event in parse_stream(tokens, on_complete=persist_event):
                 logger.debug(f"Event: {event['type']} - {event.get('content', '')[:100]}...")
 
                 match event["type"]:
@@ -86,10 +88,10 @@ async def stream(config, query: str, user_id: str, conversation_id: str):
 
                         if yield_context == "execute" and calls:
                             # Execute tools, add to context for next request
-                            individual_results, results_event = await _handle_execute_yield_replay(
+                            async for tool_event in _handle_execute_yield_replay(
                                 calls, config, user_id, conversation_id, messages
-                            )
-                            yield results_event
+                            ):
+                                yield tool_event
 
                             # Start new iteration cycle
                             break
@@ -12,35 +12,47 @@ Features:
 - LLM maintains conversation state
 - Requires WebSocket support (GPT-4o Realtime, Gemini Live)
 - Maximum token efficiency
+- Pooled sessions: pre-warmed handshakes, one live session per conversation across turns
+- Deltas only: new queries and tool results are sent into the session, never the context
+- Recovery: a dropped session reconnects with the transcript it held and continues the turn
 """
 
 import json
+from contextlib import aclosing
 
 from ..context import context
 from ..lib.logger import logger
+from ..lib.rotation import key_index
+from ..lib.sessions import sessions
+from ..lib.tokens import Usage
 from .parser import parse_stream
 from .protocols import Event
 
 
 async def _handle_execute_yield(calls, config, user_id, session, conversation_id):
-    """Execute tools and inject results into same WebSocket session."""
-    from .execute import execute_tools_and_save
+    """Execute tools - yield progress as it happens, inject results into same WebSocket session."""
+    from .execute import stream_tools
 
-    individual_results, results_event = await execute_tools_and_save(
-        calls, config, user_id, conversation_id
-    )
+    async for event in stream_tools(calls, config, user_id, conversation_id):
+        if event["type"] == Event.RESULTS:
+            # Inject results into same WebSocket session
+            results_text = json.dumps(event["results"])
+            success = await config.llm.send(session, results_text)
+            if not success:
+                raise RuntimeError("Failed to send results to WebSocket")
+            sessions.record(session, "user", results_text)
+            logger.debug("Tools executed, WebSocket continues")
+        yield event
 
-    # Inject results into same WebSocket session
-    results_text = json.dumps(individual_results)
-    success = await config.llm.send(session, results_text)
-    if not success:
-        raise RuntimeError("Failed to send results to WebSocket")
 
-    logger.debug("Tools executed, WebSocket continues")
-    return results_event
+async def _stamped(tokens, key: int | None):
+    """A response's tokens, led by the key that serves the session (for the meter)."""
+    yield Usage(key=key)
+    async for token in tokens:
+        yield token
 
 
-async def stream(config, query: str, user_id: str, conversation_id: str):
+async def stream(config, query: str, user_id: str, conversation_id: str, meter=None):
     """WebSocket streaming with tool injection and session continuity."""
     if config.llm is None:
         raise ValueError("LLM provider required")
@@ -50,35 +62,85 @@ async def stream(config, query: str, user_id: str, conversation_id: str):
         # Import here to avoid circular dependency
         from .replay import stream as replay_stream
 
-        async for event in replay_stream(config, query, user_id, conversation_id):
+        async for event in replay_stream(config, query, user_id, conversation_id, meter):
             yield event
         return
 
     session = None
+    complete = False
+    tokens = None
     try:
-        # Assemble initial context
-        messages = context.assemble(query, user_id, conversation_id, config.tools, config)
+        # A completed previous turn leaves its session live - only the new query is sent
+        session = await sessions.resume(config.llm, conversation_id)
+        if session and await config.llm.send(session, query):
+            messages = [{"role": "user", "content": query}]
+            sessions.record(session, "user", query)
+        else:
+            if session:
+                await sessions.discard(config.llm, session)
+
+            # Assemble initial context
+            messages = context.assemble(query, user_id, conversation_id, config.tools, config)
 
-        # Establish persistent WebSocket session
-        session = await config.llm.connect(messages)
-        if not session:
-            raise RuntimeError("Failed to establish WebSocket connection")
+            # Establish persistent WebSocket session - a pre-warmed one when available
+            session = await sessions.open(config.llm, messages)
+            if not session:
+                raise RuntimeError("Failed to establish WebSocket connection")
 
         calls = None
-        complete = False
 
         # Parse streaming tokens with immediate persistence
         from ..lib.persist import create_event_persister
 
-        persist_event = create_event_persister(conversation_id, user_id)
+        persist_event = create_event_persister(conversation_id, user_id, config.storage)
+
+        pending = False  # Tool results sent, their response not yet received
+        reconnects = 0
+        model = getattr(config.llm, "stream_model", None)
+        key = key_index(config.llm)
 
         # Continuous token stream from WebSocket
         async def continuous_token_stream():
-            """Token stream from WebSocket to parser."""
-            async for token in config.llm.receive(session):
-                yield token
-
-        async for event in parse_stream(continuous_token_stream(), on_complete=persist_event):
+            """Token stream from WebSocket to parser - across tool responses and reconnects.
+
+            Each response is metered as its own request, on the session's model, with what
+            was sent to produce it as the prompt.
+            """
+            nonlocal session, pending, reconnects
+            sent = messages
+            while True:
+                ended = False
+                response = config.llm.receive(session)
+                if meter:
+                    response = meter.wrap(sent, _stamped(response, key), model=model)
+                async with aclosing(response):
+                    async for token in response:
+                        if token == Event.YIELD.delimiter:
+                            ended = True
+                        else:
+                            sessions.record(session, "assistant", token)
+                        yield token
+
+                if ended:
+                    # receive() stops at each response - results sent meanwhile get another
+                    if not pending:
+                        return
+                    pending = False
+                    sent = sessions.held(session)[-1:]  # The tool results just sent
+                    continue
+
+                # Dropped mid-response - reconnect with what the session held, not the context
+                if reconnects >= sessions.reconnects:
+                    return
+                reconnects += 1
+                session = await sessions.reconnect(config.llm, session)
+                if not session:
+                    return
+                sent = sessions.held(session)  # Loaded into the new session
+
+        tokens = continuous_token_stream()
+
+        async for event in parse_stream(tokens, on_complete=persist_event):
             match event["type"]:
                 case Event.CALLS:
                     calls = event["calls"]
@@ -93,10 +155,11 @@ async def stream(config, query: str, user_id: str, conversation_id: str):
 
                     if yield_context == "execute" and calls:
                         # Execute tools and continue same session
-                        results_event = await _handle_execute_yield(
+                        async for tool_event in _handle_execute_yield(
                             calls, config, user_id, session, conversation_id
-                        )
-                        yield results_event
+                        ):
+                            yield tool_event
+                        pending = True
                         calls = None
 
                     elif yield_context == "complete":
@@ -118,18 +181,23 @@ async def stream(config, query: str, user_id: str, conversation_id: str):
         if not complete:
             logger.debug("Incomplete, falling back to replay mode")
             if session:
-                await config.llm.close(session)
+                await sessions.discard(config.llm, session)
+            session = None
 
             from .replay import stream as replay_stream
 
-            async for event in replay_stream(config, query, user_id, conversation_id):
+            async for event in replay_stream(config, query, user_id, conversation_id, meter):
                 yield event
 
     except Exception as e:
         logger.debug(f"Exception occurred: {str(e)}")
         raise RuntimeError(f"WebSocket error: {str(e)}") from e
     finally:
-        # Session cleanup after successful completion
+        # Ends the response still being received, so the meter records it this turn
+        if tokens is not None:
+            await tokens.aclose()
+        # Completed sessions stay live for the conversation's next turn; failed ones close
         if session and complete:
-            logger.debug("Closing session after completion")
-            await config.llm.close(session)
+            await sessions.release(config.llm, conversation_id, session)
+        elif session:
+            await sessions.discard(config.llm, session)
@@ -21,7 +21,14 @@ async def stream(
     if on_complete:
         from ..lib.resilience import resilient_save
 
-        resilient_save(conversation_id, user_id, Event.USER, query, user_event["timestamp"])
+        resilient_save(
+            conversation_id, user_id, Event.USER, query, user_event["timestamp"], config.storage
+        )
+
+    # Token accounting for the turn - a final "metrics" event plus usage ledger rows
+    from ..lib.tokens import Meter
+
+    meter = Meter.init(config.llm)
 
     try:
         # Transport selection: WebSocket streaming → HTTP fallback → error
@@ -38,7 +45,7 @@ async def stream(
             mode_func = replay.stream
 
         # Execute with immediate DB writes handled by parser
-        async for event in mode_func(config, query, user_id, conversation_id):
+        async for event in mode_func(config, query, user_id, conversation_id, meter=meter):
             # Always yield for API consumers
             yield event
 
@@ -46,7 +53,17 @@ async def stream(
             if event["type"] == Event.RESULTS:
                 events.append(event)
 
+        if meter:
+            yield meter.event()
+
     finally:
+        # Usage ledger - one batch per turn, including failed turns; its own transaction
+        # because events were already committed as they streamed (see persist_usage)
+        if meter:
+            from ..lib.persist import persist_usage
+
+            persist_usage(conversation_id, user_id, meter.records, config.storage)
+
         # Final callback for remaining coordination
         if on_complete:
             on_complete(conversation_id, user_id, events)
@@ -0,0 +1,53 @@
+"""Bounded in-process caches."""
+
+import threading
+from collections import OrderedDict
+
+
+class LRU:
+    """Bounded mapping with least-recently-used eviction - safe across threads."""
+
+    def __init__(self, maxsize: int = 256):
+        if maxsize < 1:
+            raise ValueError("maxsize must be >= 1")
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        """Get value and mark it most recently used."""
+        with self._lock:
+            if key not in self._data:
+                return default
+            self._data.move_to_end(key)
+            return self._data[key]
+
+    def put(self, key, value) -> list:
+        """Insert or refresh value - returns evicted (key, value) pairs."""
+        evicted = []
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                evicted.append(self._data.popitem(last=False))
+        return evicted
+
+    def pop(self, key, default=None):
+        """Remove and return value."""
+        with self._lock:
+            return self._data.pop(key, default)
+
+    def items(self) -> list:
+        """Snapshot of (key, value) pairs, least recently used first."""
+        with self._lock:
+            return list(self._data.items())
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __contains__(self, key) -> bool:
+        return key in self._data
+
+    def __len__(self) -> int:
+        return len(self._data)
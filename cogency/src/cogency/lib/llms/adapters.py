@@ -0,0 +1,131 @@
+"""Provider payload adapters - neutral messages to native request structures.
+
+Messages stay plain {"role", "content"} dicts everywhere else:
+- Roles: system, user, assistant, tool (tool results fed back to the model)
+- OpenAI: chat messages, tool results as user turns
+- Anthropic: leading system text as system= (cache-marked), text blocks, alternating turns
+- Gemini: system_instruction plus Content dicts with text parts, alternating user/model turns
+- Incremental: a payload converts only messages appended since its last build, so
+  replay iterations that append results to the same list reuse every earlier conversion
+"""
+
+from ..cache import LRU
+
+TOOL = "tool"  # Role of tool results fed back to the model
+
+PAYLOAD_LIMITS = {
+    "cached": 64,  # Message lists whose native conversion is kept
+}
+
+
+class Payload:
+    """Native payload for one message list, grown as the list grows."""
+
+    def __init__(self, adapter):
+        self.adapter = adapter
+        self.source: list[dict] = []  # Messages converted so far - held, so ids stay unique
+        self.system: list[str] = []
+        self.turns: list[dict] = []
+
+    def extend(self, messages: list[dict]) -> bool:
+        """Convert messages past the built prefix - False when the prefix changed."""
+        built = len(self.source)
+        if len(messages) < built or any(
+            a is not b for a, b in zip(self.source, messages, strict=False)
+        ):
+            return False
+        for message in messages[built:]:
+            if message.get("content"):
+                self.adapter.add(self, message)
+            self.source.append(message)
+        return True
+
+
+def _merge(turns: list[dict], role: str, key: str, part: dict) -> None:
+    """Append a part, folding consecutive same-role turns into one."""
+    if turns and turns[-1]["role"] == role:
+        turns[-1][key].append(part)
+    else:
+        turns.append({"role": role, key: [part]})
+
+
+class _OpenAI:
+    name = "openai"
+
+    def add(self, payload: Payload, message: dict) -> None:
+        role = "user" if message["role"] == TOOL else message["role"]
+        payload.turns.append({"role": role, "content": message["content"]})
+
+    def request(self, payload: Payload) -> dict:
+        return {"messages": payload.turns}
+
+
+class _Anthropic:
+    name = "anthropic"
+
+    def add(self, payload: Payload, message: dict) -> None:
+        if message["role"] == "system" and not payload.turns:
+            payload.system.append(message["content"])
+            return
+        role = "assistant" if message["role"] == "assistant" else "user"
+        _merge(payload.turns, role, "content", {"type": "text", "text": message["content"]})
+
+    def request(self, payload: Payload) -> dict:
+        if not payload.system:
+            return {"messages": payload.turns}
+        # Stable across a turn's iterations - marked for prompt caching
+        system = {
+            "type": "text",
+            "text": "\n\n".join(payload.system),
+            "cache_control": {"type": "ephemeral"},
+        }
+        return {"system": [system], "messages": payload.turns}
+
+
+class _Gemini:
+    name = "gemini"
+
+    def add(self, payload: Payload, message: dict) -> None:
+        if message["role"] == "system" and not payload.turns:
+            payload.system.append(message["content"])
+            return
+        role = "model" if message["role"] == "assistant" else "user"
+        _merge(payload.turns, role, "parts", {"text": message["content"]})
+
+    def request(self, payload: Payload) -> dict:
+        if not payload.system:
+            return {"contents": payload.turns}
+        return {
+            "contents": payload.turns,
+            "config": {"system_instruction": "\n\n".join(payload.system)},
+        }
+
+
+_openai, _anthropic, _gemini = _OpenAI(), _Anthropic(), _Gemini()
+_payloads = LRU(PAYLOAD_LIMITS["cached"])
+
+
+def _build(adapter, messages: list[dict]) -> dict:
+    """Request kwargs for messages, reusing the conversion of an earlier prefix."""
+    key = (adapter.name, id(messages))
+    payload = _payloads.get(key)
+    if payload is None or not payload.extend(messages):
+        payload = Payload(adapter)
+        payload.extend(messages)
+        _payloads.put(key, payload)
+    return adapter.request(payload)
+
+
+def openai(messages: list[dict]) -> dict:
+    """chat.completions kwargs: messages."""
+    return _build(_openai, messages)
+
+
+def anthropic(messages: list[dict]) -> dict:
+    """messages.create kwargs: messages, plus system when present."""
+    return _build(_anthropic, messages)
+
+
+def gemini(messages: list[dict]) -> dict:
+    """generate_content kwargs: contents, plus config with the system instruction."""
+    return _build(_gemini, messages)
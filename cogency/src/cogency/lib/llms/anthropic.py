@@ -8,6 +8,8 @@ for WebSocket when Anthropic adds support.
 from ...core.protocols import LLM, Event
 from ...core.result import Err, Ok, Result
 from ..rotation import rotate
+from ..tokens import Usage
+from . import adapters
 
 
 class Anthropic(LLM):
@@ -39,7 +41,7 @@ class Anthropic(LLM):
         try:
             response = await client.messages.create(
                 model=self.llm_model,
-                messages=messages,
+                **adapters.anthropic(messages),
                 max_tokens=self.max_tokens,
                 temperature=self.temperature,
             )
@@ -57,13 +59,22 @@ class Anthropic(LLM):
         try:
             async with client.messages.stream(
                 model=self.llm_model,
-                messages=messages,
+                **adapters.anthropic(messages),
                 max_tokens=self.max_tokens,
                 temperature=self.temperature,
             ) as stream:
                 async for text in stream.text_stream:
                     yield Ok(text)
 
+                usage = (await stream.get_final_message()).usage
+                yield Ok(
+                    Usage(
+                        usage.input_tokens,
+                        usage.output_tokens,
+                        cached=getattr(usage, "cache_read_input_tokens", None),
+                    )
+                )
+
                 # HTTP stream ended - inject YIELD to trigger tool execution
                 yield Ok(Event.YIELD.delimiter)
 
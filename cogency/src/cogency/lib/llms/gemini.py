@@ -3,6 +3,8 @@
 from ...core.protocols import LLM, Event
 from ...core.result import Err, Ok, Result
 from ..rotation import rotate
+from ..tokens import Usage
+from . import adapters
 
 
 class Gemini(LLM):
@@ -38,10 +40,8 @@ class Gemini(LLM):
         logger = logging.getLogger(__name__)
 
         try:
-            prompt = "\n".join([f"{msg['role']}: {msg['content']}" for msg in messages])
-
             response = await client.aio.models.generate_content(
-                model=self.llm_model, contents=prompt
+                model=self.llm_model, **adapters.gemini(messages)
             )
 
             response_text = response.text
@@ -59,7 +59,10 @@ class Gemini(LLM):
             return Err(f"Gemini Generate Error: {str(e)}")
 
     async def connect(self, messages: list[dict]):
-        """Create bidirectional Gemini Live WebSocket session with rotation support."""
+        """Create bidirectional Gemini Live WebSocket session with rotation support.
+
+        Empty messages open an idle session - see prime().
+        """
         from ..rotation import with_rotation
 
         async def _connect_with_key(api_key: str):
@@ -73,16 +76,16 @@ class Gemini(LLM):
 
                 client = self._create_client(api_key)
                 connection = client.aio.live.connect(model=self.stream_model, config=config)
-                session = await connection.__aenter__()
-
-                # Send initial conversation
-                content = "\n".join([f"{msg['role']}: {msg['content']}" for msg in messages])
-                await session.send_client_content(
-                    turns=types.Content(role="user", parts=[types.Part(text=content)]),
-                    turn_complete=True,
-                )
+                session = {
+                    "session": await connection.__aenter__(),
+                    "connection": connection,
+                    "types": types,
+                }
 
-                return {"session": session, "connection": connection, "types": types}
+                if messages and not await self.prime(session, messages):
+                    await self.close(session)
+                    raise RuntimeError("Failed to send initial conversation")
+                return session
 
             except Exception as e:
                 print(f"GEMINI WEBSOCKET FAILED: {e}")
@@ -96,6 +99,25 @@ class Gemini(LLM):
         except Exception:
             return None
 
+    async def prime(self, session, messages: list[dict]) -> bool:
+        """Load a conversation into a connected session - one turn per message, completes the turn."""
+        if not session:
+            return False
+
+        try:
+            types = session["types"]
+            turns = [
+                types.Content(
+                    role="model" if msg["role"] == "assistant" else "user",
+                    parts=[types.Part(text=msg["content"])],
+                )
+                for msg in messages
+            ]
+            await session["session"].send_client_content(turns=turns, turn_complete=True)
+            return True
+        except Exception:
+            return False
+
     async def send(self, session, content: str) -> bool:
         """Send content to Gemini Live session."""
         if not session:
@@ -158,18 +180,28 @@ class Gemini(LLM):
         logger = logging.getLogger(__name__)
 
         try:
-            prompt = "\n".join([f"{msg['role']}: {msg['content']}" for msg in messages])
-
             # GENUINE STREAMING: Await the coroutine first, then iterate
             stream = await client.aio.models.generate_content_stream(
-                model=self.llm_model, contents=prompt
+                model=self.llm_model, **adapters.gemini(messages)
             )
 
+            usage = None
             async for chunk in stream:
+                if chunk.usage_metadata:
+                    usage = chunk.usage_metadata  # Cumulative - the last one is the total
                 if chunk.text:
                     logger.debug(f"GEMINI HTTP STREAM CHUNK: {repr(chunk.text)}")
                     yield Ok(chunk.text)
 
+            if usage and usage.prompt_token_count is not None:
+                yield Ok(
+                    Usage(
+                        usage.prompt_token_count,
+                        usage.candidates_token_count or 0,
+                        cached=usage.cached_content_token_count,
+                    )
+                )
+
             # HTTP stream ended - inject YIELD to trigger tool execution (like WebSocket turn_complete)
             logger.debug("GEMINI HTTP STREAM COMPLETE - injecting YIELD delimiter")
             yield Ok(Event.YIELD.delimiter)
@@ -3,6 +3,20 @@
 from ...core.protocols import LLM, Event
 from ...core.result import Err, Ok, Result
 from ..rotation import rotate
+from ..tokens import Usage
+from . import adapters
+
+
+def _item(message: dict) -> dict:
+    """Realtime conversation item for one message - assistant turns are output text."""
+    role = message["role"]
+    return {
+        "type": "message",
+        "role": role,
+        "content": [
+            {"type": "text" if role == "assistant" else "input_text", "text": message["content"]}
+        ],
+    }
 
 
 class OpenAI(LLM):
@@ -41,7 +55,7 @@ class OpenAI(LLM):
         try:
             response = await client.chat.completions.create(
                 model=self.llm_model,
-                messages=messages,
+                **adapters.openai(messages),
                 max_completion_tokens=self.max_tokens,
                 temperature=self.temperature,
                 stream=False,
@@ -55,7 +69,10 @@ class OpenAI(LLM):
             return Err(f"OpenAI Generate Error: {str(e)}")
 
     async def connect(self, messages: list[dict]):
-        """Create bidirectional OpenAI Realtime session via SDK WebSocket."""
+        """Create bidirectional OpenAI Realtime session via SDK WebSocket.
+
+        Empty messages open a configured but idle session - see prime().
+        """
         try:
             import openai
 
@@ -68,40 +85,45 @@ class OpenAI(LLM):
                     "modalities": ["text"],
                     "temperature": self.temperature,
                     "max_response_output_tokens": 2000,
-                    "instructions": messages[0]["content"] if messages else "",
                 }
             )
 
-            # Send initial conversation
-            content = "\n".join([f"{msg['role']}: {msg['content']}" for msg in messages[1:]])
-            if content:
-                await connection.conversation.item.create(
-                    item={
-                        "type": "message",
-                        "role": "user",
-                        "content": [{"type": "input_text", "text": content}],
-                    }
-                )
-                await connection.response.create()
-
+            if messages and not await self.prime(connection, messages):
+                await self.close(connection)
+                return None
             return connection
 
         except Exception:
             return None
 
+    async def prime(self, session, messages: list[dict]) -> bool:
+        """Load a conversation into a connected session and request a response.
+
+        One item per message with its own role - the session holds real turns, so later
+        sends and reconnects can add to it message by message.
+        """
+        try:
+            system = bool(messages) and messages[0]["role"] == "system"
+            await session.session.update(
+                session={"instructions": messages[0]["content"] if system else ""}
+            )
+
+            turns = messages[1:] if system else messages
+            for message in turns:
+                await session.conversation.item.create(item=_item(message))
+            if turns:
+                await session.response.create()
+            return True
+        except Exception:
+            return False
+
     async def send(self, session, content: str) -> bool:
         """Send content to OpenAI Realtime session."""
         if not session:
             return False
 
         try:
-            await session.conversation.item.create(
-                item={
-                    "type": "message",
-                    "role": "user",
-                    "content": [{"type": "input_text", "text": content}],
-                }
-            )
+            await session.conversation.item.create(item=_item({"role": "user", "content": content}))
             await session.response.create()
             return True
         except Exception:
@@ -140,14 +162,25 @@ class OpenAI(LLM):
         try:
             response = await client.chat.completions.create(
                 model=self.llm_model,
-                messages=messages,
+                **adapters.openai(messages),
                 max_completion_tokens=self.max_tokens,
                 temperature=self.temperature,
                 stream=True,
+                stream_options={"include_usage": True},
             )
 
             async for chunk in response:
-                if chunk.choices[0].delta.content:
+                if chunk.usage:
+                    # Final chunk - no choices, just the request's usage
+                    details = chunk.usage.prompt_tokens_details
+                    yield Ok(
+                        Usage(
+                            chunk.usage.prompt_tokens,
+                            chunk.usage.completion_tokens,
+                            cached=details.cached_tokens if details else None,
+                        )
+                    )
+                if chunk.choices and chunk.choices[0].delta.content:
                     import logging
 
                     logger = logging.getLogger(__name__)
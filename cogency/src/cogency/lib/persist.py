@@ -3,10 +3,11 @@
 import json
 
 from ..core.protocols import Event
+from .logger import logger
 from .resilience import resilient_save
 
 
-def create_event_persister(conversation_id: str, user_id: str):
+def create_event_persister(conversation_id: str, user_id: str, storage=None):
     """Create immediate DB write callback for semantic events.
 
     Features:
@@ -23,15 +24,38 @@ def create_event_persister(conversation_id: str, user_id: str):
 
         # Map event types to storage types with resilience
         if event_type == Event.THINK:
-            resilient_save(conversation_id, user_id, Event.THINK, content, timestamp)
+            resilient_save(conversation_id, user_id, Event.THINK, content, timestamp, storage)
         elif event_type == Event.CALLS:
             # Serialize calls for storage
             calls_content = json.dumps(event["calls"])
-            resilient_save(conversation_id, user_id, Event.CALLS, calls_content, timestamp)
+            resilient_save(conversation_id, user_id, Event.CALLS, calls_content, timestamp, storage)
         elif event_type == Event.RESPOND:
-            resilient_save(conversation_id, user_id, Event.RESPOND, content, timestamp)
+            resilient_save(conversation_id, user_id, Event.RESPOND, content, timestamp, storage)
         else:
             # Unknown event type - skip persistence
             return
 
     return persist_event
+
+
+def persist_usage(conversation_id: str, user_id: str, records: list[dict], storage=None) -> bool:
+    """Write a turn's LLM request records in one batch - never raises.
+
+    Separate from the turn's events on purpose: events commit one by one as the parser
+    emits them (a cancelled or crashed turn keeps what was said, and resume reloads it
+    mid-turn), so there is no turn-wide transaction to join. Usage is only known once
+    the last request returns, so stream() writes it once, from finally, failed turns
+    included. Sharded storage queues both on the conversation's shard writer, where
+    they share group commits.
+    """
+    if not records:
+        return True
+    try:
+        if storage:
+            return storage.save_usage(conversation_id, user_id, records)
+        from .storage import save_usage
+
+        return save_usage(conversation_id, user_id, records)
+    except Exception as e:
+        logger.debug(f"⚠️ Usage not recorded for {conversation_id}: {e}")
+        return False
@@ -51,9 +51,16 @@ def retry(attempts: int = 3, base_delay: float = 0.1):
 # Resilient save - single point of DB persistence
 @retry(attempts=3, base_delay=0.1)
 def resilient_save(
-    conversation_id: str, user_id: str, msg_type: str, content: str, timestamp: float = None
+    conversation_id: str,
+    user_id: str,
+    msg_type: str,
+    content: str,
+    timestamp: float = None,
+    storage=None,
 ) -> bool:
-    """Save with retry logic - wraps storage.save_message."""
+    """Save with retry logic - wraps the configured storage (default SQLite)."""
+    if storage:
+        return storage.save_message(conversation_id, user_id, msg_type, content, timestamp)
     return save_message(
         conversation_id, user_id, msg_type, content, base_dir=None, timestamp=timestamp
     )
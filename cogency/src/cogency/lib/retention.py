@@ -0,0 +1,223 @@
+"""Conversation retention - archive expired messages to cold storage.
+
+Keeps the hot database small:
+- Policy: max message age in days, with per-user overrides (None = keep forever)
+- Export: expired rows streamed in chunks to gzip JSONL or columnar row groups
+- Delete: each exported chunk removed in its own short transaction
+- Summary: optional compact 'archive' record per conversation, shown by history()
+"""
+
+import gzip
+import json
+import time
+from collections import deque
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from .storage import DB, get_cogency_dir
+
+# Message type of the compact per-conversation record left behind by archiving
+ARCHIVE = "archive"
+
+COLUMNS = ["conversation_id", "user_id", "type", "content", "timestamp"]
+
+RETENTION_LIMITS = {
+    "chunk_size": 1000,  # Rows exported and deleted per transaction
+    "summary_chars": 600,  # Max length of an archive record
+    "summary_window": 50,  # Recent archived messages handed to a summarizer
+}
+
+
+@dataclass(frozen=True)
+class Policy:
+    """Message retention policy - ages in days."""
+
+    max_age_days: float = 90
+    users: dict[str, float | None] = field(default_factory=dict)  # Per-user overrides
+
+    def rules(self, now: float = None) -> list[tuple[str, list]]:
+        """SQL predicates (and params) selecting expired rows, one per policy scope."""
+        now = now or time.time()
+        rules = []
+
+        overrides = list(self.users)
+        default = "timestamp < ?"
+        params = [now - self.max_age_days * 86400]
+        if overrides:
+            default += f" AND user_id NOT IN ({','.join('?' for _ in overrides)})"
+            params.extend(overrides)
+        rules.append((default, params))
+
+        for user_id, days in self.users.items():
+            if days is not None:
+                rules.append(("user_id = ? AND timestamp < ?", [user_id, now - days * 86400]))
+
+        return rules
+
+
+class _Writer:
+    """Streaming gzip writer - one JSON row per line, or one column group per chunk."""
+
+    def __init__(self, path: Path, format: str):
+        if format not in {"jsonl", "columnar"}:
+            raise ValueError(f"format must be 'jsonl' or 'columnar', got: {format}")
+        self.path = path
+        self.format = format
+        self._file = None
+
+    def write(self, rows: list[tuple]) -> None:
+        if self._file is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = gzip.open(self.path, "wt", encoding="utf-8")  # noqa: SIM115 - spans chunks
+
+        if self.format == "jsonl":
+            for row in rows:
+                self._file.write(json.dumps(dict(zip(COLUMNS, row, strict=True))) + "\n")
+        else:
+            # Row group: each column stored contiguously - compresses and scans like parquet
+            group = {name: [row[i] for row in rows] for i, name in enumerate(COLUMNS)}
+            self._file.write(json.dumps({"rows": len(rows), "columns": group}) + "\n")
+        self._file.flush()
+
+    def close(self) -> None:
+        if self._file:
+            self._file.close()
+
+
+def read_archive(path: Path) -> Iterator[dict]:
+    """Iterate rows of an archive file in either format."""
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        for line in f:
+            record = json.loads(line)
+            if "columns" not in record:
+                yield record
+                continue
+            columns = record["columns"]
+            for i in range(record["rows"]):
+                yield {name: columns[name][i] for name in COLUMNS}
+
+
+def _expired_chunks(db, policy: Policy, chunk_size: int) -> Iterator[list[tuple]]:
+    """Keyset-paginated expired rows - archive records are never expired."""
+    for predicate, params in policy.rules():
+        last_id = 0
+        while True:
+            rows = db.execute(
+                f"""
+                SELECT id, seq, conversation_id, user_id, type, content, timestamp
+                FROM conversations
+                WHERE id > ? AND type != ? AND {predicate}
+                ORDER BY id
+                LIMIT ?
+                """,
+                [last_id, ARCHIVE, *params, chunk_size],
+            ).fetchall()
+            if not rows:
+                break
+            yield rows
+            last_id = rows[-1][0]
+
+
+def summarize(conversation_id: str, messages: list[dict]) -> str:
+    """Default extractive summary - what the user asked, newest last."""
+    asked = [m["content"].strip().replace("\n", " ")[:80] for m in messages if m["type"] == "user"]
+    if not asked:
+        return f"{len(messages)} earlier messages archived"
+    return "Earlier topics: " + " | ".join(asked[-5:])
+
+
+def archive(
+    policy: Policy = None,
+    base_dir: str = None,
+    out_dir: str = None,
+    format: str = "jsonl",
+    chunk_size: int = None,
+    summarizer: Callable[[str, list[dict]], str] | None = None,
+    dry_run: bool = False,
+) -> dict:
+    """Export expired messages, delete them in bounded batches, optionally leave summaries.
+
+    Each chunk is flushed to the archive file before its rows are deleted, so a crash
+    can duplicate archived rows but never lose them.
+    """
+    policy = policy or Policy()
+    chunk_size = chunk_size or RETENTION_LIMITS["chunk_size"]
+    suffix = "jsonl.gz" if format == "jsonl" else "columns.json.gz"
+    archive_dir = Path(out_dir) if out_dir else get_cogency_dir(base_dir) / "archive"
+    path = archive_dir / f"conversations-{time.strftime('%Y%m%d-%H%M%S')}.{suffix}"
+
+    writer = _Writer(path, format)
+    stats = {"rows": 0, "conversations": 0, "path": None}
+    conversations: dict[str, dict] = {}
+
+    db = DB.connect(base_dir)
+    try:
+        for chunk in _expired_chunks(db, policy, chunk_size):
+            rows = [row[2:] for row in chunk]
+            stats["rows"] += len(rows)
+
+            for _, seq, conversation_id, user_id, msg_type, content, timestamp in chunk:
+                seen = conversations.setdefault(
+                    conversation_id,
+                    {
+                        "user_id": user_id,
+                        "count": 0,
+                        "last": 0.0,
+                        "seq": 0,
+                        "recent": deque(maxlen=RETENTION_LIMITS["summary_window"]),
+                    },
+                )
+                seen["count"] += 1
+                seen["last"] = max(seen["last"], timestamp)
+                seen["seq"] = max(seen["seq"], seq)
+                seen["recent"].append({"type": msg_type, "content": content})
+
+            if dry_run:
+                continue
+
+            writer.write(rows)
+            ids = [row[0] for row in chunk]
+            with db:
+                db.execute(f"DELETE FROM messages WHERE id IN ({','.join('?' for _ in ids)})", ids)
+
+        if summarizer and not dry_run:
+            for conversation_id, seen in conversations.items():
+                _record_summary(db, conversation_id, seen, summarizer)
+    finally:
+        writer.close()
+        db.close()
+
+    stats["conversations"] = len(conversations)
+    if stats["rows"] and not dry_run:
+        stats["path"] = str(path)
+    return stats
+
+
+def _record_summary(db, conversation_id: str, seen: dict, summarizer: Callable) -> None:
+    """Merge a new summary into the conversation's single archive record."""
+    summary = summarizer(conversation_id, list(seen["recent"]))
+    limit = RETENTION_LIMITS["summary_chars"]
+
+    scope = "conversation_key = (SELECT id FROM conversation_keys WHERE name = ?) AND type = ?"
+
+    with db:
+        previous = db.execute(
+            f"SELECT content FROM messages WHERE {scope} ORDER BY seq", (conversation_id, ARCHIVE)
+        ).fetchall()
+        if previous:
+            summary = f"{previous[-1][0]} {summary}"
+            db.execute(f"DELETE FROM messages WHERE {scope}", (conversation_id, ARCHIVE))
+        if len(summary) > limit:
+            summary = "..." + summary[-(limit - 3) :]
+
+        # Takes the newest archived message's (now free) seq - sorts before surviving history
+        db.execute(
+            """
+            INSERT INTO messages (conversation_key, seq, user_key, type, content, timestamp)
+            SELECT c.id, ?, u.id, ?, ?, ?
+            FROM conversation_keys c, users u
+            WHERE c.name = ? AND u.name = ?
+            """,
+            (seen["seq"], ARCHIVE, summary, seen["last"], conversation_id, seen["user_id"]),
+        )
@@ -1,12 +1,168 @@
-"""API key rotation for providers."""
+"""API key rotation for providers.
 
+SDK clients are cached per event loop and "PROVIDER:api_key":
+- Bounded: least recently used clients beyond the size limit are evicted
+- Idle: clients unused for longer than the idle limit are evicted
+- Closed: evicted clients are awaited closed once no call is using them
+- Scoped: a client is only reused on the loop that created it
+
+Streams that fail mid-way are retried with the text already emitted as an
+assistant prefill, and replayed tokens are suppressed - consumers see one
+uninterrupted stream.
+"""
+
+import asyncio
+import inspect
 import os
+import random
 import time
+import weakref
+from collections import OrderedDict
 from collections.abc import Callable
+from contextlib import aclosing, asynccontextmanager
 from typing import Any
 
-# Global client cache: "PROVIDER:api_key" -> client_instance
-_client_cache = {}
+from ..core.result import Ok, Result
+from .logger import logger
+from .tokens import Usage
+
+CLIENT_LIMITS = {
+    "size": 32,  # Cached clients per event loop
+    "idle": 600.0,  # Seconds unused before a client is closed
+}
+
+STREAM_RETRY = {
+    "attempts": 3,  # Stream requests per call, including the first
+    "base_delay": 0.5,  # Seconds before the first retry, doubled per retry
+    "max_delay": 8.0,  # Backoff ceiling
+}
+
+RATE_SIGNALS = ["quota", "rate limit", "429", "throttle", "exceeded"]
+TRANSIENT_SIGNALS = [
+    "overloaded",
+    "timeout",
+    "timed out",
+    "connection",
+    "internal server error",
+    "bad gateway",
+    "service unavailable",
+    "502",
+    "503",
+    "529",
+]
+
+
+async def _aclose(client) -> None:
+    """Close an SDK client - aclose() or close(), awaited when async."""
+    close = getattr(client, "aclose", None) or getattr(client, "close", None)
+    if close is None:
+        return
+    try:
+        result = close()
+        if inspect.isawaitable(result):
+            await result
+    except Exception as e:
+        logger.debug(f"⚠️ Client close failed: {e}")
+
+
+class _Entry:
+    __slots__ = ("client", "used", "leases", "evicted")
+
+    def __init__(self, client):
+        self.client = client
+        self.used = 0.0
+        self.leases = 0
+        self.evicted = False
+
+
+class ClientRegistry:
+    """Bounded, idle-evicting SDK client cache scoped to the running event loop."""
+
+    def __init__(self, maxsize: int = None, idle: float = None):
+        self.maxsize = maxsize or CLIENT_LIMITS["size"]
+        self.idle = CLIENT_LIMITS["idle"] if idle is None else idle
+        # Loop -> name -> entry, least recently used first; dropped with the loop
+        self._scopes: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+    def _entries(self) -> OrderedDict:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return OrderedDict()
+        if loop not in self._scopes:
+            # Clients of closed loops can no longer be awaited closed - release them
+            for stale in [other for other in self._scopes if other.is_closed()]:
+                del self._scopes[stale]
+            self._scopes[loop] = OrderedDict()
+        return self._scopes[loop]
+
+    @asynccontextmanager
+    async def lease(self, name: str, factory: Callable[[], Any]):
+        """Yield the cached client for name, creating it on first use in this loop."""
+        entries = self._entries()
+        entry = entries.pop(name, None) or _Entry(factory())
+        entry.used = time.monotonic()
+        entry.leases += 1
+        entries[name] = entry
+
+        for client in self._evict(entries, entry.used):
+            await _aclose(client)
+
+        try:
+            yield entry.client
+        finally:
+            entry.leases -= 1
+            entry.used = time.monotonic()
+            if entries.get(name) is entry:
+                entries.move_to_end(name)
+            elif entry.evicted and not entry.leases:
+                await _aclose(entry.client)
+
+    def _evict(self, entries: OrderedDict, now: float) -> list:
+        """Drop idle and overflow entries - returns clients safe to close now."""
+        closable = []
+        for name in list(entries):
+            entry = entries[name]
+            if len(entries) <= self.maxsize and now - entry.used <= self.idle:
+                break
+            if entry.leases and len(entries) <= self.maxsize:
+                continue  # Idle-looking but mid-call
+            del entries[name]
+            entry.evicted = True
+            if not entry.leases:
+                closable.append(entry.client)
+        return closable
+
+    async def aclose(self) -> None:
+        """Close every client cached for the running loop."""
+        entries = self._entries()
+        clients = []
+        while entries:
+            _, entry = entries.popitem(last=False)
+            entry.evicted = True
+            if not entry.leases:
+                clients.append(entry.client)
+        for client in clients:
+            await _aclose(client)
+
+    def clear(self) -> None:
+        """Forget all cached clients without closing them."""
+        self._scopes.clear()
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._entries()
+
+    def __len__(self) -> int:
+        return len(self._entries())
+
+
+# Global client cache: (loop, "PROVIDER:api_key") -> client_instance
+_client_cache = ClientRegistry()
+
+
+async def close_clients() -> None:
+    """Close cached SDK clients for the running loop - call on shutdown."""
+    await _client_cache.aclose()
 
 
 class Rotator:
@@ -45,8 +201,7 @@ class Rotator:
             return False
 
         # Rate limit detection
-        rate_signals = ["quota", "rate limit", "429", "throttle", "exceeded"]
-        if not any(signal in error.lower() for signal in rate_signals):
+        if not any(signal in error.lower() for signal in RATE_SIGNALS):
             return False
 
         # Rotate (max once per second)
@@ -62,12 +217,24 @@ class Rotator:
 _rotators: dict[str, Rotator] = {}
 
 
+def _rotator(prefix: str) -> Rotator:
+    """Shared rotator for a prefix - keys are read from the environment once."""
+    rotator = _rotators.get(prefix)
+    if rotator is None:
+        rotator = _rotators[prefix] = Rotator(prefix)
+    return rotator
+
+
+def key_index(llm) -> int | None:
+    """Rotation index of the key an LLM holds directly (resume sessions) - None if unknown."""
+    keys = _rotator(type(llm).__name__.upper()).keys
+    key = getattr(llm, "api_key", None)
+    return keys.index(key) if key in keys else None
+
+
 async def with_rotation(prefix: str, func: Callable, *args, **kwargs) -> Any:
     """Execute function with automatic key rotation on rate limits."""
-    if prefix not in _rotators:
-        _rotators[prefix] = Rotator(prefix)
-
-    rotator = _rotators[prefix]
+    rotator = _rotator(prefix)
     last_error = None
 
     # Try up to 3 times with different keys
@@ -86,9 +253,76 @@ async def with_rotation(prefix: str, func: Callable, *args, **kwargs) -> Any:
     raise last_error
 
 
+def _retriable(error: str) -> bool:
+    """Rate limits and transient provider/network failures are worth retrying."""
+    error = error.lower()
+    return any(signal in error for signal in RATE_SIGNALS + TRANSIENT_SIGNALS)
+
+
+def _backoff(attempt: int) -> float:
+    """Jittered exponential delay - spreads retries of concurrent streams."""
+    delay = min(STREAM_RETRY["max_delay"], STREAM_RETRY["base_delay"] * 2**attempt)
+    return random.uniform(delay / 2, delay)
+
+
+def _continuation(args: tuple, kwargs: dict, emitted: str) -> tuple[tuple, dict]:
+    """Call arguments with the partial response appended as an assistant prefill."""
+    prefill = emitted.rstrip()  # Providers reject trailing whitespace in a prefill
+    if not prefill:
+        return args, kwargs
+    message = {"role": "assistant", "content": prefill}
+    if "messages" in kwargs:
+        return args, {**kwargs, "messages": [*kwargs["messages"], message]}
+    if args and isinstance(args[0], list):
+        return ([*args[0], message], *args[1:]), kwargs
+    return args, kwargs
+
+
+class _Splice:
+    """Joins a retried stream onto text already emitted.
+
+    A retry either continues after the prefill or, when the provider ignores it,
+    restarts from the beginning - replayed text is held back until the two cases
+    can be told apart, then only new text passes.
+    """
+
+    def __init__(self, emitted: str):
+        self.emitted = emitted
+        self.buffer = ""
+        self.joined = not emitted
+
+    def feed(self, text: str) -> str:
+        """New text from this chunk ("" while it may still be a replay)."""
+        if self.joined:
+            return text
+        self.buffer += text
+        if self.emitted.startswith(self.buffer):
+            return ""
+
+        self.joined = True
+        if self.buffer.startswith(self.emitted):
+            return self.buffer[len(self.emitted) :]  # Restarted - drop the replay
+        return self._continued()
+
+    def flush(self) -> str:
+        """Held-back text once the stream ended cleanly without resolving the ambiguity.
+
+        Shorter than what was emitted, so not a full replay - it was a continuation that
+        happened to repeat the start of the response.
+        """
+        if self.joined or not self.buffer:
+            return ""
+        self.joined = True
+        return self._continued()
+
+    def _continued(self) -> str:
+        if self.emitted[-1].isspace():
+            return self.buffer.lstrip()  # Whitespace stripped from the prefill was emitted
+        return self.buffer
+
+
 def rotate(func=None, *, prefix: str = None, per_connection: bool = False):
     """Decorator for automatic key rotation with client caching."""
-    import inspect
 
     def decorator(func):
         # Auto-detect prefix from class name if not provided
@@ -106,39 +340,66 @@ def rotate(func=None, *, prefix: str = None, per_connection: bool = False):
 
         # Check if function is async generator
         if inspect.isasyncgenfunction(func):
-            # Async generator wrapper with caching
+            # Async generator wrapper with caching and mid-stream resumption
             async def async_gen_wrapper(self, *args, **kwargs):
                 provider_prefix = get_prefix(self)
+                rotator = _rotator(provider_prefix)
+                emitted = ""
+                failure = None
 
-                async def _execute_cached(api_key):
-                    # Get cached client
-                    cache_key = f"{provider_prefix}:{api_key}"
-                    if cache_key not in _client_cache:
-                        _client_cache[cache_key] = self._create_client(api_key)
-                    client = _client_cache[cache_key]
-
-                    # Call with cached client
-                    async for item in func(self, client, *args, **kwargs):
-                        yield item
-
-                rotator = _rotators.get(provider_prefix) or Rotator(provider_prefix)
-                if provider_prefix not in _rotators:
-                    _rotators[provider_prefix] = rotator
-
-                key = rotator.current_key()
-                if not key:
-                    raise ValueError(f"No {provider_prefix} API keys found")
-
-                try:
-                    async for item in _execute_cached(key):
-                        yield item
-                except Exception as e:
-                    if not rotator.rotate(str(e)):
-                        raise
-                    # Retry with rotated key
+                for attempt in range(STREAM_RETRY["attempts"]):
                     key = rotator.current_key()
-                    async for item in _execute_cached(key):
-                        yield item
+                    if not key:
+                        raise ValueError(f"No {provider_prefix} API keys found")
+
+                    call_args, call_kwargs = _continuation(args, kwargs, emitted)
+                    splice = _Splice(emitted)
+                    failure = None
+                    try:
+                        # Leased for the whole stream - eviction waits for it to finish
+                        async with (
+                            _client_cache.lease(
+                                f"{provider_prefix}:{key}", lambda k=key: self._create_client(k)
+                            ) as client,
+                            aclosing(func(self, client, *call_args, **call_kwargs)) as stream,
+                        ):
+                            # Ledger: which key served this attempt
+                            yield Ok(Usage(key=rotator.current % len(rotator.keys)))
+                            wrapped = True
+                            async for item in stream:
+                                if isinstance(item, Result) and item.failure:
+                                    failure = item
+                                    break
+                                text = item.unwrap() if isinstance(item, Result) else item
+                                if not isinstance(text, str):
+                                    yield item
+                                    continue
+                                wrapped = isinstance(item, Result)
+                                text = splice.feed(text)
+                                if text:
+                                    emitted += text
+                                    yield Ok(text) if wrapped else text
+                    except Exception as e:
+                        failure = e
+
+                    if failure is None:
+                        if text := splice.flush():
+                            yield Ok(text) if wrapped else text
+                        return
+
+                    error = failure.error if isinstance(failure, Result) else str(failure)
+                    rotated = rotator.rotate(error)
+                    if attempt == STREAM_RETRY["attempts"] - 1 or not (
+                        rotated or _retriable(error)
+                    ):
+                        break
+                    debug_log(f"stream failed after {len(emitted)} chars, resuming: {error}")
+                    if not rotated:
+                        await asyncio.sleep(_backoff(attempt))
+
+                if isinstance(failure, Exception):
+                    raise failure
+                yield failure
 
             return async_gen_wrapper
 
@@ -147,14 +408,10 @@ def rotate(func=None, *, prefix: str = None, per_connection: bool = False):
             provider_prefix = get_prefix(self)
 
             async def _execute_cached(api_key):
-                # Get cached client
-                cache_key = f"{provider_prefix}:{api_key}"
-                if cache_key not in _client_cache:
-                    _client_cache[cache_key] = self._create_client(api_key)
-                client = _client_cache[cache_key]
-
-                # Call with cached client
-                return await func(self, client, *args, **kwargs)
+                async with _client_cache.lease(
+                    f"{provider_prefix}:{api_key}", lambda: self._create_client(api_key)
+                ) as client:
+                    return await func(self, client, *args, **kwargs)
 
             return await with_rotation(provider_prefix, _execute_cached)
 
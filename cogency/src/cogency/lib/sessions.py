@@ -0,0 +1,237 @@
+"""WebSocket session pool for resume mode.
+
+Keeps the handshake off the turn's critical path:
+- Warm: connected, configured sessions per provider/model/key, refilled in the background
+- Prime: a warm session takes the conversation via llm.prime() instead of a fresh connect
+- Live: a conversation's session is kept after a completed turn and reused by the next
+- Held: each session's transcript (primed messages, sends, streamed replies) is tracked,
+  so a dropped session reconnects with what it held instead of a re-assembled context
+- Health: sessions past the idle or age limit are closed; failed turns discard theirs
+- Scoped: sessions belong to the event loop that opened them
+"""
+
+import asyncio
+import time
+import weakref
+from collections import OrderedDict
+
+from .logger import logger
+
+SESSION_LIMITS = {
+    "warm": 1,  # Idle primed-on-demand sessions kept per provider/model/key
+    "live": 64,  # Conversation sessions kept between turns, per event loop
+    "idle": 120.0,  # Seconds unused before a session is closed
+    "max_age": 600.0,  # Seconds before a session is recycled (providers cap session length)
+    "reconnects": 2,  # Dropped sessions re-opened per turn before falling back to replay
+}
+
+
+def _provider(llm) -> tuple:
+    """Pool key - sessions are interchangeable only for the same provider, model and key."""
+    return (
+        type(llm).__qualname__,
+        getattr(llm, "stream_model", None),
+        getattr(llm, "api_key", None),
+    )
+
+
+def _primes(llm) -> bool:
+    """Provider can open an idle session and load a conversation into it later."""
+    return callable(getattr(type(llm), "prime", None))
+
+
+class _Session:
+    __slots__ = ("llm", "session", "created", "used", "held", "reply")
+
+    def __init__(self, llm, session, created: float = None, held: list[dict] = None):
+        self.llm = llm
+        self.session = session
+        self.created = created or time.monotonic()
+        self.used = time.monotonic()
+        self.held = held if held is not None else []  # Messages the provider side holds
+        self.reply: list[str] = []  # Streamed assistant text not yet folded into held
+
+    def fold(self) -> list[dict]:
+        """Held messages, with the reply streamed so far as the last assistant turn."""
+        if self.reply:
+            self.held.append({"role": "assistant", "content": "".join(self.reply)})
+            self.reply = []
+        return self.held
+
+
+class _Scope:
+    """Pool state for one event loop."""
+
+    def __init__(self):
+        self.warm: dict[tuple, list[_Session]] = {}
+        self.live: OrderedDict[tuple, _Session] = OrderedDict()  # Least recently used first
+        self.busy: dict[int, _Session] = {}  # id(session) -> entry, for sessions in use
+        self.filling: set[tuple] = set()
+        self.tasks: set[asyncio.Task] = set()
+
+
+class SessionPool:
+    """Warm and per-conversation WebSocket sessions, bounded and health-checked."""
+
+    def __init__(
+        self, warm: int = None, live: int = None, idle: float = None, max_age: float = None
+    ):
+        self.warm = SESSION_LIMITS["warm"] if warm is None else warm
+        self.live = live or SESSION_LIMITS["live"]
+        self.idle = idle or SESSION_LIMITS["idle"]
+        self.max_age = max_age or SESSION_LIMITS["max_age"]
+        self.reconnects = SESSION_LIMITS["reconnects"]
+        self._scopes: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+    def _scope(self) -> _Scope:
+        loop = asyncio.get_running_loop()
+        scope = self._scopes.get(loop)
+        if scope is None:
+            scope = self._scopes[loop] = _Scope()
+        return scope
+
+    def _healthy(self, entry: _Session, now: float) -> bool:
+        return now - entry.used <= self.idle and now - entry.created <= self.max_age
+
+    async def resume(self, llm, conversation_id: str):
+        """Take the conversation's live session, if one is still healthy."""
+        scope = self._scope()
+        await self._sweep(scope)
+        entry = scope.live.pop((_provider(llm), conversation_id), None)
+        if entry is None:
+            return None
+        scope.busy[id(entry.session)] = entry
+        logger.debug(f"🔌 Reusing live session for {conversation_id}")
+        return entry.session
+
+    async def open(self, llm, messages: list[dict]):
+        """Session loaded with messages - a primed warm session, else a fresh connect."""
+        scope = self._scope()
+        await self._sweep(scope)
+
+        session = None
+        if _primes(llm):
+            warm = scope.warm.get(_provider(llm), [])
+            while warm and session is None:
+                entry = warm.pop()
+                if await llm.prime(entry.session, messages):
+                    session = entry.session
+                    scope.busy[id(session)] = _Session(llm, session, entry.created, list(messages))
+                else:
+                    await self._close(entry)
+            self._refill(llm, scope)
+
+        if session is None:
+            session = await llm.connect(messages)
+            if session:
+                scope.busy[id(session)] = _Session(llm, session, held=list(messages))
+        return session
+
+    def record(self, session, role: str, content: str) -> None:
+        """Note content a session in use now holds - assistant text as it streams."""
+        entry = self._scope().busy.get(id(session))
+        if entry is None or not content:
+            return
+        if role == "assistant":
+            entry.reply.append(content)
+        else:
+            entry.fold().append({"role": role, "content": content})
+
+    def held(self, session) -> list[dict]:
+        """Transcript a session in use holds, including any partial reply."""
+        entry = self._scope().busy.get(id(session))
+        return list(entry.fold()) if entry else []
+
+    async def reconnect(self, llm, session):
+        """Replace a dropped session with one loaded with exactly what it held.
+
+        Skips context assembly and keeps the turn's progress - the partial reply is
+        part of the transcript, so the model continues rather than starting over.
+        """
+        scope = self._scope()
+        entry = scope.busy.pop(id(session), None)
+        held = entry.fold() if entry else []
+        await self._close(entry or _Session(llm, session))
+        if not held:
+            return None
+
+        logger.debug(f"🔌 Reconnecting session with {len(held)} held messages")
+        return await self.open(llm, held)
+
+    async def release(self, llm, conversation_id: str, session) -> None:
+        """Keep a session after a completed turn for the conversation's next turn."""
+        scope = self._scope()
+        entry = scope.busy.pop(id(session), None) or _Session(llm, session)
+        entry.fold()
+        entry.used = time.monotonic()
+        key = (_provider(llm), conversation_id)
+
+        previous = scope.live.pop(key, None)
+        scope.live[key] = entry
+        if previous:
+            await self._close(previous)
+        while len(scope.live) > self.live:
+            await self._close(scope.live.popitem(last=False)[1])
+
+    async def discard(self, llm, session) -> None:
+        """Close a session whose turn failed or did not complete."""
+        scope = self._scope()
+        entry = scope.busy.pop(id(session), None)
+        await self._close(entry or _Session(llm, session))
+
+    async def close(self) -> None:
+        """Close every pooled session on this loop - call on shutdown."""
+        scope = self._scope()
+        for task in scope.tasks:
+            task.cancel()
+        entries = [entry for warm in scope.warm.values() for entry in warm]
+        entries.extend(scope.live.values())
+        scope.warm.clear()
+        scope.live.clear()
+        for entry in entries:
+            await self._close(entry)
+
+    async def _sweep(self, scope: _Scope) -> None:
+        """Close sessions past the idle or age limit."""
+        now = time.monotonic()
+        stale = []
+        for entries in scope.warm.values():
+            stale.extend(entry for entry in entries if not self._healthy(entry, now))
+            entries[:] = [entry for entry in entries if self._healthy(entry, now)]  # _fill appends
+        for key in [key for key, entry in scope.live.items() if not self._healthy(entry, now)]:
+            stale.append(scope.live.pop(key))
+        for entry in stale:
+            await self._close(entry)
+
+    def _refill(self, llm, scope: _Scope) -> None:
+        """Top up warm sessions in the background."""
+        key = _provider(llm)
+        if self.warm < 1 or key in scope.filling:
+            return
+        scope.filling.add(key)
+        task = asyncio.get_running_loop().create_task(self._fill(llm, scope, key))
+        scope.tasks.add(task)
+        task.add_done_callback(scope.tasks.discard)
+
+    async def _fill(self, llm, scope: _Scope, key: tuple) -> None:
+        try:
+            warm = scope.warm.setdefault(key, [])
+            while len(warm) < self.warm:
+                session = await llm.connect([])
+                if not session:
+                    break
+                warm.append(_Session(llm, session))
+        except Exception as e:
+            logger.debug(f"⚠️ Session warm-up failed: {e}")
+        finally:
+            scope.filling.discard(key)
+
+    async def _close(self, entry: _Session) -> None:
+        try:
+            await entry.llm.close(entry.session)
+        except Exception as e:
+            logger.debug(f"⚠️ Session close failed: {e}")
+
+
+# Singleton pool
+sessions = SessionPool()
@@ -0,0 +1,325 @@
+"""Sharded SQLite storage - users hashed across N database files.
+
+One store.db serializes every write behind one writer lock. Sharding splits it:
+- Routing: crc32(user_id) % N picks a shard; a conversation lives on its owner's shard
+- Layout: <cogency_dir>/shards/NN/store.db - each shard is an ordinary v2 database
+- Writer: one thread per shard owns the only write connection and group-commits
+  queued writes (one transaction and fsync per batch, a savepoint per write)
+- Writes wait for their batch to commit and return its outcome - concurrent callers
+  still share one commit; open stores are closed (writers drained) at exit
+- Reads: plain connections per call, concurrent with the writer under WAL
+- New conversations go straight to the writer's shard; only reads probe on a miss
+"""
+
+import atexit
+import json
+import queue
+import sqlite3
+import threading
+import time
+import weakref
+import zlib
+from concurrent.futures import Future
+from contextlib import suppress
+from pathlib import Path
+
+from .cache import LRU
+from .logger import logger
+from .storage import (
+    DB,
+    _cache_profile,
+    _forget_keys,
+    _insert_message,
+    _insert_profile,
+    _insert_usage,
+    count_user_messages,
+    get_cogency_dir,
+    get_db_path,
+    load_messages,
+    load_profile,
+    load_usage,
+    load_user_messages,
+    profile_version,
+    search_user_messages,
+)
+
+SHARD_LIMITS = {
+    "count": 8,  # Database files - fixed once created
+    "batch": 256,  # Max writes folded into one shard transaction
+    "conversations": 65536,  # conversation -> shard entries kept in memory
+}
+
+
+def shard_dirs(base_dir: str = None) -> list[Path]:
+    """Existing shard directories, in shard order."""
+    root = get_cogency_dir(base_dir) / "shards"
+    if not root.exists():
+        return []
+    return sorted(p for p in root.iterdir() if p.is_dir() and p.name.isdigit())
+
+
+def shard_for(user_id: str, count: int) -> int:
+    """Stable shard index for a user - identical across processes and restarts."""
+    return zlib.crc32(user_id.encode("utf-8")) % count
+
+
+class _Writer:
+    """Single writer thread for one shard - queued writes, group commit."""
+
+    def __init__(self, base_dir: str, batch: int):
+        self.base_dir = base_dir
+        self.batch = batch
+        self._jobs: queue.SimpleQueue = queue.SimpleQueue()
+        DB.connect(base_dir).close()  # Schema / migration before the writer starts
+        self._thread = threading.Thread(
+            target=self._run, name=f"cogency-shard-{Path(base_dir).name}", daemon=True
+        )
+        self._thread.start()
+
+    def submit(self, write, rollback=None) -> Future:
+        """Queue write(db) for the next group commit - the future holds its result."""
+        future = Future()
+        self._jobs.put((write, rollback, future))
+        return future
+
+    def write(self, write, rollback=None):
+        """Run write(db) in the next group commit and wait for its result."""
+        return self.submit(write, rollback).result()
+
+    def close(self) -> None:
+        self._jobs.put(None)
+        self._thread.join()
+
+    def _run(self) -> None:
+        db = sqlite3.connect(get_db_path(self.base_dir), isolation_level=None)
+        db.execute("PRAGMA journal_mode = WAL")
+        try:
+            while True:
+                jobs = [self._jobs.get()]
+                while len(jobs) < self.batch:
+                    try:
+                        jobs.append(self._jobs.get_nowait())
+                    except queue.Empty:
+                        break
+
+                stop = None in jobs
+                self._commit(db, [job for job in jobs if job is not None])
+                if stop:
+                    return
+        finally:
+            db.close()
+
+    def _commit(self, db, jobs: list) -> None:
+        """One transaction for the batch - a failing write rolls back only itself."""
+        done = []
+        try:
+            db.execute("BEGIN IMMEDIATE")
+            for write, rollback, future in jobs:
+                db.execute("SAVEPOINT write")
+                try:
+                    result = write(db)
+                    db.execute("RELEASE write")
+                    done.append((future, result, rollback))
+                except Exception as e:
+                    db.execute("ROLLBACK TO write")
+                    db.execute("RELEASE write")
+                    if rollback:
+                        rollback()
+                    future.set_exception(e)
+            db.execute("COMMIT")
+        except Exception as e:
+            logger.debug(f"⚠️ Shard commit failed ({self.base_dir}): {e}")
+            if db.in_transaction:
+                with suppress(sqlite3.Error):
+                    db.execute("ROLLBACK")
+            # Every write not already failed alone - ran, or never reached (BEGIN/SAVEPOINT)
+            for _, rollback, future in jobs:
+                if not future.done():
+                    if rollback:
+                        rollback()
+                    future.set_exception(e)
+            return
+
+        for future, result, _ in done:
+            future.set_result(result)
+
+
+_open = weakref.WeakSet()  # Sharded stores to drain at exit - writer threads are daemons
+
+
+@atexit.register
+def _close_all() -> None:
+    for storage in list(_open):
+        storage.close()
+
+
+class Sharded:
+    """Storage across N SQLite shards keyed by user.
+
+    Write throughput scales with shard count: each shard has its own file, lock
+    and writer, and concurrent writers to a shard share one fsync per batch.
+    """
+
+    def __init__(self, base_dir: str = None, shards: int = None, batch: int = None):
+        self.count = shards or SHARD_LIMITS["count"]
+        self.batch = batch or SHARD_LIMITS["batch"]
+        self.root = get_cogency_dir(base_dir) / "shards"
+
+        existing = shard_dirs(base_dir)
+        if existing and len(existing) != self.count:
+            raise ValueError(
+                f"{self.root} holds {len(existing)} shards, got shards={self.count} - "
+                "changing the count would re-route users"
+            )
+
+        self.dirs = [str(self.root / f"{i:02d}") for i in range(self.count)]
+        for shard_dir in self.dirs:
+            Path(shard_dir).mkdir(parents=True, exist_ok=True)
+
+        self._writers: dict[int, _Writer] = {}
+        self._lock = threading.Lock()
+        self._conversations = LRU(SHARD_LIMITS["conversations"])
+        _open.add(self)
+
+    # Routing
+
+    def _writer(self, shard: int) -> _Writer:
+        writer = self._writers.get(shard)
+        if writer is None:
+            with self._lock:
+                writer = self._writers.get(shard)
+                if writer is None:
+                    writer = self._writers[shard] = _Writer(self.dirs[shard], self.batch)
+        return writer
+
+    def _conversation_shard(self, conversation_id: str) -> int | None:
+        """Shard holding a conversation - cached, probed across shards on a miss (reads)."""
+        shard = self._conversations.get(conversation_id)
+        if shard is not None:
+            return shard
+
+        for i, shard_dir in enumerate(self.dirs):
+            with DB.connect(shard_dir) as db:
+                found = db.execute(
+                    "SELECT 1 FROM conversation_keys WHERE name = ?", (conversation_id,)
+                ).fetchone()
+            if found:
+                self._conversations.put(conversation_id, i)
+                return i
+        return None
+
+    def _owner(self, conversation_id: str, user_id: str) -> int:
+        """Shard for a write - where the conversation is known to live, else the user's.
+
+        No probe: a conversation not seen by this process starts on its writer's shard.
+        """
+        shard = self._conversations.get(conversation_id)
+        if shard is None:
+            shard = shard_for(user_id, self.count)
+            self._conversations.put(conversation_id, shard)
+        return shard
+
+    def close(self) -> None:
+        """Drain and stop the shard writers."""
+        with self._lock:
+            writers, self._writers = self._writers, {}
+        for writer in writers.values():
+            writer.close()
+
+    # Storage protocol
+
+    def save_message(
+        self, conversation_id: str, user_id: str, type: str, content: str, timestamp: float = None
+    ) -> bool:
+        """Write through the conversation owner's shard writer - True once committed."""
+        if timestamp is None:
+            timestamp = time.time()
+
+        shard = self._owner(conversation_id, user_id)
+        base_dir = self.dirs[shard]
+
+        try:
+            self._writer(shard).write(
+                lambda db: _insert_message(
+                    db, base_dir, conversation_id, user_id, type, content, timestamp
+                ),
+                lambda: _forget_keys(base_dir, conversation_id, user_id),
+            )
+            return True
+        except Exception:
+            return False
+
+    def save_usage(self, conversation_id: str, user_id: str, records: list[dict]) -> bool:
+        """Usage records next to the conversation - shares its group commit."""
+        if not records:
+            return True
+        shard = self._owner(conversation_id, user_id)
+        base_dir = self.dirs[shard]
+
+        try:
+            self._writer(shard).write(
+                lambda db: _insert_usage(db, base_dir, conversation_id, user_id, records),
+                lambda: _forget_keys(base_dir, conversation_id, user_id),
+            )
+            return True
+        except Exception:
+            return False
+
+    def load_usage(self, since: float = 0) -> list[dict]:
+        """Usage records across shards, oldest first."""
+        records = [r for shard_dir in self.dirs for r in load_usage(since, shard_dir)]
+        return sorted(records, key=lambda r: r["timestamp"])
+
+    def load_messages(
+        self,
+        conversation_id: str,
+        include: list[str] = None,
+        exclude: list[str] = None,
+        limit: int = None,
+    ) -> list[dict]:
+        """Load conversation messages from the shard that holds it."""
+        shard = self._conversation_shard(conversation_id)
+        if shard is None:
+            return []
+        return load_messages(conversation_id, self.dirs[shard], include, exclude, limit)
+
+    def _user_dir(self, user_id: str) -> str:
+        return self.dirs[shard_for(user_id, self.count)]
+
+    def count_user_messages(self, user_id: str, since: float = 0) -> int:
+        """Count a user's turns newer than a timestamp."""
+        return count_user_messages(user_id, since, self._user_dir(user_id))
+
+    def load_user_messages(self, user_id: str, since: float = 0, limit: int = -1) -> list[str]:
+        """Load a user's turns newer than a timestamp, oldest first."""
+        return load_user_messages(user_id, since, limit, self._user_dir(user_id))
+
+    def search_user_messages(
+        self, user_id: str, query: str, limit: int = 3, exclude_conversation: str = None
+    ) -> list[tuple[str, float, str]]:
+        """Keyword search over a user's turns."""
+        return search_user_messages(
+            user_id, query, limit, exclude_conversation, self._user_dir(user_id)
+        )
+
+    def save_profile(self, user_id: str, profile: dict) -> bool:
+        """Write a profile version through the user's shard writer."""
+        shard = shard_for(user_id, self.count)
+        base_dir = self.dirs[shard]
+        try:
+            profile_json = json.dumps(profile)
+            version = self._writer(shard).write(
+                lambda db: _insert_profile(db, user_id, profile_json)
+            )
+            _cache_profile(base_dir, user_id, version, profile_json)
+            return True
+        except Exception:
+            return False
+
+    def load_profile(self, user_id: str) -> dict:
+        """Load latest user profile."""
+        return load_profile(user_id, self._user_dir(user_id))
+
+    def profile_version(self, user_id: str) -> int:
+        """Latest profile version (0 if none)."""
+        return profile_version(user_id, self._user_dir(user_id))
@@ -1,10 +1,52 @@
 """SQLite storage for conversation persistence."""
 
+import bisect
+import copy
 import json
 import sqlite3
+import threading
 import time
+from array import array
 from pathlib import Path
 
+from .cache import LRU
+
+# Latest-profile cache: saves populate it, other processes' writes are picked up
+# by a MAX(version) check once an entry is older than the revalidation window
+PROFILE_CACHE = {
+    "size": 1024,  # Users kept in memory
+    "revalidate": 5.0,  # Seconds before re-checking MAX(version)
+}
+
+# Usage record shape returned by load_usage (save_usage takes the same minus the ids)
+USAGE_FIELDS = [
+    "conversation_id",
+    "user_id",
+    "model",
+    "key",
+    "input",
+    "output",
+    "cached",
+    "estimated",
+    "cost",
+    "ttft",
+    "latency",
+    "timestamp",
+]
+
+# Interned user/conversation ids resolved by this process
+KEY_CACHE = {
+    "size": 4096,  # Names kept in memory
+}
+
+# Profile history: a version is pruned only once it is outside BOTH windows
+PROFILE_RETENTION = {
+    "keep_versions": 5,  # Newest N versions per user always kept
+    "keep_days": 30,  # Versions newer than this always kept
+    "compact_every": 10,  # Prune a user's history every N saves
+    "batch": 500,  # Max versions deleted per statement - short write locks
+}
+
 
 def get_cogency_dir(base_dir: str = None) -> Path:
     """Get cogency directory, configurable like requests."""
@@ -21,54 +63,177 @@ def get_db_path(base_dir: str = None) -> Path:
     return get_cogency_dir(base_dir) / "store.db"
 
 
+# Schema version kept in PRAGMA user_version (0 = empty or legacy TEXT-keyed database)
+# v3 adds the usage ledger - created in place, no data migration
+SCHEMA_VERSION = 3
+
+SCHEMA = (
+    # Interned identifiers - events store small integer keys, not repeated TEXT
+    """
+    CREATE TABLE IF NOT EXISTS users (
+        id INTEGER PRIMARY KEY,
+        name TEXT NOT NULL UNIQUE
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS conversation_keys (
+        id INTEGER PRIMARY KEY,
+        name TEXT NOT NULL UNIQUE
+    )
+    """,
+    # One row per event - id is the rowid (global insert order), seq orders a conversation
+    """
+    CREATE TABLE IF NOT EXISTS messages (
+        id INTEGER PRIMARY KEY,
+        conversation_key INTEGER NOT NULL,
+        seq INTEGER NOT NULL,
+        user_key INTEGER NOT NULL,
+        type TEXT NOT NULL,
+        content TEXT NOT NULL,
+        timestamp REAL NOT NULL
+    )
+    """,
+    # load_messages, clear_messages, next seq on save
+    """
+    CREATE UNIQUE INDEX IF NOT EXISTS idx_messages_conversation
+    ON messages(conversation_key, seq)
+    """,
+    # Profile learning, recall, last conversation - user turns only
+    """
+    CREATE INDEX IF NOT EXISTS idx_messages_user
+    ON messages(user_key, timestamp) WHERE type = 'user'
+    """,
+    # Read-only compatibility view for ad-hoc SQL (cogency db, admin stats)
+    """
+    CREATE VIEW IF NOT EXISTS conversations AS
+    SELECT m.id, c.name AS conversation_id, u.name AS user_id,
+           m.seq, m.type, m.content, m.timestamp
+    FROM messages m
+    JOIN conversation_keys c ON c.id = m.conversation_key
+    JOIN users u ON u.id = m.user_key
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS profiles (
+        user_id TEXT NOT NULL,
+        version INTEGER NOT NULL,
+        data TEXT NOT NULL,
+        created_at REAL NOT NULL,
+        char_count INTEGER NOT NULL,
+        PRIMARY KEY (user_id, version)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_profiles_cleanup ON profiles(created_at)",
+    # One row per LLM request - written once per turn, aggregated by `cogency usage`
+    """
+    CREATE TABLE IF NOT EXISTS usage (
+        id INTEGER PRIMARY KEY,
+        conversation_key INTEGER NOT NULL,
+        user_key INTEGER NOT NULL,
+        model TEXT NOT NULL,
+        key_index INTEGER,
+        input_tokens INTEGER NOT NULL,
+        output_tokens INTEGER NOT NULL,
+        cached_tokens INTEGER NOT NULL,
+        estimated INTEGER NOT NULL,
+        cost REAL NOT NULL,
+        ttft REAL,
+        latency REAL NOT NULL,
+        timestamp REAL NOT NULL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_usage_time ON usage(timestamp)",
+    # Duplicated the primary key
+    "DROP INDEX IF EXISTS idx_profiles_user_latest",
+)
+
+# v1 -> v2: intern ids and number each conversation in timestamp order
+MIGRATE_V1 = (
+    "INSERT OR IGNORE INTO users (name) SELECT DISTINCT user_id FROM conversations_v1",
+    """
+    INSERT OR IGNORE INTO conversation_keys (name)
+    SELECT DISTINCT conversation_id FROM conversations_v1
+    """,
+    """
+    INSERT INTO messages (conversation_key, seq, user_key, type, content, timestamp)
+    SELECT c.id,
+           ROW_NUMBER() OVER (PARTITION BY old.conversation_id ORDER BY old.timestamp),
+           u.id, old.type, old.content, old.timestamp
+    FROM conversations_v1 old
+    JOIN conversation_keys c ON c.name = old.conversation_id
+    JOIN users u ON u.name = old.user_id
+    ORDER BY old.timestamp
+    """,
+    "DROP TABLE conversations_v1",
+)
+
+
 class DB:
     """Simple database manager - no ceremony."""
 
-    _initialized_paths = set()
+    # base_dir -> initialized database path (skips path building on the hot path)
+    _initialized_paths: dict[str | None, str] = {}
 
     @classmethod
     def connect(cls, base_dir: str = None):
         """Get database connection with automatic initialization."""
-        db_path = get_db_path(base_dir)
+        db_path = cls._initialized_paths.get(base_dir)
 
-        if str(db_path) not in cls._initialized_paths:
+        if db_path is None:
+            db_path = str(get_db_path(base_dir))
             cls._init_schema(db_path)
-            cls._initialized_paths.add(str(db_path))
+            cls._initialized_paths[base_dir] = db_path
 
         return sqlite3.connect(db_path)
 
     @classmethod
-    def _init_schema(cls, db_path: Path):
-        """Initialize database schema once."""
-        with sqlite3.connect(db_path) as db:
-            db.executescript("""
-                CREATE TABLE IF NOT EXISTS conversations (
-                    conversation_id TEXT NOT NULL,
-                    user_id TEXT NOT NULL,
-                    type TEXT NOT NULL,
-                    content TEXT NOT NULL,
-                    timestamp REAL NOT NULL,
-                    PRIMARY KEY (conversation_id, timestamp)
-                );
-
-                CREATE INDEX IF NOT EXISTS idx_conversations_id ON conversations(conversation_id);
-                CREATE INDEX IF NOT EXISTS idx_conversations_type ON conversations(type);
-                CREATE INDEX IF NOT EXISTS idx_conversations_user ON conversations(user_id);
-                CREATE INDEX IF NOT EXISTS idx_conversations_composite ON conversations(conversation_id, type, timestamp);
-                CREATE INDEX IF NOT EXISTS idx_conversations_user_type ON conversations(user_id, type, timestamp);
-
-                CREATE TABLE IF NOT EXISTS profiles (
-                    user_id TEXT NOT NULL,
-                    version INTEGER NOT NULL,
-                    data TEXT NOT NULL,
-                    created_at REAL NOT NULL,
-                    char_count INTEGER NOT NULL,
-                    PRIMARY KEY (user_id, version)
-                );
-
-                CREATE INDEX IF NOT EXISTS idx_profiles_user_latest ON profiles(user_id, version DESC);
-                CREATE INDEX IF NOT EXISTS idx_profiles_cleanup ON profiles(created_at);
-            """)
+    def _init_schema(cls, db_path: str):
+        """Create or migrate the schema once - one immediate transaction across processes."""
+        db = sqlite3.connect(db_path, isolation_level=None)
+        try:
+            # Must precede table creation - only takes effect on new databases
+            db.execute("PRAGMA auto_vacuum = INCREMENTAL")
+            db.execute("BEGIN IMMEDIATE")
+            try:
+                if db.execute("PRAGMA user_version").fetchone()[0] < SCHEMA_VERSION:
+                    legacy = db.execute(
+                        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'conversations'"
+                    ).fetchone()
+                    if legacy:
+                        # Legacy indexes follow the table and are dropped with it
+                        db.execute("ALTER TABLE conversations RENAME TO conversations_v1")
+                    for statement in SCHEMA:
+                        db.execute(statement)
+                    if legacy:
+                        for statement in MIGRATE_V1:
+                            db.execute(statement)
+                    db.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+                db.execute("COMMIT")
+            except Exception:
+                db.execute("ROLLBACK")
+                raise
+        finally:
+            db.close()
+
+
+# (base_dir, table, name) -> id - key rows are never deleted, so ids stay valid
+_keys = LRU(KEY_CACHE["size"])
+
+
+def _key(db, base_dir: str, table: str, name: str) -> int:
+    """Interned integer id for a user or conversation name."""
+    cache_key = (base_dir, table, name)
+    key = _keys.get(cache_key)
+    if key is None:
+        db.execute(f"INSERT OR IGNORE INTO {table} (name) VALUES (?)", (name,))
+        key = db.execute(f"SELECT id FROM {table} WHERE name = ?", (name,)).fetchone()[0]
+        _keys.put(cache_key, key)
+    return key
+
+
+def _forget_keys(base_dir: str, conversation_id: str, user_id: str) -> None:
+    """Drop ids resolved inside a rolled-back write - the key rows may not exist."""
+    _keys.pop((base_dir, "conversation_keys", conversation_id))
+    _keys.pop((base_dir, "users", user_id))
 
 
 def _filter_type(include: list[str] = None, exclude: list[str] = None):
@@ -83,23 +248,37 @@ def _filter_type(include: list[str] = None, exclude: list[str] = None):
 
 
 def load_messages(
-    conversation_id: str, base_dir: str = None, include: list[str] = None, exclude: list[str] = None
+    conversation_id: str,
+    base_dir: str = None,
+    include: list[str] = None,
+    exclude: list[str] = None,
+    limit: int = None,
 ) -> list[dict]:
-    """Load conversation from SQLite with optional type filtering."""
+    """Load conversation from SQLite with optional type filtering - newest `limit` only if given."""
     with DB.connect(base_dir) as db:
         db.row_factory = sqlite3.Row
 
         # Base query with filter
-        query = "SELECT type, content FROM conversations WHERE conversation_id = ?"
+        query = """
+            SELECT type, content FROM messages
+            WHERE conversation_key = (SELECT id FROM conversation_keys WHERE name = ?)
+        """
         params = [conversation_id]
 
         filter_clause, filter_params = _filter_type(include, exclude)
         query += filter_clause
         params.extend(filter_params)
 
-        query += " ORDER BY timestamp"
+        if limit is None:
+            query += " ORDER BY seq"
+        else:
+            # Tail read - walk the (conversation_key, seq) index backwards
+            query += " ORDER BY seq DESC LIMIT ?"
+            params.append(limit)
 
         rows = db.execute(query, params).fetchall()
+        if limit is not None:
+            rows.reverse()
         return [{"type": row["type"], "content": row["content"]} for row in rows]
 
 
@@ -117,51 +296,332 @@ def save_message(
 
     try:
         with DB.connect(base_dir) as db:
-            db.execute(
-                "INSERT INTO conversations (conversation_id, user_id, type, content, timestamp) VALUES (?, ?, ?, ?, ?)",
-                (conversation_id, user_id, type, content, timestamp),
-            )
+            _insert_message(db, base_dir, conversation_id, user_id, type, content, timestamp)
         return True
     except Exception:
+        _forget_keys(base_dir, conversation_id, user_id)
         return False
 
 
-def load_profile(user_id: str, base_dir: str = None) -> dict:
-    """Load latest user profile from SQLite."""
+def _insert_message(
+    db, base_dir: str, conversation_id: str, user_id: str, type: str, content: str, timestamp: float
+) -> None:
+    """Append one event on an open connection - the caller owns the transaction."""
+    conversation_key = _key(db, base_dir, "conversation_keys", conversation_id)
+    user_key = _key(db, base_dir, "users", user_id)
+    # Sequence assigned inside the insert - atomic under concurrent writers
+    db.execute(
+        """
+        INSERT INTO messages (conversation_key, seq, user_key, type, content, timestamp)
+        SELECT ?, COALESCE(MAX(seq), 0) + 1, ?, ?, ?, ?
+        FROM messages WHERE conversation_key = ?
+        """,
+        (conversation_key, user_key, type, content, timestamp, conversation_key),
+    )
+
+
+def save_usage(
+    conversation_id: str, user_id: str, records: list[dict], base_dir: str = None
+) -> bool:
+    """Append a turn's LLM request records - one transaction for the batch."""
+    if not records:
+        return True
+    try:
+        with DB.connect(base_dir) as db:
+            _insert_usage(db, base_dir, conversation_id, user_id, records)
+        return True
+    except Exception:
+        _forget_keys(base_dir, conversation_id, user_id)
+        return False
+
+
+def _insert_usage(
+    db, base_dir: str, conversation_id: str, user_id: str, records: list[dict]
+) -> None:
+    """Insert usage records on an open connection - the caller owns the transaction."""
+    conversation_key = _key(db, base_dir, "conversation_keys", conversation_id)
+    user_key = _key(db, base_dir, "users", user_id)
+    db.executemany(
+        """
+        INSERT INTO usage (conversation_key, user_key, model, key_index, input_tokens,
+                           output_tokens, cached_tokens, estimated, cost, ttft, latency, timestamp)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+        [
+            (
+                conversation_key,
+                user_key,
+                r["model"],
+                r["key"],
+                r["input"],
+                r["output"],
+                r["cached"],
+                int(r["estimated"]),
+                r["cost"],
+                r["ttft"],
+                r["latency"],
+                r["timestamp"],
+            )
+            for r in records
+        ],
+    )
+
+
+def load_usage(since: float = 0, base_dir: str = None) -> list[dict]:
+    """Usage records newer than a timestamp, oldest first."""
+    with DB.connect(base_dir) as db:
+        rows = db.execute(
+            """
+            SELECT c.name, u.name, model, key_index, input_tokens, output_tokens,
+                   cached_tokens, estimated, cost, ttft, latency, usage.timestamp
+            FROM usage
+            JOIN conversation_keys c ON c.id = usage.conversation_key
+            JOIN users u ON u.id = usage.user_key
+            WHERE usage.timestamp > ?
+            ORDER BY usage.timestamp
+            """,
+            (since,),
+        ).fetchall()
+    return [dict(zip(USAGE_FIELDS, row, strict=True)) for row in rows]
+
+
+def count_user_messages(user_id: str, since: float = 0, base_dir: str = None) -> int:
+    """Count user turns newer than a timestamp - partial user index only."""
+    with DB.connect(base_dir) as db:
+        return db.execute(
+            """
+            SELECT COUNT(*) FROM messages
+            WHERE user_key = (SELECT id FROM users WHERE name = ?)
+            AND type = 'user' AND timestamp > ?
+            """,
+            (user_id, since),
+        ).fetchone()[0]
+
+
+def load_user_messages(
+    user_id: str, since: float = 0, limit: int = -1, base_dir: str = None
+) -> list[str]:
+    """Load a user's turns newer than a timestamp, oldest first."""
+    with DB.connect(base_dir) as db:
+        rows = db.execute(
+            """
+            SELECT content FROM messages
+            WHERE user_key = (SELECT id FROM users WHERE name = ?)
+            AND type = 'user' AND timestamp > ?
+            ORDER BY timestamp ASC
+            LIMIT ?
+            """,
+            (user_id, since, limit),
+        ).fetchall()
+    return [row[0] for row in rows]
+
+
+def search_user_messages(
+    user_id: str,
+    query: str,
+    limit: int = 3,
+    exclude_conversation: str = None,
+    base_dir: str = None,
+) -> list[tuple[str, float, str]]:
+    """Keyword search over a user's turns - (content, timestamp, conversation_id).
+
+    Any keyword matches; ranked by occurrences of the whole query, then recency.
+    """
+    query = query.lower()
+    keywords = query.split()
+    like_clause = " OR ".join("LOWER(m.content) LIKE ?" for _ in keywords)
+
+    with DB.connect(base_dir) as db:
+        rows = db.execute(
+            f"""
+            SELECT m.content, m.timestamp, c.name,
+                   LENGTH(m.content) - LENGTH(REPLACE(LOWER(m.content), ?, '')) AS relevance
+            FROM messages m
+            JOIN conversation_keys c ON c.id = m.conversation_key
+            WHERE m.user_key = (SELECT id FROM users WHERE name = ?)
+            AND m.type = 'user'
+            AND c.name IS NOT ?
+            AND ({like_clause})
+            ORDER BY relevance DESC, m.timestamp DESC
+            LIMIT ?
+            """,
+            [query, user_id, exclude_conversation, *[f"%{k}%" for k in keywords], limit],
+        ).fetchall()
+    return [
+        (content, timestamp, conversation_id) for content, timestamp, conversation_id, _ in rows
+    ]
+
+
+def last_conversation(user_id: str, base_dir: str = None) -> str | None:
+    """Conversation of the user's most recent turn."""
     with DB.connect(base_dir) as db:
         row = db.execute(
-            "SELECT data FROM profiles WHERE user_id = ? ORDER BY version DESC LIMIT 1", (user_id,)
+            """
+            SELECT c.name FROM messages m
+            JOIN conversation_keys c ON c.id = m.conversation_key
+            WHERE m.user_key = (SELECT id FROM users WHERE name = ?) AND m.type = 'user'
+            ORDER BY m.timestamp DESC
+            LIMIT 1
+            """,
+            (user_id,),
         ).fetchone()
-        if row:
-            return json.loads(row[0])
-        return {}
+    return row[0] if row else None
 
 
-def save_profile(user_id: str, profile: dict, base_dir: str = None) -> bool:
-    """Save new user profile version to SQLite."""
-    try:
-        with DB.connect(base_dir) as db:
-            # Get next version atomically
-            current_version = (
+# (base_dir, user_id) -> (version, profile, checked_at)
+_profiles = LRU(PROFILE_CACHE["size"])
+
+
+def _profile_entry(user_id: str, base_dir: str = None) -> tuple[int, dict]:
+    """Latest (version, profile) - memory read within the revalidation window.
+
+    The returned profile is the shared cached instance; copy before mutating.
+    """
+    key = (base_dir, user_id)
+    now = time.monotonic()
+    entry = _profiles.get(key)
+    if entry and now - entry[2] < PROFILE_CACHE["revalidate"]:
+        return entry[0], entry[1]
+
+    with DB.connect(base_dir) as db:
+        if entry:
+            # Cheap index-only check - reload data only if another writer moved on
+            version = (
                 db.execute(
                     "SELECT MAX(version) FROM profiles WHERE user_id = ?", (user_id,)
                 ).fetchone()[0]
                 or 0
             )
+            if version == entry[0]:
+                _profiles.put(key, (version, entry[1], now))
+                return version, entry[1]
+
+        row = db.execute(
+            "SELECT version, data FROM profiles WHERE user_id = ? ORDER BY version DESC LIMIT 1",
+            (user_id,),
+        ).fetchone()
 
-            next_version = current_version + 1
-            profile_json = json.dumps(profile)
-            char_count = len(profile_json)
+    version, profile = (row[0], json.loads(row[1])) if row else (0, {})
+    _profiles.put(key, (version, profile, now))
+    return version, profile
 
-            db.execute(
-                "INSERT INTO profiles (user_id, version, data, created_at, char_count) VALUES (?, ?, ?, ?, ?)",
-                (user_id, next_version, profile_json, time.time(), char_count),
-            )
+
+def profile_version(user_id: str, base_dir: str = None) -> int:
+    """Latest profile version (0 if none) - cached."""
+    return _profile_entry(user_id, base_dir)[0]
+
+
+def load_profile(user_id: str, base_dir: str = None) -> dict:
+    """Load latest user profile - cached, version-checked across processes."""
+    return copy.deepcopy(_profile_entry(user_id, base_dir)[1])
+
+
+def save_profile(user_id: str, profile: dict, base_dir: str = None) -> bool:
+    """Save new user profile version to SQLite."""
+    try:
+        profile_json = json.dumps(profile)
+        with DB.connect(base_dir) as db:
+            version = _insert_profile(db, user_id, profile_json)
+        _cache_profile(base_dir, user_id, version, profile_json)
         return True
     except Exception:
         return False
 
 
+def _insert_profile(db, user_id: str, profile_json: str) -> int:
+    """Append one profile version on an open connection - returns the version."""
+    # Version assigned inside the insert - atomic under concurrent writers
+    cursor = db.execute(
+        """
+        INSERT INTO profiles (user_id, version, data, created_at, char_count)
+        SELECT ?, COALESCE(MAX(version), 0) + 1, ?, ?, ?
+        FROM profiles WHERE user_id = ?
+        """,
+        (user_id, profile_json, time.time(), len(profile_json), user_id),
+    )
+    version = db.execute(
+        "SELECT version FROM profiles WHERE rowid = ?", (cursor.lastrowid,)
+    ).fetchone()[0]
+
+    # Periodic compaction - bounded per-user delete on the PK index
+    if version % PROFILE_RETENTION["compact_every"] == 0:
+        _prune_profiles(db, user_id)
+    return version
+
+
+def _cache_profile(base_dir: str, user_id: str, version: int, profile_json: str) -> None:
+    """Publish a committed profile version to the latest-profile cache."""
+    _profiles.put((base_dir, user_id), (version, json.loads(profile_json), time.monotonic()))
+
+
+def _prune_profiles(
+    db, user_id: str = None, keep_versions: int = None, keep_days: float = None
+) -> int:
+    """Delete up to one batch of profile versions outside both retention windows.
+
+    All users if user_id is None - callers loop until a short batch.
+    """
+    keep_versions = PROFILE_RETENTION["keep_versions"] if keep_versions is None else keep_versions
+    keep_days = PROFILE_RETENTION["keep_days"] if keep_days is None else keep_days
+    cutoff = time.time() - keep_days * 86400
+
+    query = """
+        SELECT rowid FROM profiles
+        WHERE created_at < ?
+        AND version <= (
+            SELECT MAX(version) FROM profiles latest WHERE latest.user_id = profiles.user_id
+        ) - ?
+    """
+    params = [cutoff, keep_versions]
+    if user_id:
+        query += " AND user_id = ?"
+        params.append(user_id)
+    query += " LIMIT ?"
+    params.append(PROFILE_RETENTION["batch"])
+
+    return db.execute(f"DELETE FROM profiles WHERE rowid IN ({query})", params).rowcount
+
+
+def compact_profiles(
+    base_dir: str = None, keep_versions: int = None, keep_days: float = None
+) -> int:
+    """Apply profile retention to every user - returns versions deleted.
+
+    One transaction per batch, so saves interleave with a long compaction.
+    """
+    total = 0
+    while True:
+        with DB.connect(base_dir) as db:
+            deleted = _prune_profiles(db, keep_versions=keep_versions, keep_days=keep_days)
+        total += deleted
+        if deleted < PROFILE_RETENTION["batch"]:
+            return total
+
+
+def vacuum(base_dir: str = None) -> None:
+    """Return free pages to the filesystem.
+
+    Incremental databases release freelist pages in place; legacy databases are
+    converted to incremental auto-vacuum by one full VACUUM.
+    """
+    db = DB.connect(base_dir)
+    try:
+        if db.execute("PRAGMA auto_vacuum").fetchone()[0] == 2:
+            db.execute("PRAGMA incremental_vacuum").fetchall()
+        else:
+            db.execute("PRAGMA auto_vacuum = INCREMENTAL")
+            db.execute("VACUUM")
+        db.commit()
+    finally:
+        db.close()
+
+
+def clear_profile_cache() -> None:
+    """Drop cached profiles and interned ids (e.g. after the database file is removed)."""
+    _profiles.clear()
+    _keys.clear()
+
+
 # Storage implementation
 
 
@@ -171,26 +631,238 @@ class SQLite:
     def __init__(self, base_dir: str = None):
         self.base_dir = base_dir
 
-    async def save_message(
+    def save_message(
         self, conversation_id: str, user_id: str, type: str, content: str, timestamp: float = None
     ) -> bool:
         """Save single message to conversation."""
         return save_message(conversation_id, user_id, type, content, self.base_dir, timestamp)
 
-    async def load_messages(
-        self, conversation_id: str, include: list[str] = None, exclude: list[str] = None
+    def load_messages(
+        self,
+        conversation_id: str,
+        include: list[str] = None,
+        exclude: list[str] = None,
+        limit: int = None,
     ) -> list[dict]:
         """Load conversation messages with optional type filtering."""
-        return load_messages(conversation_id, self.base_dir, include, exclude)
+        return load_messages(conversation_id, self.base_dir, include, exclude, limit)
+
+    def count_user_messages(self, user_id: str, since: float = 0) -> int:
+        """Count a user's turns newer than a timestamp."""
+        return count_user_messages(user_id, since, self.base_dir)
+
+    def load_user_messages(self, user_id: str, since: float = 0, limit: int = -1) -> list[str]:
+        """Load a user's turns newer than a timestamp, oldest first."""
+        return load_user_messages(user_id, since, limit, self.base_dir)
+
+    def search_user_messages(
+        self, user_id: str, query: str, limit: int = 3, exclude_conversation: str = None
+    ) -> list[tuple[str, float, str]]:
+        """Keyword search over a user's turns."""
+        return search_user_messages(user_id, query, limit, exclude_conversation, self.base_dir)
+
+    def save_usage(self, conversation_id: str, user_id: str, records: list[dict]) -> bool:
+        """Append a turn's LLM request records."""
+        return save_usage(conversation_id, user_id, records, self.base_dir)
+
+    def load_usage(self, since: float = 0) -> list[dict]:
+        """Usage records newer than a timestamp, oldest first."""
+        return load_usage(since, self.base_dir)
 
-    async def save_profile(self, user_id: str, profile: dict) -> bool:
+    def save_profile(self, user_id: str, profile: dict) -> bool:
         """Save user profile (with embedded metadata)."""
         return save_profile(user_id, profile, self.base_dir)
 
-    async def load_profile(self, user_id: str) -> dict:
+    def load_profile(self, user_id: str) -> dict:
         """Load latest user profile."""
         return load_profile(user_id, self.base_dir)
 
+    def profile_version(self, user_id: str) -> int:
+        """Latest profile version (0 if none)."""
+        return profile_version(user_id, self.base_dir)
+
+
+class _Log:
+    """One conversation - parallel append-only columns, types interned to small ints."""
+
+    __slots__ = ("types", "contents")
+
+    def __init__(self):
+        self.types = array("H")
+        self.contents: list[str] = []
+
+
+class _Turns:
+    """One user's turns - parallel columns kept in timestamp order."""
+
+    __slots__ = ("timestamps", "contents", "conversations")
+
+    def __init__(self):
+        self.timestamps = array("d")
+        self.contents: list[str] = []
+        self.conversations: list[str] = []
+
+    def add(self, timestamp: float, content: str, conversation_id: str) -> None:
+        # O(1) append for in-order turns; out-of-order timestamps are inserted in place
+        if not self.timestamps or timestamp >= self.timestamps[-1]:
+            i = len(self.timestamps)
+        else:
+            i = bisect.bisect_right(self.timestamps, timestamp)
+        self.timestamps.insert(i, timestamp)
+        self.contents.insert(i, content)
+        self.conversations.insert(i, conversation_id)
+
+    def since(self, timestamp: float) -> int:
+        """Index of the first turn newer than timestamp."""
+        return bisect.bisect_right(self.timestamps, timestamp)
+
+
+class Memory:
+    """In-process storage - nothing touches disk.
+
+    Zero-I/O backend for tests, benchmarks and short-lived stateless workers.
+    Appends are O(1); `load_messages(limit=k)` reads only the conversation tail.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._type_ids: dict[str, int] = {}
+        self._type_names: list[str] = []
+        self._logs: dict[str, _Log] = {}
+        self._turns: dict[str, _Turns] = {}
+        self._profiles: dict[str, list[str]] = {}  # user_id -> JSON per version
+        self._usage: list[dict] = []
+
+    def _type_id(self, type: str) -> int:
+        type_id = self._type_ids.get(type)
+        if type_id is None:
+            type_id = self._type_ids[type] = len(self._type_names)
+            self._type_names.append(str(type))
+        return type_id
+
+    def save_message(
+        self, conversation_id: str, user_id: str, type: str, content: str, timestamp: float = None
+    ) -> bool:
+        """Save single message to conversation - O(1) append."""
+        if timestamp is None:
+            timestamp = time.time()
+
+        with self._lock:
+            log = self._logs.get(conversation_id)
+            if log is None:
+                log = self._logs[conversation_id] = _Log()
+            log.types.append(self._type_id(type))
+            log.contents.append(content)
+
+            if type == "user":
+                turns = self._turns.get(user_id)
+                if turns is None:
+                    turns = self._turns[user_id] = _Turns()
+                turns.add(timestamp, content, conversation_id)
+        return True
+
+    def load_messages(
+        self,
+        conversation_id: str,
+        include: list[str] = None,
+        exclude: list[str] = None,
+        limit: int = None,
+    ) -> list[dict]:
+        """Load conversation messages in order - O(k) for the newest k unfiltered."""
+        with self._lock:
+            log = self._logs.get(conversation_id)
+            if log is None:
+                return []
+
+            # Same precedence as SQL filtering - include wins over exclude
+            wanted = {self._type_ids.get(t) for t in include} if include else None
+            unwanted = {self._type_ids.get(t) for t in exclude} if exclude and not include else ()
+
+            count = len(log.contents)
+            indexes = range(count) if limit is None else range(count - 1, -1, -1)
+            rows = []
+            for i in indexes:
+                if limit is not None and len(rows) >= limit:
+                    break
+                type_id = log.types[i]
+                if (wanted is None or type_id in wanted) and type_id not in unwanted:
+                    rows.append({"type": self._type_names[type_id], "content": log.contents[i]})
+
+        if limit is not None:
+            rows.reverse()
+        return rows
+
+    def count_user_messages(self, user_id: str, since: float = 0) -> int:
+        """Count a user's turns newer than a timestamp - O(log n)."""
+        with self._lock:
+            turns = self._turns.get(user_id)
+            return len(turns.timestamps) - turns.since(since) if turns else 0
+
+    def load_user_messages(self, user_id: str, since: float = 0, limit: int = -1) -> list[str]:
+        """Load a user's turns newer than a timestamp, oldest first."""
+        with self._lock:
+            turns = self._turns.get(user_id)
+            if not turns:
+                return []
+            start = turns.since(since)
+            end = len(turns.contents) if limit < 0 else start + limit
+            return turns.contents[start:end]
+
+    def search_user_messages(
+        self, user_id: str, query: str, limit: int = 3, exclude_conversation: str = None
+    ) -> list[tuple[str, float, str]]:
+        """Keyword search over a user's turns - same ranking as SQLite."""
+        query = query.lower()
+        keywords = query.split()
+
+        with self._lock:
+            turns = self._turns.get(user_id)
+            if not turns:
+                return []
+            scored = []
+            for content, timestamp, conversation_id in zip(
+                turns.contents, turns.timestamps, turns.conversations, strict=True
+            ):
+                if conversation_id == exclude_conversation:
+                    continue
+                lowered = content.lower()
+                if any(keyword in lowered for keyword in keywords):
+                    relevance = lowered.count(query) * len(query)
+                    scored.append((relevance, timestamp, content, conversation_id))
+
+        scored.sort(key=lambda match: (match[0], match[1]), reverse=True)
+        return [(content, timestamp, conv) for _, timestamp, content, conv in scored[:limit]]
+
+    def save_usage(self, conversation_id: str, user_id: str, records: list[dict]) -> bool:
+        """Append a turn's LLM request records."""
+        ids = {"conversation_id": conversation_id, "user_id": user_id}
+        with self._lock:
+            self._usage.extend({**record, **ids} for record in records)
+        return True
+
+    def load_usage(self, since: float = 0) -> list[dict]:
+        """Usage records newer than a timestamp, oldest first."""
+        with self._lock:
+            records = [dict(r) for r in self._usage if r["timestamp"] > since]
+        return sorted(records, key=lambda r: r["timestamp"])
+
+    def save_profile(self, user_id: str, profile: dict) -> bool:
+        """Save new user profile version."""
+        with self._lock:
+            self._profiles.setdefault(user_id, []).append(json.dumps(profile))
+        return True
+
+    def load_profile(self, user_id: str) -> dict:
+        """Load latest user profile - a fresh copy."""
+        with self._lock:
+            versions = self._profiles.get(user_id)
+            return json.loads(versions[-1]) if versions else {}
+
+    def profile_version(self, user_id: str) -> int:
+        """Latest profile version (0 if none)."""
+        with self._lock:
+            return len(self._profiles.get(user_id, ()))
+
 
 # Default storage instance
 default_storage = SQLite()
@@ -200,7 +872,13 @@ def clear_messages(conversation_id: str, base_dir: str = None) -> bool:
     """Clear conversation for testing."""
     try:
         with DB.connect(base_dir) as db:
-            db.execute("DELETE FROM conversations WHERE conversation_id = ?", (conversation_id,))
+            db.execute(
+                """
+                DELETE FROM messages
+                WHERE conversation_key = (SELECT id FROM conversation_keys WHERE name = ?)
+                """,
+                (conversation_id,),
+            )
         return True
     except Exception:
         return False
@@ -1,4 +1,17 @@
-"""Token counting and cost analysis."""
+"""Token counting and cost analysis.
+
+- Encoders: one tiktoken encoder per model, built once per process
+- Meter: counts a streamed response chunk by chunk, preferring provider-reported usage
+- Metrics: per-turn totals surface as a "metrics" event, not stdout
+- Ledger: one record per LLM request, persisted to the usage table after the turn
+"""
+
+import time
+from dataclasses import dataclass, fields, replace
+from functools import lru_cache
+
+from ..core.result import Result
+from .logger import logger
 
 try:
     import tiktoken
@@ -34,20 +47,30 @@ PRICING = {
 }
 
 
+@lru_cache(maxsize=32)
+def _encoder(model: str):
+    """Cached tiktoken encoder for a model - None means approximate."""
+    if not TIKTOKEN_AVAILABLE:
+        return None
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        return None  # Unknown model
+    except Exception as e:
+        # Encoding files unavailable (offline) - approximate rather than retry per call
+        logger.debug(f"⚠️ No tokenizer for {model}: {e}")
+        return None
+
+
 def count_tokens(text: str, model: str) -> int:
     if not text:
         return 0
 
-    if not TIKTOKEN_AVAILABLE:
+    enc = _encoder(model)
+    if enc is None:
         # Fallback approximation: ~4 chars per token
         return len(text) // 4
-
-    try:
-        enc = tiktoken.encoding_for_model(model)
-        return len(enc.encode(text))
-    except KeyError:
-        # Fallback approximation for unknown models
-        return len(text) // 4
+    return len(enc.encode(text, disallowed_special=()))
 
 
 def calculate_cost(input_tokens: int, output_tokens: int, model: str) -> float:
@@ -88,8 +111,6 @@ class Tokens:
     def add_output(self, text: str):
         tokens = count_tokens(text, self.model)
         self.output += tokens
-        cost = self.cost()
-        print(f"+{tokens} | Total: {self.total()} | ${cost:.4f}")
         return tokens
 
     def total(self):
@@ -110,3 +131,146 @@ class Tokens:
             "premium": stream_cost / batch_cost if batch_cost > 0 else 0,
             "savings": batch_cost - stream_cost,
         }
+
+
+def _priced(input_tokens: int, output_tokens: int, model: str) -> float:
+    """Cost, or 0.0 for models without pricing - metering never raises."""
+    return calculate_cost(input_tokens, output_tokens, model) if model in PRICING else 0.0
+
+
+@dataclass(frozen=True)
+class Usage:
+    """Request facts reported in-band - yielded as stream items, merged by the meter.
+
+    Providers report token counts when the request finishes; the rotation layer
+    stamps the API key index when it starts. Unset fields stay None.
+    """
+
+    input: int | None = None
+    output: int | None = None
+    cached: int | None = None  # Input tokens served from the provider's prompt cache
+    key: int | None = None  # Index of the rotated API key that served the request
+
+    def merge(self, other: "Usage") -> "Usage":
+        """Fields set on other win."""
+        return replace(
+            self,
+            **{
+                f.name: getattr(other, f.name)
+                for f in fields(other)
+                if getattr(other, f.name) is not None
+            },
+        )
+
+
+# Held-back text without a whitespace boundary is encoded anyway past this size
+MAX_TAIL = 1024
+
+
+class _Counter:
+    """Incremental token count over streamed chunks.
+
+    BPE merges never cross the pre-tokenizer's whitespace splits, so text up to the
+    last whitespace is encoded as it arrives and only the trailing partial word is
+    held back for the next chunk.
+    """
+
+    def __init__(self, model: str):
+        self.enc = _encoder(model)
+        self.tokens = 0
+        self.chars = 0
+        self.tail = ""
+
+    def feed(self, text: str) -> None:
+        if self.enc is None:
+            self.chars += len(text)
+            return
+        self.tail += text
+        cut = max(self.tail.rfind(" "), self.tail.rfind("\n"))
+        if cut <= 0 and len(self.tail) < MAX_TAIL:
+            return
+        if cut <= 0:
+            cut = len(self.tail)
+        self.tokens += len(self.enc.encode(self.tail[:cut], disallowed_special=()))
+        self.tail = self.tail[cut:]
+
+    def close(self) -> int:
+        if self.enc is None:
+            return self.chars // 4
+        self.tokens += len(self.enc.encode(self.tail, disallowed_special=()))
+        self.tail = ""
+        return self.tokens
+
+
+class Meter(Tokens):
+    """Token accounting for one agent turn across its LLM requests."""
+
+    def __init__(self, model: str):
+        super().__init__(model)
+        self.requests = 0
+        self.started = time.time()
+        self.records: list[dict] = []  # Per-request ledger rows
+
+    async def wrap(self, messages: list[dict], tokens, model: str = None):
+        """Meter one LLM token stream - Usage items are consumed, the rest pass through.
+
+        Prompt and output are estimated locally; provider usage, when reported,
+        replaces both estimates for the request. model is the one serving this request
+        when it is not the turn's default (resume runs on the LLM's stream_model).
+        """
+        model = model or self.model
+        self.requests += 1
+        counter = _Counter(model)
+        usage = Usage()
+        start = time.time()
+        first = None
+        try:
+            async for item in tokens:
+                value = item.unwrap() if isinstance(item, Result) and item.success else item
+                if isinstance(value, Usage):
+                    usage = usage.merge(value)
+                    continue
+                if isinstance(value, str):
+                    if first is None:
+                        first = time.time()
+                    counter.feed(value)
+                yield item
+        finally:
+            estimated = usage.input is None
+            if estimated:
+                input_tokens = sum(
+                    count_tokens(m["content"], model)
+                    for m in messages
+                    if isinstance(m.get("content"), str)
+                )
+                output_tokens = counter.close()
+            else:
+                input_tokens, output_tokens = usage.input, usage.output or 0
+            self.input += input_tokens
+            self.output += output_tokens
+
+            self.records.append(
+                {
+                    "model": model,
+                    "key": usage.key,
+                    "input": input_tokens,
+                    "output": output_tokens,
+                    "cached": usage.cached or 0,
+                    "estimated": estimated,
+                    "cost": _priced(input_tokens, output_tokens, model),
+                    "ttft": first - start if first else None,
+                    "latency": time.time() - start,
+                    "timestamp": start,
+                }
+            )
+
+    def event(self) -> dict:
+        """Turn totals as a "metrics" stream event."""
+        return {
+            "type": "metrics",
+            "input_tokens": self.input,
+            "output_tokens": self.output,
+            "cost": sum(record["cost"] for record in self.records),  # Each at its model's rate
+            "duration": time.time() - self.started,
+            "requests": self.requests,
+        }
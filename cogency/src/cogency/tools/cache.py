@@ -0,0 +1,77 @@
+"""Tool result cache - repeated idempotent calls served without re-running the tool.
+
+Opt-in with Config.cache:
+- Key: tool name + canonical args (sorted JSON, injected storage left out)
+- Policy: each tool declares what a result depends on via Tool.cache_policy(args) -
+  a state fingerprint (file mtime/size) checked on every hit, and/or a TTL (web tools)
+- Invalidation: a call to a tool with side effects (no policy, not parallel-safe)
+  drops every entry, so reads after a write or shell command always run
+- Bounded: LRU eviction, hit/miss/eviction counters in stats()
+"""
+
+import json
+import threading
+import time
+
+from ..lib.cache import LRU
+from .constants import TOOL_CACHE_SIZE
+
+
+class ResultCache:
+    """Agent-facing tool results keyed by call, validated against the tool's policy."""
+
+    def __init__(self, maxsize: int = TOOL_CACHE_SIZE):
+        self._entries = LRU(maxsize)
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0, "invalidations": 0}
+
+    @staticmethod
+    def key(name: str, args: dict) -> str | None:
+        """Canonical call key - None when the args cannot be serialized."""
+        try:
+            canonical = {k: v for k, v in args.items() if k != "storage"}
+            return f"{name}:{json.dumps(canonical, sort_keys=True, separators=(',', ':'))}"
+        except (TypeError, ValueError):
+            return None
+
+    def get(self, key: str, policy: dict) -> str | None:
+        """Cached result if its state still matches and it has not expired."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            state, expires, result = entry
+            if state == policy.get("state") and (expires is None or time.time() < expires):
+                self._count("hits")
+                return result
+            self._entries.pop(key)  # Stale - the tool runs again
+        self._count("misses")
+        return None
+
+    def put(self, key: str, policy: dict, result: str) -> None:
+        ttl = policy.get("ttl")
+        expires = time.time() + ttl if ttl else None
+        evicted = self._entries.put(key, (policy.get("state"), expires, result))
+        if evicted:
+            self._count("evictions", len(evicted))
+
+    def invalidate(self) -> None:
+        """Drop everything - something with side effects just ran."""
+        if len(self._entries):
+            self._entries.clear()
+            self._count("invalidations")
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {**self._stats, "size": len(self._entries)}
+
+    def clear(self) -> None:
+        self._entries.clear()
+        with self._lock:
+            for name in self._stats:
+                self._stats[name] = 0
+
+    def _count(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            self._stats[name] += amount
+
+
+results = ResultCache()
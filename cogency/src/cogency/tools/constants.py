@@ -12,11 +12,46 @@ LIST_DEFAULT_DEPTH = 2  # ✅ ACTIVE: Default directory traversal depth
 LIST_SHOW_HIDDEN = False
 LIST_SHOW_DETAILS = True
 LIST_DEFAULT_PATTERN = "*"
+LIST_MAX_DEPTH = 6  # Deepest listing an agent may request
+LIST_MAX_ENTRIES = 500  # Files listed before traversal stops
+LIST_CACHE_DIRS = 1024  # Directory snapshots kept, revalidated by directory mtime
+
+# File Reading Performance Tuning
+READ_MAX_BYTES = 64 * 1024  # ✅ ACTIVE: Output cap per read - larger files are paged
+READ_SNIFF_BYTES = 8192  # Leading bytes checked for binary content
+READ_INDEX_BLOCK = 1 << 20  # Bytes per block in the newline index
+READ_INDEX_FILES = 32  # Newline indexes kept, keyed by (path, mtime, size)
+READ_MAX_MATCHES = 50  # Search matches returned before the scan stops
+READ_MAX_CONTEXT = 10  # Context lines around each search match
+
+# File Writing - temp file + os.replace, never a truncated original
+WRITE_FSYNC = True  # ✅ ACTIVE: fsync file and directory before returning (survives power loss)
+WRITE_BLOCK = 1 << 20  # Bytes copied per chunk when an edit streams a file through
+FILE_MAX_BATCH = 20  # Files (read/write) or replacements (edit) accepted in one call
+
+# PARALLEL EXECUTION (Config.parallel)
+PARALLEL_TOOL_LIMIT = 3  # ✅ ACTIVE: Max concurrent tool execution
+PARALLEL_TOOL_TIMEOUT = 30  # Seconds a parallel branch may run before its result is dropped
+
+# SHELL WORKER (SystemShell(persistent=True))
+SHELL_WORKER_MAX = 8  # Live workers, one per conversation - least recently used closed first
+SHELL_WORKER_IDLE = 300  # Seconds without a command before a worker exits on its own
+SHELL_WORKER_CPU = 10  # CPU seconds per command (RLIMIT_CPU) - 0: unlimited
+SHELL_WORKER_MEMORY = 4 << 30  # Address space per command in bytes (RLIMIT_AS) - 0: unlimited
+
+# CPU-BOUND WORK (core.execute.offload)
+CPU_POOL_WORKERS = 2  # ✅ ACTIVE: Worker processes - 0 runs offloaded work in a thread instead
+CPU_POOL_QUEUE = 8  # Offloaded calls in flight before the next one waits for a slot
+CPU_POOL_WARM = ("trafilatura",)  # Modules each worker imports on start, off the first call
+
+# RESULT CACHE (Config.cache)
+TOOL_CACHE_SIZE = 256  # Tool results kept, least recently used evicted first
+WEB_CACHE_TTL = 300  # Seconds a search or scrape result is reused
+LIST_CACHE_TTL = 10  # Seconds a listing is reused - only the top directory's mtime is checked
 
 # Future Performance Features (commented until implemented)
 # SCRAPE_TIMEOUT = 10         # HTTP request timeout (trafilatura doesn't support)
 # SCRAPE_PREVIEW_CHARS = 500  # Quick content previews
 # FILE_PREVIEW_LIMIT = 5000   # File content truncation
 # SHELL_TIMEOUT = 30          # System command timeout
-# PARALLEL_TOOL_LIMIT = 3     # Max concurrent tool execution
 # RESEARCH_MODE_SCRAPES = 2   # Limit deep research scraping
@@ -1,11 +1,34 @@
-"""File editing tool."""
+"""File editing tool.
 
+Crash-safe on large files: the match is found and verified unique in a memory map,
+then the file is streamed through a temp file around it and swapped in with os.replace.
+Batches: a list of {old, new} edits is verified together and applied in the same single
+pass - all of them or none.
+"""
+
+import asyncio
+import mmap
+import os
 from pathlib import Path
 
 from ...core.protocols import Tool, ToolResult
 from ...core.result import Err, Ok, Result
+from ..constants import FILE_MAX_BATCH, WRITE_BLOCK
 from ..security import safe_path, validate_input
-from .utils import categorize_file, format_size
+from .utils import atomic_write, categorize_file, format_size
+
+
+class _Empty:
+    """Stand-in map for an empty file - mmap refuses zero-length files."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def find(self, needle: bytes, start: int = 0) -> int:
+        return -1
 
 
 class FileEdit(Tool):
@@ -21,19 +44,41 @@ class FileEdit(Tool):
 
     @property
     def schema(self) -> dict:
-        return {"file": {}, "old": {}, "new": {}}
+        return {
+            "file": {},
+            "old": {"optional": True},
+            "new": {"optional": True},
+            "edits": {"type": "array", "optional": True},  # [{"old": ..., "new": ...}]
+        }
 
     async def execute(
-        self, file: str, old: str, new: str, sandbox: bool = True
+        self,
+        file: str,
+        old: str = None,
+        new: str = None,
+        edits: list = None,
+        sandbox: bool = True,
+        security: tuple[str, ...] = None,
+        **kwargs,
     ) -> Result[ToolResult]:
         if not file:
             return Err("File cannot be empty")
 
-        if not old:
-            return Err("Old text cannot be empty")
-
-        if not validate_input(new):
-            return Err("Content contains unsafe patterns")
+        if edits is None:
+            edits = [{"old": old, "new": new}]
+        if not isinstance(edits, list) or not edits:
+            return Err("Edits must be a non-empty list of {old, new}")
+        if len(edits) > FILE_MAX_BATCH:
+            return Err(f"Too many edits ({len(edits)}) - at most {FILE_MAX_BATCH} per call")
+
+        replacements = []
+        for i, edit in enumerate(edits, 1):
+            label = f"Edit {i}: " if len(edits) > 1 else ""
+            if not isinstance(edit, dict) or not edit.get("old"):
+                return Err(f"{label}Old text cannot be empty")
+            if not validate_input(edit.get("new") or "", security):
+                return Err(f"{label}Content contains unsafe patterns")
+            replacements.append((edit["old"], edit.get("new") or ""))
 
         try:
             if sandbox:
@@ -48,27 +93,8 @@ class FileEdit(Tool):
             if not file_path.exists():
                 return Err(f"File '{file}' does not exist")
 
-            with open(file_path, encoding="utf-8") as f:
-                content = f.read()
-
-            # Count matches for intelligent feedback
-            matches = content.count(old)
-
-            if matches == 0:
-                return Err(f"Text not found: '{old}'\n* Check exact spelling, whitespace, and case")
-
-            if matches > 1:
-                return self._handle_multiple_matches(content, old, matches)
-
-            # Single match - perform replacement
-            new_content = content.replace(old, new, 1)
-
-            # Write back
-            with open(file_path, "w", encoding="utf-8") as f:
-                f.write(new_content)
-
-            outcome = f"File edited: {file} (1 replacement)"
-            return Ok(ToolResult(outcome))
+            # Locate and splice off the event loop - the file is never held in memory
+            return await asyncio.to_thread(self._edit, file, file_path, replacements)
 
         except ValueError as e:
             return Err(f"Security violation: {str(e)}")
@@ -97,32 +123,97 @@ class FileEdit(Tool):
 
         return f"{header}\n{diff}"
 
-    def _handle_multiple_matches(self, content: str, old: str, matches: int) -> Result[str]:
+    def _edit(
+        self, file: str, file_path: Path, replacements: list[tuple[str, str]]
+    ) -> Result[ToolResult]:
+        """Verify every edit matches once, then stream the file through all of them at once."""
+        spans = []  # (start, end, new bytes, edit number)
+
+        with open(file_path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if size else _Empty() as mm:
+                for i, (old, new) in enumerate(replacements, 1):
+                    label = f"Edit {i}: " if len(replacements) > 1 else ""
+                    needle = old.encode("utf-8")
+                    positions = self._find(mm, needle)
+                    if not positions:
+                        return Err(
+                            f"{label}Text not found: '{old}'\n"
+                            "* Check exact spelling, whitespace, and case"
+                        )
+                    if len(positions) > 1:
+                        result = self._handle_multiple_matches(mm, old, positions)
+                        return Err(f"{label}{result.error}")
+                    spans.append((positions[0], positions[0] + len(needle), new.encode("utf-8"), i))
+
+        spans.sort()
+        for (_, end, _, a), (start, _, _, b) in zip(spans, spans[1:], strict=False):
+            if start < end:
+                return Err(f"Edits {min(a, b)} and {max(a, b)} overlap - combine them into one")
+
+        # Copy around every match; the original stays intact until os.replace
+        with atomic_write(file_path) as out, open(file_path, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                pos = 0
+                for start, end, new, _ in spans:
+                    self._copy(mm, pos, start, out)
+                    out.write(new)
+                    pos = end
+                self._copy(mm, pos, len(mm), out)
+
+        count = len(spans)
+        outcome = f"File edited: {file} ({count} replacement{'s' if count > 1 else ''})"
+        return Ok(ToolResult(outcome))
+
+    def _find(self, mm, needle: bytes) -> list[int]:
+        """Non-overlapping match offsets, like str.count."""
+        positions = []
+        pos = mm.find(needle)
+        while pos != -1:
+            positions.append(pos)
+            pos = mm.find(needle, pos + len(needle))
+        return positions
+
+    def _copy(self, mm, start: int, end: int, out) -> None:
+        for pos in range(start, end, WRITE_BLOCK):
+            out.write(mm[pos : min(end, pos + WRITE_BLOCK)])
+
+    def _handle_multiple_matches(self, mm, old: str, positions: list[int]) -> Result[str]:
         """Handle multiple matches with context for agent guidance."""
-        lines = content.split("\n")
         match_contexts = []
-
-        # Find line numbers where matches occur
-        for i, line in enumerate(lines, 1):
-            if old in line:
-                # Show context around the match
-                start_ctx = max(0, i - 2)
-                end_ctx = min(len(lines), i + 1)
-                context_lines = lines[start_ctx:end_ctx]
-
-                # Highlight the matching line
-                context = []
-                for j, ctx_line in enumerate(context_lines):
-                    line_num = start_ctx + j + 1
-                    prefix = ">" if line_num == i else " "
-                    context.append(f"{prefix} {line_num:3d}: {ctx_line}")
-
-                match_contexts.append("\n".join(context))
-
-                if len(match_contexts) >= 5:  # Limit to first 5 matches
-                    break
-
-        error_msg = f"Found {matches} matches for '{old}'. Be more specific:\n\n"
+        line_num = 1
+        counted = 0
+
+        # Line numbers where the first matches start, counted incrementally
+        for pos in positions[:5]:  # Limit to first 5 matches
+            line_start = mm.rfind(b"\n", 0, pos) + 1
+            for block in range(counted, line_start, WRITE_BLOCK):
+                line_num += mm[block : min(line_start, block + WRITE_BLOCK)].count(b"\n")
+            counted = line_start
+
+            # Show context around the match - the line before and after
+            first = line_start
+            if line_start:
+                first = mm.rfind(b"\n", 0, line_start - 1) + 1
+            last = line_start
+            for _ in range(2):
+                newline = mm.find(b"\n", last)
+                last = len(mm) if newline == -1 else newline + 1
+            context_lines = mm[first:last].decode("utf-8", errors="replace").split("\n")
+            if context_lines and not context_lines[-1]:
+                context_lines.pop()
+
+            # Highlight the matching line
+            offset = line_num - (1 if first < line_start else 0)
+            context = []
+            for j, ctx_line in enumerate(context_lines):
+                number = offset + j
+                prefix = ">" if number == line_num else " "
+                context.append(f"{prefix} {number:3d}: {ctx_line}")
+
+            match_contexts.append("\n".join(context))
+
+        error_msg = f"Found {len(positions)} matches for '{old}'. Be more specific:\n\n"
         error_msg += "\n\n".join([f"Match {i + 1}:\n{ctx}" for i, ctx in enumerate(match_contexts)])
         error_msg += "\n\n* Include more surrounding context to make the match unique"
 
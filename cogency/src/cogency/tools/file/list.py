@@ -1,11 +1,70 @@
-"""File listing tool."""
-
+"""File listing tool.
+
+Bounded and cheap on large sandboxes:
+- scandir: entry types come from the directory read, one stat per file for its size
+- Snapshots: each directory's entries cached and revalidated by the directory's mtime
+  (adding, removing or renaming entries bumps it; rewriting a file in place does not,
+  so a size can lag until the directory next changes)
+- Bounds: depth and entry caps, traversal stops as soon as the cap is hit
+- Glob: fnmatch semantics; a pattern without wildcards matches as a substring
+- Off the event loop: the walk runs in a worker thread
+- Cache: a listing is reusable briefly while the top directory's mtime holds (Config.cache)
+"""
+
+import asyncio
+import os
+from fnmatch import fnmatch
 from pathlib import Path
 
 from ...core.protocols import Tool, ToolResult
 from ...core.result import Err, Ok, Result
+from ...lib.cache import LRU
+from ..constants import (
+    LIST_CACHE_DIRS,
+    LIST_CACHE_TTL,
+    LIST_DEFAULT_DEPTH,
+    LIST_DEFAULT_PATTERN,
+    LIST_MAX_DEPTH,
+    LIST_MAX_ENTRIES,
+    LIST_SHOW_DETAILS,
+    LIST_SHOW_HIDDEN,
+)
 from .utils import categorize_file, format_size
 
+_snapshots = LRU(LIST_CACHE_DIRS)
+
+
+def _entries(path: str) -> list[tuple[str, bool, int]]:
+    """(name, is_dir, size) for a directory, sorted - served from cache while mtime holds."""
+    path = os.path.abspath(path)
+    mtime = os.stat(path).st_mtime_ns
+    cached = _snapshots.get(path)
+    if cached and cached[0] == mtime:
+        return cached[1]
+
+    entries = []
+    with os.scandir(path) as it:
+        for entry in it:
+            try:
+                if entry.is_dir():
+                    entries.append((entry.name, True, 0))
+                elif entry.is_file():
+                    entries.append((entry.name, False, entry.stat().st_size))
+            except OSError:
+                continue  # Vanished or unreadable mid-scan
+    entries.sort()
+    _snapshots.put(path, (mtime, entries))
+    return entries
+
+
+def _matcher(pattern: str):
+    if not pattern or pattern == "*":
+        return lambda name: True
+    if any(c in pattern for c in "*?["):
+        return lambda name: fnmatch(name, pattern)
+    needle = pattern.lower()
+    return lambda name: needle in name.lower()
+
 
 class FileList(Tool):
     """File listing tool."""
@@ -19,10 +78,32 @@ class FileList(Tool):
         return "List files"
 
     @property
-    def schema(self) -> dict:
-        return {"path": {"optional": True}, "pattern": {"optional": True}}
+    def parallel(self) -> bool:
+        return True
 
-    async def execute(self, path: str = ".", pattern: str = "*", **kwargs) -> Result[ToolResult]:
+    @property
+    def schema(self) -> dict:
+        return {
+            "path": {"optional": True},
+            "pattern": {"optional": True},
+            "depth": {"type": "integer", "optional": True},
+        }
+
+    def cache_policy(self, args: dict) -> dict | None:
+        # Nested changes don't touch the top mtime - the short TTL bounds how stale they get
+        target = Path(".sandbox") / (args.get("path") or ".")
+        try:
+            return {"state": target.stat().st_mtime_ns, "ttl": LIST_CACHE_TTL}
+        except OSError:
+            return None
+
+    async def execute(
+        self,
+        path: str = ".",
+        pattern: str = LIST_DEFAULT_PATTERN,
+        depth: int = LIST_DEFAULT_DEPTH,
+        **kwargs,
+    ) -> Result[ToolResult]:
         """List files with clean tree structure and metadata."""
         try:
             # Determine target directory
@@ -34,13 +115,21 @@ class FileList(Tool):
             if not target.exists():
                 return Err(f"Directory '{path}' does not exist")
 
-            # Build clean tree structure
-            tree = self._build_tree(target, pattern, depth=2)
-            if not tree:
+            # Build clean tree structure - off the event loop
+            depth = max(1, min(depth or LIST_DEFAULT_DEPTH, LIST_MAX_DEPTH))
+            budget = [LIST_MAX_ENTRIES]
+            tree = await asyncio.to_thread(
+                self._build_tree, str(target), _matcher(pattern), depth, 0, budget
+            )
+            if not tree["dirs"] and not tree["files"]:
                 return Err("No files found")
 
             # Format as clean tree
             content = self._format_tree(tree)
+            if budget[0] < 0:
+                content += (
+                    f"\n\n[Listing stopped at {LIST_MAX_ENTRIES} files - narrow path or pattern]"
+                )
 
             # Format outcome
             file_count = self._count_files(tree)
@@ -50,54 +139,46 @@ class FileList(Tool):
         except Exception as e:
             return Err(f"Error listing files: {str(e)}")
 
-    def _build_tree(self, path: Path, pattern: str, depth: int, current_depth: int = 0) -> dict:
-        """Build clean tree structure - directories and files with essential metadata."""
+    def _build_tree(
+        self, path: str, matches, depth: int, current_depth: int = 0, budget: list = None
+    ) -> dict:
+        """Build clean tree structure - directories and files with essential metadata.
+
+        budget is a one-item list of files still allowed; the walk stops when it runs out
+        and sets it to -1 if entries were left unlisted.
+        """
         tree = {"dirs": {}, "files": []}
 
-        if current_depth >= depth:
+        if current_depth >= depth or (budget and budget[0] <= 0):
             return tree
 
         try:
-            for item in sorted(path.iterdir()):
+            for name, is_dir, size in _entries(path):
+                if budget and budget[0] <= 0:
+                    budget[0] = -1  # More entries left unlisted
+                    break
                 # Skip hidden files
-                if item.name.startswith("."):
+                if name.startswith(".") and not LIST_SHOW_HIDDEN:
                     continue
 
-                if item.is_dir():
-                    subtree = self._build_tree(item, pattern, depth, current_depth + 1)
+                if is_dir:
+                    subtree = self._build_tree(
+                        os.path.join(path, name), matches, depth, current_depth + 1, budget
+                    )
                     if subtree["dirs"] or subtree["files"]:  # Only include non-empty dirs
-                        tree["dirs"][item.name] = subtree
-
-                elif item.is_file():
-                    # Apply pattern matching
-                    if self._matches_pattern(item.name, pattern):
-                        stat = item.stat()
-                        tree["files"].append(
-                            {
-                                "name": item.name,
-                                "size": stat.st_size,
-                                "category": categorize_file(item),
-                            }
-                        )
-
-        except PermissionError:
-            pass  # Skip inaccessible directories
-
-        return tree
+                        tree["dirs"][name] = subtree
 
-    def _matches_pattern(self, filename: str, pattern: str) -> bool:
-        """Simple pattern matching (supports * wildcards)."""
-        if pattern == "*":
-            return True
+                elif matches(name):
+                    tree["files"].append(
+                        {"name": name, "size": size, "category": categorize_file(Path(name))}
+                    )
+                    if budget:
+                        budget[0] -= 1
 
-        # Convert shell-style wildcards to simple matching
-        if "*" in pattern:
-            parts = pattern.split("*")
-            if len(parts) == 2:
-                prefix, suffix = parts
-                return filename.startswith(prefix) and filename.endswith(suffix)
+        except (PermissionError, FileNotFoundError):
+            pass  # Skip inaccessible or vanished directories
 
-        return pattern.lower() in filename.lower()
+        return tree
 
     def _format_tree(self, tree: dict, indent: str = "") -> str:
         """Format clean tree structure."""
@@ -111,9 +192,11 @@ class FileList(Tool):
 
         for file_info in tree["files"]:
             name = file_info["name"]
-            size = format_size(file_info["size"])
-            category = file_info["category"]
-            lines.append(f"{indent}{name} [{category}] {size}")
+            if LIST_SHOW_DETAILS:
+                size = format_size(file_info["size"])
+                lines.append(f"{indent}{name} [{file_info['category']}] {size}")
+            else:
+                lines.append(f"{indent}{name}")
 
         return "\n".join(line for line in lines if line.strip())
 
@@ -1,11 +1,126 @@
-"""File reading tool."""
+"""File reading tool.
 
+Reads only what it returns, off the event loop:
+- mmap: no whole-file read, the OS pages in the touched window
+- Line index: newline counts per fixed block, cached per (path, mtime, size), so
+  line N is found by skipping whole blocks instead of scanning from line 0
+- Tail: negative start seeks backwards from the end of the file
+- Bytes: offset/size windows, negative offset counted from the end
+- Search: literal or regex scan over the mapped file, with context lines and a match cap
+- Cap: output stops at READ_MAX_BYTES with a note saying where to continue
+- Binary: detected from the first block, before anything is decoded
+- Newlines: line windows and search results turn CRLF endings into plain newlines, like
+  a text-mode read; byte windows come back exactly as stored, carriage returns included
+- Cache: results reusable while every file's mtime and size hold (Config.cache)
+- Batch: several files in one call, read concurrently into one sectioned result
+"""
+
+import asyncio
+import mmap
+import re
+import threading
+from array import array
+from bisect import bisect_left
+from contextlib import contextmanager
 from pathlib import Path
 
 from ...core.protocols import Tool, ToolResult
 from ...core.result import Err, Ok, Result
+from ...lib.cache import LRU
+from ..constants import (
+    FILE_MAX_BATCH,
+    READ_INDEX_BLOCK,
+    READ_INDEX_FILES,
+    READ_MAX_BYTES,
+    READ_MAX_CONTEXT,
+    READ_MAX_MATCHES,
+    READ_SNIFF_BYTES,
+)
 from ..security import safe_path
-from .utils import categorize_file, format_size
+from .utils import file_state
+
+
+class _LineIndex:
+    """Newlines before each block - grown lazily, only as far as a read needs."""
+
+    def __init__(self, size: int, block: int = READ_INDEX_BLOCK):
+        self.size = size
+        self.block = block
+        self.counts = array("Q", [0])  # counts[i] = newlines in bytes [0, i * block)
+        self._lock = threading.Lock()  # Reads of one file run in parallel threads
+
+    def offset(self, mm, line: int) -> int | None:
+        """Byte offset where zero-indexed line starts - None past the end of the file."""
+        if line == 0:
+            return 0 if self.size else None
+
+        counts = self.counts
+        with self._lock:  # Growth only - existing entries never change once appended
+            while counts[-1] < line and (len(counts) - 1) * self.block < self.size:
+                start = (len(counts) - 1) * self.block
+                counts.append(counts[-1] + mm[start : start + self.block].count(b"\n"))
+            known = len(counts)
+        if counts[known - 1] < line:
+            return None
+
+        # The line-th newline falls in the last block that starts with fewer before it
+        block = bisect_left(counts, line, 0, known) - 1
+        pos = block * self.block
+        for _ in range(line - counts[block]):
+            pos = mm.find(b"\n", pos) + 1
+        return pos if pos < self.size else None
+
+
+_indexes = LRU(READ_INDEX_FILES)
+
+
+def _index(file_path: Path, stat) -> _LineIndex:
+    key = (str(file_path), stat.st_mtime_ns, stat.st_size)
+    index = _indexes.get(key)
+    if index is None:
+        index = _LineIndex(stat.st_size)
+        _indexes.put(key, index)
+    return index
+
+
+@contextmanager
+def _mapped(file_path: Path):
+    """Read-only map of a text file and its stat - mm is None for an empty file."""
+    with open(file_path, "rb") as f:
+        stat = file_path.stat()
+        if not stat.st_size:
+            yield None, stat
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if b"\0" in mm[:READ_SNIFF_BYTES]:
+                raise UnicodeDecodeError("utf-8", b"", 0, 1, "binary content")
+            yield mm, stat
+
+
+def _tail(mm, size: int, count: int) -> int:
+    """Byte offset of the count-th line from the end - rfind walks back from EOF."""
+    pos = size - 1 if mm[size - 1] == ord("\n") else size  # A trailing newline ends, not starts
+    for _ in range(count):
+        newline = mm.rfind(b"\n", 0, pos)
+        if newline == -1:
+            return 0
+        pos = newline
+    return pos + 1
+
+
+def _count_lines(mm, start: int, end: int) -> int:
+    """Newlines in [start, end), counted a block at a time."""
+    total = 0
+    for pos in range(start, end, READ_INDEX_BLOCK):
+        total += mm[pos : min(end, pos + READ_INDEX_BLOCK)].count(b"\n")
+    return total
+
+
+def _line(mm, start: int, size: int) -> tuple[str, int]:
+    """Decoded line starting at start, and the offset of the next line."""
+    end = mm.find(b"\n", start)
+    end = size if end == -1 else end
+    return mm[start:end].decode("utf-8", errors="replace").rstrip("\r"), end + 1
 
 
 class FileRead(Tool):
@@ -17,19 +132,65 @@ class FileRead(Tool):
 
     @property
     def description(self) -> str:
-        return "Read file content"
+        return (
+            "Read file content - line window (negative start = from the end), "
+            "byte window (offset/size), or matching lines (pattern, regex, context)"
+        )
+
+    @property
+    def parallel(self) -> bool:
+        return True
 
     @property
     def schema(self) -> dict:
         return {
-            "file": {},
+            "file": {"optional": True},
+            "files": {"type": "array", "optional": True},
             "start": {"type": "integer", "optional": True},
             "lines": {"type": "integer", "optional": True},
+            "offset": {"type": "integer", "optional": True},
+            "size": {"type": "integer", "optional": True},
+            "pattern": {"optional": True},
+            "regex": {"type": "boolean", "optional": True},
+            "context": {"type": "integer", "optional": True},
         }
 
+    def cache_policy(self, args: dict) -> dict | None:
+        names = args.get("files") or [args.get("file")]
+        if not all(isinstance(name, str) and name for name in names):
+            return None
+        try:
+            return {"state": file_state(names, args.get("sandbox", True))}
+        except ValueError:
+            return None  # Escapes the sandbox - let execute report it
+
     async def execute(
-        self, file: str, start: int = 0, lines: int = 100, sandbox: bool = True, **kwargs
+        self,
+        file: str = None,
+        start: int = 0,
+        lines: int = 100,
+        offset: int = None,
+        size: int = None,
+        pattern: str = None,
+        regex: bool = False,
+        context: int = 0,
+        sandbox: bool = True,
+        files: list[str] = None,
+        **kwargs,
     ) -> Result[ToolResult]:
+        if files:
+            options = {
+                "start": start,
+                "lines": lines,
+                "offset": offset,
+                "size": size,
+                "pattern": pattern,
+                "regex": regex,
+                "context": context,
+                "sandbox": sandbox,
+            }
+            return await self._read_many(files, options)
+
         if not file:
             return Err("File cannot be empty")
 
@@ -42,15 +203,26 @@ class FileRead(Tool):
                 # Direct filesystem access
                 file_path = Path(file).resolve()
 
-            # Read specific lines if requested - PERFORMANCE WIN
-            if start > 0 or lines != 100:
-                content = self._read_lines(file_path, start, lines)
-                end_line = start + (lines - 1) if lines else "end"
-                outcome = f"File read from {file} (lines {start}-{end_line})"
+            # Blocking I/O runs in a worker thread, never on the event loop
+            if pattern:
+                content, found = await asyncio.to_thread(
+                    self._search, file_path, pattern, regex, context
+                )
+                outcome = f"Found {found} matching lines for {pattern!r} in {file}"
+            elif offset is not None:
+                content = await asyncio.to_thread(self._read_bytes, file_path, offset, size)
+                outcome = f"File read from {file} (bytes from {offset})"
+            elif start != 0 or lines != 100:
+                # Read specific lines if requested - PERFORMANCE WIN
+                content = await asyncio.to_thread(self._read_lines, file_path, start, lines)
+                if start < 0:
+                    outcome = f"File read from {file} (from {-start} lines before the end)"
+                else:
+                    end_line = start + (lines - 1) if lines else "end"
+                    outcome = f"File read from {file} (lines {start}-{end_line})"
             else:
-                # Read entire file - default behavior
-                with open(file_path, encoding="utf-8") as f:
-                    content = f.read()
+                # Entire file - default behavior, up to the output cap
+                content = await asyncio.to_thread(self._read_lines, file_path, 0, 0)
                 outcome = f"File read from {file}"
 
             return Ok(ToolResult(outcome, content))
@@ -62,45 +234,154 @@ class FileRead(Tool):
             )
         except UnicodeDecodeError:
             return Err(f"File '{file}' contains binary data - cannot display as text")
+        except re.error as e:
+            return Err(f"Invalid pattern {pattern!r}: {e}")
         except ValueError as e:
             return Err(f"Security violation: {str(e)}")
         except Exception as e:
             return Err(f"Failed to read '{file}': {str(e)}")
 
+    async def _read_many(self, files: list[str], options: dict) -> Result[ToolResult]:
+        """Read every file with the same options - one section per file, errors inline."""
+        if not isinstance(files, list):
+            return Err("Files must be a list of file names")
+        if len(files) > FILE_MAX_BATCH:
+            return Err(f"Too many files ({len(files)}) - at most {FILE_MAX_BATCH} per call")
+
+        results = await asyncio.gather(*(self.execute(name, **options) for name in files))
+
+        sections = []
+        for name, result in zip(files, results, strict=True):
+            body = result.unwrap().content if result.success else f"[Error] {result.error}"
+            sections.append(f"=== {name} ===\n{body}")
+
+        read = sum(result.success for result in results)
+        if not read:
+            return Err("\n\n".join(sections))
+        outcome = (
+            f"Read {read} of {len(files)} files" if read < len(files) else f"Read {read} files"
+        )
+        return Ok(ToolResult(outcome, "\n\n".join(sections)))
+
     def _read_lines(self, file_path: Path, start: int, lines: int = None) -> str:
-        """Read specific lines from file - performance optimized."""
-        result_lines = []
-        with open(file_path, encoding="utf-8") as f:
-            for line_num, line in enumerate(f, 0):  # Zero-indexed
-                if line_num < start:
-                    continue
-                if lines and len(result_lines) >= lines:
-                    break
-                result_lines.append(line.rstrip("\n"))
+        """Read a window of lines (lines=0/None: to the end) - O(window), capped."""
+        with _mapped(file_path) as (mm, stat):
+            if mm is None:
+                return ""
 
-        return "\n".join(result_lines)
+            if start < 0:
+                begin = _tail(mm, stat.st_size, -start)
+            else:
+                begin = _index(file_path, stat).offset(mm, start)
+            if begin is None:
+                return ""
 
-    def _format_content(self, filename: str, content: str, file_path: Path) -> str:
-        """Format file content with intelligent context."""
-        if not content:
-            return f"📄 {filename} (empty file)"
+            limit = min(stat.st_size, begin + READ_MAX_BYTES)
+            end = begin
+            taken = 0
+            while end < limit and not (lines and taken >= lines):
+                newline = mm.find(b"\n", end, limit)
+                end = limit if newline == -1 else newline + 1
+                taken += 1
+            done = lines and taken >= lines and mm[end - 1] == ord("\n")
+            capped = end == limit < stat.st_size and not done
+            if capped and taken > 1 and mm[end - 1] != ord("\n"):
+                # Drop the line the cap cut through - it starts the next page
+                end = mm.rfind(b"\n", begin, end) + 1
+                taken -= 1
+            window = mm[begin:end]
 
-        stat = file_path.stat()
-        size = format_size(stat.st_size)
-        line_count = content.count("\n") + (1 if content and not content.endswith("\n") else 0)
+        text = window.decode("utf-8", errors="replace").replace("\r\n", "\n")
+        if text.endswith("\n"):
+            text = text[:-1]
+
+        if capped:
+            resume = start + taken - (0 if window.endswith(b"\n") else 1)
+            text += (
+                f"\n\n[Output capped at {READ_MAX_BYTES:,} bytes of {stat.st_size:,}"
+                f" - continue with start={resume}]"
+            )
+        return text
+
+    def _read_bytes(self, file_path: Path, offset: int, size: int = None) -> str:
+        """Read a byte window (negative offset: from the end), at most READ_MAX_BYTES."""
+        with _mapped(file_path) as (mm, stat):
+            if mm is None:
+                return ""
+
+            total = stat.st_size
+            begin = max(0, total + offset) if offset < 0 else min(offset, total)
+            end = min(total, begin + min(size or READ_MAX_BYTES, READ_MAX_BYTES))
+            text = mm[begin:end].decode("utf-8", errors="replace")
+
+        if end < total and (not size or size > READ_MAX_BYTES):
+            text += (
+                f"\n\n[Output capped at {READ_MAX_BYTES:,} bytes of {total:,}"
+                f" - continue with offset={end}]"
+            )
+        return text
+
+    def _search(
+        self, file_path: Path, pattern: str, regex: bool = False, context: int = 0
+    ) -> tuple[str, int]:
+        """Matching lines grep style - 'N:match', 'N-context', '--' between groups.
+
+        Line numbers are zero-indexed like start. Stops after READ_MAX_MATCHES lines.
+        """
+        needle = pattern.encode("utf-8")
+        compiled = re.compile(needle if regex else re.escape(needle), re.MULTILINE)
+        context = max(0, min(context or 0, READ_MAX_CONTEXT))
+
+        shown: dict[int, tuple[str, bool]] = {}  # line -> (text, is match)
+        found = 0
+        stopped = False
+        with _mapped(file_path) as (mm, stat):
+            if mm is None:
+                return "", 0
+            size = stat.st_size
+
+            pos = line = counted = 0  # Scan position; `line` is the line starting at `counted`
+            while pos < size:
+                match = compiled.search(mm, pos)
+                if match is None:
+                    break
+                if found == READ_MAX_MATCHES:
+                    stopped = True
+                    break
+
+                begin = mm.rfind(b"\n", 0, match.start()) + 1
+                line += _count_lines(mm, counted, begin)
+                counted = begin
+                found += 1
 
-        # Categorize file
-        category = categorize_file(file_path)
+                # Context before, walking back from the match line
+                before = begin
+                for back in range(1, context + 1):
+                    if before == 0 or line - back in shown:
+                        break
+                    before = mm.rfind(b"\n", 0, before - 1) + 1
+                    shown[line - back] = (_line(mm, before, size)[0], False)
 
-        header = f"📄 {filename} ({size}, {line_count} lines) [{category}]"
+                text, pos = _line(mm, begin, size)
+                shown[line] = (text, True)
 
-        if category == "code":
-            ext = file_path.suffix.lower()
-            if ext in [".py", ".js", ".ts", ".go", ".rs"]:
-                header += f" {ext[1:].upper()}"
+                # Context after - a later match on one of these lines still marks it
+                after = pos
+                for ahead in range(1, context + 1):
+                    if after >= size:
+                        break
+                    text, after = _line(mm, after, size)
+                    shown.setdefault(line + ahead, (text, False))
 
-        if len(content) > 5000:
-            preview = content[:5000]
-            return f"{header}\n\n{preview}\n\n[File truncated at 5,000 characters. Full size: {len(content):,} chars]\n* File is large - consider using 'shell' with 'head' or 'tail' for specific sections"
+        output = []
+        previous = None
+        for number in sorted(shown):
+            if context and previous is not None and number > previous + 1:
+                output.append("--")
+            text, is_match = shown[number]
+            output.append(f"{number}{':' if is_match else '-'}{text}")
+            previous = number
 
-        return f"{header}\n\n{content}"
+        if stopped:
+            output.append(f"\n[Stopped at {READ_MAX_MATCHES} matching lines - narrow the pattern]")
+        return "\n".join(output), found
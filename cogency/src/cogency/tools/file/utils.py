@@ -1,7 +1,33 @@
 """File utilities: Shared logic for file operations."""
 
+import os
+import stat
+import tempfile
 import time
+from collections.abc import Iterator
+from contextlib import contextmanager, suppress
 from pathlib import Path
+from typing import BinaryIO
+
+from ..constants import WRITE_FSYNC
+from ..security import safe_path
+
+# Process umask, read once - mkstemp creates 0600 files, new files get the usual mode
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def file_state(names: list[str], sandbox: bool = True) -> tuple:
+    """(mtime_ns, size) per file as the tools resolve it - None for a missing file."""
+    state = []
+    for name in names:
+        path = safe_path(Path(".sandbox"), name) if sandbox else Path(name).resolve()
+        try:
+            info = path.stat()
+            state.append((info.st_mtime_ns, info.st_size))
+        except OSError:
+            state.append(None)
+    return tuple(state)
 
 
 def format_size(size_bytes: int) -> str:
@@ -98,3 +124,38 @@ def categorize_file(file_path: Path) -> str:
         return "build"
 
     return "misc"
+
+
+@contextmanager
+def atomic_write(file_path: Path, fsync: bool = WRITE_FSYNC) -> Iterator[BinaryIO]:
+    """Binary handle to a temp file beside file_path, swapped in with os.replace on success.
+
+    Readers see the old file or the new one, never a partial write. On error the temp
+    file is removed and the original is untouched. An existing file keeps its mode.
+    """
+    fd, tmp = tempfile.mkstemp(dir=file_path.parent, prefix=f".{file_path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            yield f
+            f.flush()
+            if fsync:
+                os.fsync(f.fileno())
+
+        try:
+            mode = stat.S_IMODE(file_path.stat().st_mode)
+        except FileNotFoundError:
+            mode = 0o666 & ~_UMASK
+        os.chmod(tmp, mode)
+        os.replace(tmp, file_path)
+    except BaseException:
+        with suppress(FileNotFoundError):
+            os.unlink(tmp)
+        raise
+
+    if fsync and hasattr(os, "O_DIRECTORY"):
+        # Make the rename itself durable
+        dir_fd = os.open(file_path.parent, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
@@ -1,11 +1,18 @@
-"""File writing tool."""
+"""File writing tool.
 
+Every file is written to a temp file and swapped in with os.replace. A batch of files is
+validated up front - one bad name or unsafe content rejects the whole call before any
+file is touched.
+"""
+
+import asyncio
 from pathlib import Path
 
 from ...core.protocols import Tool, ToolResult
 from ...core.result import Err, Ok, Result
+from ..constants import FILE_MAX_BATCH
 from ..security import safe_path, validate_input
-from .utils import categorize_file, format_size
+from .utils import atomic_write, categorize_file, format_size
 
 
 class FileWrite(Tool):
@@ -21,15 +28,30 @@ class FileWrite(Tool):
 
     @property
     def schema(self) -> dict:
-        return {"filename": {}, "content": {}}
+        return {
+            "filename": {"optional": True},
+            "content": {"optional": True},
+            "files": {"type": "array", "optional": True},  # [{"filename": ..., "content": ...}]
+        }
 
     async def execute(
-        self, filename: str, content: str, sandbox: bool = True, **kwargs
+        self,
+        filename: str = None,
+        content: str = None,
+        sandbox: bool = True,
+        files: list[dict] = None,
+        security: tuple[str, ...] = None,
+        **kwargs,
     ) -> Result[ToolResult]:
+        if files:
+            return await self._write_many(files, sandbox, security)
+
         if not filename:
             return Err("Filename cannot be empty")
+        if content is None:
+            return Err("Content is required")
 
-        if not validate_input(content):
+        if not validate_input(content, security):
             return Err("Content contains unsafe patterns")
 
         try:
@@ -46,9 +68,8 @@ class FileWrite(Tool):
             is_overwrite = file_path.exists()
             file_path.stat().st_size if is_overwrite else 0
 
-            # Write with UTF-8 encoding
-            with open(file_path, "w", encoding="utf-8") as f:
-                f.write(content)
+            # Write with UTF-8 encoding - temp file + rename, off the event loop
+            await asyncio.to_thread(self._write, file_path, content)
 
             # Clear completion signal
             outcome = f"File written to {filename}"
@@ -59,6 +80,55 @@ class FileWrite(Tool):
         except Exception as e:
             return Err(f"Failed to write '{filename}': {str(e)}")
 
+    async def _write_many(
+        self, files: list[dict], sandbox: bool, security: tuple[str, ...] = None
+    ) -> Result[ToolResult]:
+        """Validate every file first, then write each atomically - one report for all."""
+        if not isinstance(files, list):
+            return Err("Files must be a list of {filename, content}")
+        if len(files) > FILE_MAX_BATCH:
+            return Err(f"Too many files ({len(files)}) - at most {FILE_MAX_BATCH} per call")
+
+        targets = []
+        for i, entry in enumerate(files, 1):
+            if not isinstance(entry, dict) or not entry.get("filename"):
+                return Err(f"File {i}: Filename cannot be empty")
+            filename, content = entry["filename"], entry.get("content") or ""
+            if not validate_input(content, security):
+                return Err(f"File {i} ({filename}): Content contains unsafe patterns")
+            try:
+                if sandbox:
+                    sandbox_dir = Path(".sandbox")
+                    sandbox_dir.mkdir(exist_ok=True)
+                    file_path = safe_path(sandbox_dir, filename)
+                else:
+                    file_path = Path(filename).resolve()
+            except ValueError as e:
+                return Err(f"File {i} ({filename}): Security violation: {str(e)}")
+            targets.append((filename, file_path, content))
+
+        lines = []
+        written = 0
+        for filename, file_path, content in targets:
+            try:
+                await asyncio.to_thread(self._write, file_path, content)
+                lines.append(f"File written to {filename}")
+                written += 1
+            except Exception as e:
+                lines.append(f"[Error] Failed to write '{filename}': {str(e)}")
+
+        if not written:
+            return Err("\n".join(lines))
+        total = len(targets)
+        outcome = (
+            f"Wrote {written} of {total} files" if written < total else f"Wrote {written} files"
+        )
+        return Ok(ToolResult(outcome, "\n".join(lines)))
+
+    def _write(self, file_path: Path, content: str) -> None:
+        with atomic_write(file_path) as f:
+            f.write(content.encode("utf-8"))
+
     def _feedback(
         self, filename: str, content: str, file_path: Path, is_overwrite: bool, old_size: int
     ) -> str:
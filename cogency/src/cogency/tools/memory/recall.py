@@ -5,12 +5,12 @@ Fuzzy search gives 80% of semantic value for 20% of complexity.
 Embeddings would add ~15% better matching at 4x complexity cost.
 """
 
-import sqlite3
+import asyncio
 from typing import NamedTuple
 
-from ...core.protocols import Tool, ToolResult
+from ...core.protocols import Storage, Tool, ToolResult
 from ...core.result import Err, Ok, Result
-from ...lib.storage import get_db_path
+from ...lib.storage import default_storage
 from ..file.utils import format_relative_time
 
 
@@ -33,6 +33,10 @@ class MemoryRecall(Tool):
     def description(self) -> str:
         return "Search past user messages for context outside current conversation"
 
+    @property
+    def parallel(self) -> bool:
+        return True
+
     @property
     def schema(self) -> dict:
         return {
@@ -43,7 +47,12 @@ class MemoryRecall(Tool):
         }
 
     async def execute(
-        self, query: str, conversation_id: str = None, user_id: str = None
+        self,
+        query: str,
+        conversation_id: str = None,
+        user_id: str = None,
+        storage: Storage = None,
+        **kwargs,
     ) -> Result[ToolResult]:
         """Execute fuzzy search on past user messages."""
         if not query or not query.strip():
@@ -55,21 +64,16 @@ class MemoryRecall(Tool):
         query = query.strip()
 
         try:
-            # Get current context window to exclude
-            current_timestamps = self._get_timestamps(conversation_id)
-
-            # Get already retrieved content to avoid duplication
-            retrieved_content = self._get_retrieved_content(conversation_id)
-
-            # Fuzzy search past user messages with enhanced filtering
-            matches = self._search_messages(
-                query=query,
-                user_id=user_id,
-                exclude_timestamps=current_timestamps,
-                exclude_content=retrieved_content,
+            # Fuzzy search past user messages outside the current conversation
+            storage = storage or default_storage
+            rows = await asyncio.to_thread(
+                storage.search_user_messages,
+                user_id,
+                query,
                 limit=3,
-                fetch_multiplier=3.0,
+                exclude_conversation=conversation_id,
             )
+            matches = [MessageMatch(*row) for row in rows]
 
             if not matches:
                 outcome = f"Memory searched for '{query}'"
@@ -83,86 +87,6 @@ class MemoryRecall(Tool):
         except Exception as e:
             return Err(f"Recall search failed: {str(e)}")
 
-    def _get_timestamps(self, conversation_id: str) -> list[float]:
-        """Get timestamps of current context window to exclude from search."""
-        if not conversation_id:
-            return []
-
-        db_path = get_db_path()
-
-        try:
-            with sqlite3.connect(db_path) as db:
-                # Get last 20 user messages from current conversation
-                rows = db.execute(
-                    """
-                    SELECT timestamp FROM conversations
-                    WHERE conversation_id = ? AND type = 'user'
-                    ORDER BY timestamp DESC
-                    LIMIT 20
-                """,
-                    (conversation_id,),
-                ).fetchall()
-
-                return [row[0] for row in rows]
-        except Exception:
-            return []
-
-    def _search_messages(
-        self, query: str, user_id: str, exclude_timestamps: list[float], limit: int = 3
-    ) -> list[MessageMatch]:
-        """Fuzzy search user messages with SQLite pattern matching."""
-        db_path = get_db_path()
-
-        # Build fuzzy search patterns
-        keywords = query.lower().split()
-        like_patterns = [f"%{keyword}%" for keyword in keywords]
-
-        try:
-            with sqlite3.connect(db_path) as db:
-                # Build exclusion clause
-                exclude_clause = ""
-                params = []
-
-                if exclude_timestamps:
-                    placeholders = ",".join("?" for _ in exclude_timestamps)
-                    exclude_clause = f"AND timestamp NOT IN ({placeholders})"
-                    params.extend(exclude_timestamps)
-
-                # Build LIKE clause for fuzzy matching
-                like_clause = " OR ".join("LOWER(content) LIKE ?" for _ in like_patterns)
-                params.extend(like_patterns)
-
-                query_sql = f"""
-                    SELECT content, timestamp, conversation_id,
-                           (LENGTH(content) - LENGTH(REPLACE(LOWER(content), ?, ''))) as relevance_score
-                    FROM conversations
-                    WHERE type = 'user'
-                    AND conversation_id LIKE ?
-                    {exclude_clause}
-                    AND ({like_clause})
-                    ORDER BY relevance_score DESC, timestamp DESC
-                    LIMIT ?
-                """
-                # Add relevance scoring query and user_id pattern as first parameters
-                params.insert(0, query.lower())  # For relevance scoring
-                params.insert(1, f"{user_id}_%")  # For user scoping
-                params.append(limit)
-
-                rows = db.execute(query_sql, params).fetchall()
-
-                return [
-                    MessageMatch(
-                        content=row[0],
-                        timestamp=row[1],
-                        conversation_id=row[2],
-                        # Ignore row[3] which is relevance_score
-                    )
-                    for row in rows
-                ]
-
-        except Exception:
-            return []
-
     def _format_matches(self, matches: list[MessageMatch], query: str) -> str:
         """Format search results for ToolResult content."""
         results = []
@@ -13,7 +13,7 @@ def format_tool_registry(tools: list) -> str:
         params = []
         if hasattr(tool, "schema") and tool.schema:
             for param, info in tool.schema.items():
-                if info.get("required", True):
+                if info.get("required", True) and not info.get("optional"):
                     params.append(param)
                 else:
                     params.append(f"{param}?")
@@ -1,28 +1,70 @@
 """Tool security utilities.
 
 Input validation, path safety, and secret redaction for tools.
+
+- Scanner: patterns prepared once per policy, content scanned case-insensitively in
+  fixed windows (overlapping by the longest pattern), so a multi-MB write never gets a
+  full lower-cased copy and a hit stops the scan early
+- Policy: Config.security replaces the default patterns per Agent - () disables scanning
+- Sandbox roots: resolved once per (cwd, base) instead of on every path check
 """
 
+import os
+from functools import lru_cache
 from pathlib import Path
 
+DANGEROUS_PATTERNS = (
+    "rm -rf",
+    "format c:",
+    "shutdown",
+    "del /s",
+    "../../",
+    "..\\..\\..",
+    "%2e%2e%2f",
+)
+
+SCAN_WINDOW = 1 << 16  # Characters lower-cased at a time
+
+
+class Scanner:
+    """Case-insensitive multi-pattern scan over bounded windows of the content."""
+
+    def __init__(self, patterns: tuple[str, ...] = DANGEROUS_PATTERNS):
+        # Lower-cased once; patterns containing another pattern can never match first
+        lowered = sorted({p.lower() for p in patterns if p}, key=len)
+        self.patterns = tuple(p for i, p in enumerate(lowered) if not _covered(p, lowered[:i]))
+        self.overlap = max((len(p) for p in self.patterns), default=1) - 1
+
+    def find(self, content: str) -> str | None:
+        """First dangerous pattern found in content - None when clean."""
+        if not content or not self.patterns:
+            return None
+        for start in range(0, len(content), SCAN_WINDOW):
+            window = content[start : start + SCAN_WINDOW + self.overlap].lower()
+            for pattern in self.patterns:
+                if pattern in window:
+                    return pattern
+        return None
+
+
+def _covered(pattern: str, shorter: list[str]) -> bool:
+    return any(other in pattern for other in shorter)
+
+
+@lru_cache(maxsize=16)
+def scanner(patterns: tuple[str, ...] | None = None) -> Scanner:
+    """Prepared scanner for a policy - None means the default patterns."""
+    return Scanner(DANGEROUS_PATTERNS if patterns is None else tuple(patterns))
+
 
-def validate_input(content: str) -> bool:
+def validate_input(content: str, patterns: tuple[str, ...] | None = None) -> bool:
     """Basic input validation for tool operations."""
-    if not content:
-        return True
+    return scanner(None if patterns is None else tuple(patterns)).find(content) is None
 
-    content_lower = content.lower()
-    dangerous_patterns = [
-        "rm -rf",
-        "format c:",
-        "shutdown",
-        "del /s",
-        "../../",
-        "..\\..\\..",
-        "%2e%2e%2f",
-    ]
 
-    return not any(pattern in content_lower for pattern in dangerous_patterns)
+@lru_cache(maxsize=64)
+def _root(cwd: str, base_dir: str) -> Path:
+    return Path(cwd, base_dir).resolve()
 
 
 def safe_path(base_dir: Path, rel_path: str) -> Path:
@@ -30,8 +72,9 @@ def safe_path(base_dir: Path, rel_path: str) -> Path:
     if not rel_path:
         raise ValueError("Path cannot be empty")
 
-    resolved = (base_dir / rel_path).resolve()
-    if not str(resolved).startswith(str(base_dir.resolve())):
+    root = _root(os.getcwd(), str(base_dir))
+    resolved = (root / rel_path).resolve()
+    if not resolved.is_relative_to(root):
         raise ValueError(f"Path escapes base directory: {rel_path}")
 
     return resolved
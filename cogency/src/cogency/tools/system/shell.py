@@ -1,11 +1,58 @@
-"""Shell command execution tool."""
-
+"""Shell command execution tool.
+
+Runs as an asyncio subprocess - never blocks the event loop - and, when the caller
+listens (on_chunk), hands stdout over piece by piece while the command is still running.
+
+SystemShell(persistent=True) instead sends commands to a long-lived worker per
+conversation (see worker.py): cwd and environment carry over, every command runs under
+rlimits, and idle workers exit on their own. It is for state and limits, not speed: the
+worker still spawns a process per command, and measured ~2.3ms per `echo` round trip
+against ~1.3ms for a fresh process (the extra JSON hop and pipe).
+"""
+
+import asyncio
+import atexit
+import codecs
+import json
+import os
 import subprocess
+import threading
 import time
 from pathlib import Path
 
 from ...core.protocols import Tool, ToolResult
 from ...core.result import Err, Ok, Result
+from ...lib.cache import LRU
+from ..constants import (
+    SHELL_WORKER_CPU,
+    SHELL_WORKER_IDLE,
+    SHELL_WORKER_MAX,
+    SHELL_WORKER_MEMORY,
+)
+from .worker import BUILTINS, Worker, WorkerGoneError
+
+_workers = LRU(SHELL_WORKER_MAX)
+_workers_lock = threading.Lock()
+
+
+def _worker(key: tuple, config: dict, gone: Worker = None) -> Worker:
+    """Live worker for a conversation - respawned if it exited (idle), died or is `gone`."""
+    with _workers_lock:
+        worker = _workers.get(key)
+        if worker is None or worker is gone or not worker.alive:
+            if worker is not None:
+                worker.close()
+            Path(config["root"]).mkdir(exist_ok=True)
+            worker = Worker(config)
+            for _, evicted in _workers.put(key, worker):
+                evicted.close()
+        return worker
+
+
+@atexit.register
+def _close_workers() -> None:
+    for _, worker in _workers.items():
+        worker.close()
 
 
 class SystemShell(Tool):
@@ -61,6 +108,10 @@ class SystemShell(Tool):
         "delete": "rm",
     }
 
+    def __init__(self, persistent: bool = False):
+        # Workers rely on POSIX rlimits and preexec - elsewhere every call spawns fresh
+        self.persistent = persistent and os.name == "posix"
+
     @property
     def name(self) -> str:
         return "shell"
@@ -73,7 +124,14 @@ class SystemShell(Tool):
     def schema(self) -> dict:
         return {"command": {}}
 
-    async def execute(self, command: str, sandbox: bool = True, **kwargs) -> Result[ToolResult]:
+    async def execute(
+        self,
+        command: str,
+        sandbox: bool = True,
+        on_chunk=None,
+        conversation_id: str = None,
+        **kwargs,
+    ) -> Result[ToolResult]:
         """Execute command with enhanced intelligence and context."""
         if not command or not command.strip():
             return Err("Command cannot be empty")
@@ -93,10 +151,11 @@ class SystemShell(Tool):
 
         cmd = parts[0]
 
-        # Security validation with suggestions
-        if cmd not in self.SAFE_COMMANDS:
+        # Security validation with suggestions - cd/export/unset only mean something to a worker
+        allowed = self.SAFE_COMMANDS | BUILTINS if self.persistent else self.SAFE_COMMANDS
+        if cmd not in allowed:
             suggestion = self._get_command_suggestion(cmd)
-            available = ", ".join(sorted(self.SAFE_COMMANDS))
+            available = ", ".join(sorted(allowed))
 
             if suggestion:
                 return Err(
@@ -104,6 +163,10 @@ class SystemShell(Tool):
                 )
             return Err(f"Command '{cmd}' not allowed. Available: {available}")
 
+        if self.persistent:
+            key = (conversation_id or kwargs.get("user_id") or "default", sandbox)
+            return await self._run_persistent(key, command, parts, sandbox, on_chunk)
+
         # Working directory logic
         if sandbox:
             working_path = Path(".sandbox")
@@ -115,9 +178,7 @@ class SystemShell(Tool):
         try:
             start_time = time.time()
 
-            result = subprocess.run(
-                parts, cwd=str(working_path), capture_output=True, text=True, timeout=30
-            )
+            result = await self._run(parts, working_path, on_chunk)
 
             execution_time = time.time() - start_time
 
@@ -131,6 +192,79 @@ class SystemShell(Tool):
         except Exception as e:
             return Err(f"Execution error: {str(e)}")
 
+    async def _run(self, parts: list[str], cwd: Path, on_chunk=None) -> subprocess.CompletedProcess:
+        """Run to completion - stdout passed to on_chunk as it arrives, 30s budget."""
+        proc = await asyncio.create_subprocess_exec(
+            *parts,
+            cwd=str(cwd),
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+
+        async def pump(stream, sink: list, callback) -> None:
+            decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+            while chunk := await stream.read(8192):
+                text = decoder.decode(chunk)
+                sink.append(text)
+                if callback and text:
+                    callback(text)
+            sink.append(decoder.decode(b"", final=True))
+
+        stdout, stderr = [], []
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(
+                    pump(proc.stdout, stdout, on_chunk),
+                    pump(proc.stderr, stderr, None),
+                    proc.wait(),
+                ),
+                30,
+            )
+        except asyncio.TimeoutError:
+            raise subprocess.TimeoutExpired(parts, 30) from None
+        finally:
+            if proc.returncode is None:  # Timed out or cancelled - don't leave it running
+                proc.kill()
+                await proc.wait()
+
+        return subprocess.CompletedProcess(parts, proc.returncode, "".join(stdout), "".join(stderr))
+
+    async def _run_persistent(
+        self, key: tuple, command: str, parts: list[str], sandbox: bool, on_chunk=None
+    ) -> Result[ToolResult]:
+        """Run in the conversation's worker - same result formatting as a fresh process."""
+        config = {
+            "root": ".sandbox" if sandbox else str(Path.cwd()),
+            "sandbox": sandbox,
+            "allowed": sorted(self.SAFE_COMMANDS),
+            "idle": SHELL_WORKER_IDLE,
+            "cpu": SHELL_WORKER_CPU,
+            "memory": SHELL_WORKER_MEMORY,
+        }
+        try:
+            start_time = time.time()
+            worker = _worker(key, config)
+            try:
+                reply = await asyncio.to_thread(worker.run, parts, 30, on_chunk)
+            except WorkerGoneError:
+                # Exited (idle) before acknowledging - it never ran the command, so retry once
+                worker = _worker(key, config, gone=worker)
+                reply = await asyncio.to_thread(worker.run, parts, 30, on_chunk)
+            execution_time = time.time() - start_time
+        except (OSError, RuntimeError, json.JSONDecodeError) as e:
+            return Err(f"Execution error: {str(e)}")
+
+        if reply.get("timeout"):
+            return Err(f"Command timed out after 30 seconds: {command}")
+        if "error" in reply:
+            return Err(reply["error"])
+
+        result = subprocess.CompletedProcess(
+            parts, reply["returncode"], reply["stdout"], reply["stderr"]
+        )
+        return self._format_result(command, result, execution_time, Path(reply["cwd"]))
+
     def _get_command_suggestion(self, cmd: str) -> str | None:
         """Get intelligent command suggestion for common mistakes."""
         return self.COMMAND_SUGGESTIONS.get(cmd)
@@ -0,0 +1,260 @@
+"""Persistent shell worker - one long-lived process per conversation (SystemShell(persistent=True)).
+
+Run as a script by the parent, stdlib only, so it starts without importing the package:
+- Protocol: one JSON request per stdin line, JSON replies per stdout line - {"ack"} as
+  soon as the line is read, {"chunk"} while a command runs, then
+  {"returncode", "stdout", "stderr", "cwd"}; a worker gone before the ack never saw the
+  command, so the parent may safely resend it
+- State: cwd and environment survive between commands (cd, export, unset are built in);
+  cd never leaves the sandbox root
+- Resolution: commands resolve against the PATH the worker started with; PATH, loader
+  and interpreter hook variables (LD_*, PYTHON*, ...) cannot be exported or unset, and
+  env only prints the environment - `env VAR=... cmd` would bypass both
+- Limits: every command runs under CPU-seconds and address-space rlimits plus a wall
+  clock timeout; commands outside the allow-list are refused here as well
+- Spawn cost: no preexec hook on Linux (prlimit after start instead), so commands
+  start through vfork rather than a full fork - still a process per command, so not
+  faster than a fresh one (see SystemShell)
+- Reaping: the worker exits after `idle` seconds without a request, or when its parent
+  closes the pipe; the parent respawns it on the next command
+"""
+
+import codecs
+import json
+import os
+import selectors
+import shutil
+import subprocess
+import sys
+import threading
+import time
+from contextlib import suppress
+from pathlib import Path
+
+try:
+    import resource
+except ImportError:  # Not POSIX - SystemShell never starts a worker there
+    resource = None
+
+BUILTINS = {"cd", "export", "unset"}
+
+# Variables that change which binary runs or what it loads - fixed for the worker's life
+PROTECTED_ENV = {"PATH", "IFS", "ENV", "BASH_ENV", "SHELLOPTS", "NODE_OPTIONS"}
+PROTECTED_PREFIXES = ("LD_", "DYLD_", "PYTHON", "PERL5", "RUBY")
+
+
+def protected(key: str) -> bool:
+    return key in PROTECTED_ENV or key.startswith(PROTECTED_PREFIXES)
+
+
+def _limit_memory(memory: int) -> None:
+    """Address-space cap on the worker itself - every command inherits it."""
+    if memory:
+        resource.setrlimit(resource.RLIMIT_AS, (memory, memory))
+
+
+def _limit_cpu(proc: subprocess.Popen, cpu: int) -> None:
+    """CPU-seconds cap on one command, set on the child just after it starts.
+
+    Not set on the worker: its own CPU time would count against it. With prlimit (Linux)
+    the child keeps vfork-speed spawning; elsewhere _preexec sets it before exec.
+    """
+    if cpu and hasattr(resource, "prlimit"):
+        with suppress(ProcessLookupError):  # Already exited - nothing left to limit
+            resource.prlimit(proc.pid, resource.RLIMIT_CPU, (cpu, cpu))
+
+
+def _preexec(cpu: int):
+    """Fallback without prlimit - preexec_fn forces fork over vfork, so it costs more."""
+    if not cpu or hasattr(resource, "prlimit"):
+        return None
+    return lambda: resource.setrlimit(resource.RLIMIT_CPU, (cpu, cpu))
+
+
+class _Session:
+    """Worker-side state: cwd, environment and the policy it was started with."""
+
+    def __init__(self, config: dict):
+        self.root = Path(config["root"]).resolve()
+        self.sandbox = config["sandbox"]
+        self.allowed = set(config["allowed"]) | BUILTINS
+        self.cpu = config["cpu"]
+        self.memory = config["memory"]
+        self.cwd = self.root
+        self.env = dict(os.environ)
+        self.path = self.env.get("PATH", os.defpath)
+
+    def handle(self, request: dict, send) -> dict:
+        argv = request.get("argv") or []
+        if not argv:
+            return {"error": "Empty command"}
+        if argv[0] not in self.allowed:
+            return {"error": f"Command '{argv[0]}' not allowed"}
+        if argv[0] in BUILTINS:
+            return self._builtin(argv)
+        if argv[0] == "env" and len(argv) > 1:
+            # Assignments, -u/-i and a trailing command all change what runs, and how
+            return {"error": "env takes no arguments here - use export / unset"}
+        return self._run(argv, request.get("timeout") or 30, send)
+
+    def _builtin(self, argv: list[str]) -> dict:
+        name, args = argv[0], argv[1:]
+        if name == "cd":
+            target = (self.cwd / (args[0] if args else self.root)).resolve()
+            if self.sandbox and not target.is_relative_to(self.root):
+                return self._reply(1, stderr=f"cd: {args[0]}: outside the sandbox")
+            if not target.is_dir():
+                return self._reply(
+                    1, stderr=f"cd: {args[0] if args else target}: no such directory"
+                )
+            self.cwd = target
+        else:
+            keys = [pair.partition("=")[0] for pair in args]
+            refused = [key for key in keys if protected(key)]
+            if refused:
+                return self._reply(1, stderr=f"{name}: {', '.join(refused)}: protected variable")
+            for pair in args:
+                if name == "export":
+                    key, _, value = pair.partition("=")
+                    self.env[key] = value
+                else:
+                    self.env.pop(pair, None)
+        return self._reply(0)
+
+    def _run(self, argv: list[str], timeout: float, send) -> dict:
+        # Resolved here, not by Popen from self.env - the allow-listed name is the binary run
+        executable = shutil.which(argv[0], path=self.path)
+        if executable is None:
+            return {"error": f"Command not found: {argv[0]}"}
+        try:
+            proc = subprocess.Popen(
+                [executable, *argv[1:]],
+                cwd=self.cwd,
+                env=self.env,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                preexec_fn=_preexec(self.cpu),
+            )
+        except FileNotFoundError:
+            return {"error": f"Command not found: {argv[0]}"}
+        _limit_cpu(proc, self.cpu)
+
+        out, err = [], []
+        decoders = {
+            proc.stdout: (codecs.getincrementaldecoder("utf-8")(errors="replace"), out),
+            proc.stderr: (codecs.getincrementaldecoder("utf-8")(errors="replace"), err),
+        }
+        deadline = time.monotonic() + timeout
+        with selectors.DefaultSelector() as selector:
+            for stream in decoders:
+                selector.register(stream, selectors.EVENT_READ)
+            while selector.get_map():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    proc.kill()
+                    proc.wait()
+                    return {"timeout": True}
+                for key, _ in selector.select(remaining):
+                    data = os.read(key.fd, 8192)
+                    decoder, sink = decoders[key.fileobj]
+                    if not data:
+                        selector.unregister(key.fileobj)
+                        sink.append(decoder.decode(b"", final=True))
+                        continue
+                    text = decoder.decode(data)
+                    sink.append(text)
+                    if sink is out and text:
+                        send({"chunk": text})
+        try:
+            returncode = proc.wait(max(0.0, deadline - time.monotonic()))
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+            return {"timeout": True}
+        return self._reply(returncode, "".join(out), "".join(err))
+
+    def _reply(self, returncode: int, stdout: str = "", stderr: str = "") -> dict:
+        return {"returncode": returncode, "stdout": stdout, "stderr": stderr, "cwd": str(self.cwd)}
+
+
+def serve(config: dict) -> None:
+    """Request loop - exits on EOF or after config["idle"] seconds without a request."""
+    session = _Session(config)
+    _limit_memory(config["memory"])
+    out = sys.stdout
+
+    def send(message: dict) -> None:
+        out.write(json.dumps(message) + "\n")
+        out.flush()
+
+    with selectors.DefaultSelector() as selector:
+        selector.register(sys.stdin, selectors.EVENT_READ)
+        while selector.select(config["idle"]):
+            line = sys.stdin.readline()
+            if not line:
+                return
+            send({"ack": True})
+            try:
+                request = json.loads(line)
+                send(session.handle(request, send))
+            except Exception as e:
+                send({"error": str(e)})
+
+
+class WorkerGoneError(RuntimeError):
+    """The worker exited before acknowledging a command - it never ran, resend is safe."""
+
+
+class Worker:
+    """Parent-side handle - one command at a time, blocking (callers use a thread)."""
+
+    def __init__(self, config: dict):
+        self.config = config
+        self.lock = threading.Lock()
+        self.proc = subprocess.Popen(
+            [sys.executable, "-I", __file__, json.dumps(config)],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            bufsize=1,
+        )
+
+    @property
+    def alive(self) -> bool:
+        return self.proc.poll() is None
+
+    def run(self, argv: list[str], timeout: float, on_chunk=None) -> dict:
+        """Send one command and collect its reply - chunks go to on_chunk as they arrive."""
+        with self.lock:
+            # One request in flight at a time - the worker never has a second line buffered
+            try:
+                self.proc.stdin.write(json.dumps({"argv": argv, "timeout": timeout}) + "\n")
+                self.proc.stdin.flush()
+            except BrokenPipeError as e:
+                raise WorkerGoneError("Shell worker exited") from e
+            if not self.proc.stdout.readline():
+                raise WorkerGoneError("Shell worker exited")  # EOF in place of the ack
+            while True:
+                line = self.proc.stdout.readline()
+                if not line:
+                    raise RuntimeError("Shell worker exited")
+                message = json.loads(line)
+                if "chunk" not in message:
+                    return message
+                if on_chunk:
+                    on_chunk(message["chunk"])
+
+    def close(self) -> None:
+        if self.alive:
+            try:
+                self.proc.stdin.close()
+                self.proc.wait(1)
+            except (OSError, subprocess.TimeoutExpired):
+                self.proc.kill()
+                self.proc.wait()
+
+
+if __name__ == "__main__":
+    serve(json.loads(sys.argv[1]))
@@ -1,14 +1,50 @@
-"""Web scraping tool."""
+"""Web scraping tool.
 
+The fetch runs in a worker thread; HTML extraction is CPU-bound and runs in the shared
+process pool (core.execute.offload), so neither holds up the event loop.
+"""
+
+import asyncio
 import re
 from urllib.parse import urlparse
 
+from ...core.execute import offload
 from ...core.protocols import Tool, ToolResult
 from ...core.result import Err, Ok, Result
-from ..constants import SCRAPE_MAX_CHARS
+from ..constants import SCRAPE_MAX_CHARS, WEB_CACHE_TTL
 from ..security import validate_input
 
 
+def _extract(html: str) -> str | None:
+    """Readable text from fetched HTML, formatted - runs in a pool worker."""
+    import trafilatura
+
+    extracted = trafilatura.extract(html, include_tables=True)
+    return _format_content(extracted) if extracted else None
+
+
+def _format_content(content: str) -> str:
+    """Content formatting."""
+    if not content:
+        return "No content extracted"
+
+    # Clean whitespace intelligently - preserve structure
+    cleaned = re.sub(r"\n\s*\n\s*\n+", "\n\n", content.strip())
+
+    # Handle length limits with intelligent truncation
+    if len(cleaned) > SCRAPE_MAX_CHARS:
+        # Find last complete sentence/paragraph before limit
+        truncated = cleaned[:SCRAPE_MAX_CHARS]
+        last_break = max(truncated.rfind("\n\n"), truncated.rfind(". "), truncated.rfind(".\n"))
+        # Only break at sentence if we don't lose too much content
+        if last_break > SCRAPE_MAX_CHARS * 0.8:
+            truncated = truncated[: last_break + 1]
+
+        return f"{truncated}\n\n[Content continues...]"
+
+    return cleaned
+
+
 class WebScrape(Tool):
     """Extract and format web content with clean output."""
 
@@ -20,18 +56,27 @@ class WebScrape(Tool):
     def description(self) -> str:
         return "Extract web content"
 
+    @property
+    def parallel(self) -> bool:
+        return True
+
+    def cache_policy(self, args: dict) -> dict | None:
+        return {"ttl": WEB_CACHE_TTL}
+
     @property
     def schema(self) -> dict:
         return {"url": {}}
 
-    async def execute(self, url: str, **kwargs) -> Result[ToolResult]:
+    async def execute(
+        self, url: str, security: tuple[str, ...] = None, **kwargs
+    ) -> Result[ToolResult]:
         """Execute clean web scraping."""
         if not url or not url.strip():
             return Err("URL cannot be empty")
 
         url = url.strip()
 
-        if not validate_input(url):
+        if not validate_input(url, security):
             return Err("Invalid URL provided")
 
         try:
@@ -40,18 +85,17 @@ class WebScrape(Tool):
             return Err("Web scraping not available. Install with: pip install trafilatura")
 
         try:
-            # Fetch and extract content
-            content = trafilatura.fetch_url(url)
+            # Fetch in a thread, extract in a worker process
+            content = await asyncio.to_thread(trafilatura.fetch_url, url)
             if not content:
                 return Err(f"Failed to fetch content from: {url}")
 
-            extracted = trafilatura.extract(content, include_tables=True)
-            if not extracted:
+            content_formatted = await offload(_extract, content)
+            if not content_formatted:
                 return Err(f"No readable content found at: {url}")
 
             domain = self._extract_domain(url)
 
-            content_formatted = self._format_content(extracted)
             size_kb = len(content_formatted) / 1024
             outcome = f"Content scraped from {domain} ({size_kb:.1f}KB)"
             return Ok(ToolResult(outcome, content_formatted))
@@ -59,27 +103,6 @@ class WebScrape(Tool):
         except Exception as e:
             return Err(f"Scraping failed: {str(e)}")
 
-    def _format_content(self, content: str) -> str:
-        """Content formatting."""
-        if not content:
-            return "No content extracted"
-
-        # Clean whitespace intelligently - preserve structure
-        cleaned = re.sub(r"\n\s*\n\s*\n+", "\n\n", content.strip())
-
-        # Handle length limits with intelligent truncation
-        if len(cleaned) > SCRAPE_MAX_CHARS:
-            # Find last complete sentence/paragraph before limit
-            truncated = cleaned[:SCRAPE_MAX_CHARS]
-            last_break = max(truncated.rfind("\n\n"), truncated.rfind(". "), truncated.rfind(".\n"))
-            # Only break at sentence if we don't lose too much content
-            if last_break > SCRAPE_MAX_CHARS * 0.8:
-                truncated = truncated[: last_break + 1]
-
-            return f"{truncated}\n\n[Content continues...]"
-
-        return cleaned
-
     def _extract_domain(self, url: str) -> str:
         """Extract clean domain from URL."""
         try:
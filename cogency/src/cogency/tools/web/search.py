@@ -1,7 +1,10 @@
 """Web search tool."""
 
+import asyncio
+
 from ...core.protocols import Tool, ToolResult
 from ...core.result import Err, Ok, Result
+from ..constants import WEB_CACHE_TTL
 
 
 class WebSearch(Tool):
@@ -18,6 +21,13 @@ class WebSearch(Tool):
     def description(self) -> str:
         return "Search the web for information"
 
+    @property
+    def parallel(self) -> bool:
+        return True
+
+    def cache_policy(self, args: dict) -> dict | None:
+        return {"ttl": WEB_CACHE_TTL}
+
     @property
     def schema(self) -> dict:
         return {"query": {}}
@@ -39,7 +49,10 @@ class WebSearch(Tool):
         effective_limit = SEARCH_DEFAULT_RESULTS
 
         try:
-            results = DDGS().text(query.strip(), max_results=effective_limit)
+            # Blocking HTTP - off the event loop
+            results = await asyncio.to_thread(
+                DDGS().text, query.strip(), max_results=effective_limit
+            )
 
             if not results:
                 outcome = f"Search completed for '{query}'"
@@ -5,6 +5,7 @@ from unittest.mock import Mock
 import pytest
 
 from cogency.core.result import Ok
+from cogency.lib.storage import Memory
 
 # Force pytest-asyncio to load
 pytest_plugins = ["pytest_asyncio"]
@@ -45,8 +46,8 @@ def mock_llm():
 
 @pytest.fixture
 def mock_storage():
-    """Mock storage for all tests."""
-    return Mock()
+    """In-memory storage for all tests - no disk I/O."""
+    return Memory()
 
 
 @pytest.fixture
@@ -31,3 +31,21 @@ def test_system_message_exists():
     assert system_message["role"] == "system"
     assert isinstance(system_message["content"], str)
     assert len(system_message["content"]) > 0
+
+
+def test_assembly_uses_configured_storage(mock_llm, mock_storage):
+    """History and profile come from the configured storage, not the default database."""
+    from cogency.core.config import Config
+
+    mock_storage.save_profile("mem_user", {"who": "in-memory tester"})
+    mock_storage.save_message("mem_conv", "mem_user", "user", "earlier question")
+    mock_storage.save_message("mem_conv", "mem_user", "respond", "earlier answer")
+    mock_storage.save_message("mem_conv", "mem_user", "user", "current question")
+
+    config = Config(llm=mock_llm, storage=mock_storage, tools=[])
+    messages = context.assemble("current question", "mem_user", "mem_conv", [], config)
+
+    system = messages[0]["content"]
+    assert "in-memory tester" in system
+    assert "USER: earlier question" in system
+    assert "ASSISTANT: earlier answer" in system
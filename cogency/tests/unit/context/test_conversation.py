@@ -222,3 +222,26 @@ def test_think_filter_first(mock_load):
     # Verify no think content leaked through
     for line in lines:
         assert "Think" not in line
+
+
+@patch("cogency.context.conversation.load_messages")
+def test_result_checkpoints_folded(mock_load):
+    """Checkpoints give way to the RESULTS row; a turn cut short keeps one per call."""
+    mock_load.return_value = [
+        {"type": Event.USER, "content": "q"},
+        {"type": Event.CALLS, "content": '[{"name": "read", "args": {}}]'},
+        {"type": "result_done", "content": '{"index": 0, "result": "stale"}'},
+        {"type": Event.RESULTS, "content": '["fresh"]'},
+        {"type": Event.RESPOND, "content": "done"},
+        {"type": Event.USER, "content": "again"},
+        {"type": Event.CALLS, "content": '[{"name": "read"}, {"name": "list"}, {"name": "grep"}]'},
+        {"type": "result_done", "content": '{"index": 1, "result": "files"}'},
+        {"type": Event.USER, "content": "next"},
+    ]
+
+    result = history("conv_123")
+
+    assert "RESULT_DONE" not in result
+    assert "fresh" in result and "stale" not in result
+    assert "files" in result
+    assert result.count("No result") == 2  # Calls 0 and 2 never finished
@@ -0,0 +1,134 @@
+"""Learner tests - debounce, cached counter, concurrency and batching."""
+
+import asyncio
+from unittest.mock import Mock, patch
+
+import pytest
+
+from cogency.context.learner import Learner
+
+PROFILE = {"who": "dev", "_meta": {"last_learned_at": 0}}
+
+
+@pytest.mark.asyncio
+async def test_debounce_coalesces():
+    """A burst of turns produces a single learning check."""
+    learner = Learner(debounce=0.01)
+    llm = Mock()
+
+    with (
+        patch("cogency.context.profile.get", return_value=PROFILE) as mock_get,
+        patch("cogency.context.profile._count_unlearned", return_value=0),
+    ):
+        for _ in range(5):
+            learner.submit("alice", llm)
+        await learner.flush()
+
+    assert mock_get.call_count == 1
+    await learner.close()
+
+
+@pytest.mark.asyncio
+async def test_counter_incremental():
+    """Counter is seeded once from storage, then bumped per user turn."""
+    learner = Learner(debounce=0.01)
+    llm = Mock()
+
+    with (
+        patch("cogency.context.profile.get", return_value=PROFILE),
+        patch("cogency.context.profile._count_unlearned", return_value=2) as mock_count,
+    ):
+        learner.submit("alice", llm)
+        await learner.flush()
+        assert learner.pending("alice") == 2
+
+        learner.submit("alice", llm)
+        learner.submit("alice", llm)
+        assert learner.pending("alice") == 4
+        await learner.flush()
+
+    assert mock_count.call_count == 1
+    await learner.close()
+
+
+@pytest.mark.asyncio
+async def test_counters_bounded():
+    """Cached counters are capped; an evicted user is re-seeded from storage."""
+    learner = Learner(debounce=0.01, counters=2)
+    llm = Mock()
+
+    with (
+        patch("cogency.context.profile.get", return_value=PROFILE),
+        patch("cogency.context.profile._count_unlearned", return_value=1) as mock_count,
+    ):
+        for user_id in ("alice", "bob", "carol"):
+            learner.submit(user_id, llm)
+        await learner.flush()
+        assert len(learner._unlearned) == 2
+        assert learner.pending("alice") is None
+
+        learner.submit("alice", llm)
+        await learner.flush()
+        assert learner.pending("alice") == 1
+
+    assert mock_count.call_count == 4
+    await learner.close()
+
+
+@pytest.mark.asyncio
+async def test_concurrency_bounded():
+    """No more than `concurrency` learning calls run at once."""
+    learner = Learner(debounce=0, concurrency=2)
+    llm = Mock()
+    running = 0
+    peak = 0
+
+    async def slow_learn(user_id, llm):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return True
+
+    with (
+        patch("cogency.context.profile.get", return_value=PROFILE),
+        patch("cogency.context.profile._count_unlearned", return_value=10),
+        patch("cogency.context.profile._learn", side_effect=slow_learn) as mock_learn,
+    ):
+        for i in range(6):
+            learner.submit(f"user{i}", llm)
+        await learner.flush()
+
+    assert mock_learn.call_count == 6
+    assert peak <= 2
+    await learner.close()
+
+
+@pytest.mark.asyncio
+async def test_batching():
+    """Due users sharing an LLM are folded into one batch request."""
+    learner = Learner(debounce=0, batch_size=4)
+    llm = Mock()
+
+    async def learn_batch(user_ids, llm):
+        return dict.fromkeys(user_ids, True)
+
+    with (
+        patch("cogency.context.profile.get", return_value=PROFILE),
+        patch("cogency.context.profile._count_unlearned", return_value=10),
+        patch("cogency.context.profile._learn_batch", side_effect=learn_batch) as mock_batch,
+    ):
+        for user_id in ["a", "b", "c"]:
+            learner.submit(user_id, llm)
+        await learner.flush()
+
+    mock_batch.assert_called_once()
+    assert sorted(mock_batch.call_args.args[0]) == ["a", "b", "c"]
+    await learner.close()
+
+
+def test_submit_requires_loop():
+    """Submitting outside an event loop raises so sync callers can skip."""
+    with pytest.raises(RuntimeError):
+        Learner().submit("alice", Mock())
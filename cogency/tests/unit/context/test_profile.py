@@ -3,6 +3,8 @@
 from pathlib import Path
 from unittest.mock import Mock, patch
 
+import pytest
+
 from cogency.context import profile
 
 
@@ -25,6 +27,21 @@ def test_format_empty():
         assert formatted == ""
 
 
+def test_format_prerendered():
+    """Profile format renders once per profile version."""
+    profile._rendered.clear()
+    with (
+        patch("cogency.context.profile.profile_version", return_value=3),
+        patch("cogency.context.profile.get", return_value={"who": "dev"}) as mock_get,
+    ):
+        first = profile.format("user123")
+        second = profile.format("user123")
+
+    assert first == second
+    assert "USER PROFILE" in first
+    assert mock_get.call_count == 1
+
+
 def test_delta_no_profile():
     """Profile _delta returns False for missing profile."""
     with patch("cogency.context.profile.get", return_value=None):
@@ -56,3 +73,30 @@ def test_learn_triggers():
         # In test environment, learning should be skipped
         result = profile.learn("user123", mock_llm)
         assert result is None  # Should return early due to pytest detection
+
+
+@pytest.mark.asyncio
+async def test_learn_batch_single_request():
+    """Batch learning sends one request and saves each user's update."""
+    from cogency.core.result import Ok
+
+    mock_llm = Mock()
+
+    async def generate(messages):
+        return Ok('{"alice": {"who": "developer"}, "bob": "SKIP"}')
+
+    mock_llm.generate = Mock(side_effect=generate)
+    gathered = {"alice": ({"who": ""}, ["I write Python"]), "bob": ({"who": ""}, ["hi"])}
+
+    with (
+        patch("cogency.context.profile._gather", side_effect=gathered.get),
+        patch("cogency.context.profile.save_profile", return_value=True) as mock_save,
+    ):
+        outcomes = await profile._learn_batch(["alice", "bob"], mock_llm)
+
+    assert mock_llm.generate.call_count == 1
+    assert outcomes == {"alice": True, "bob": False}
+    saved_user, saved_profile = mock_save.call_args.args
+    assert saved_user == "alice"
+    assert saved_profile["who"] == "developer"
+    assert "_meta" in saved_profile
@@ -74,6 +74,20 @@ def test_config_required_fields(mock_llm, mock_storage):
     assert len(config_with_tools.tools) == 1
 
 
+def test_config_rejects_async_storage(mock_llm):
+    """An async Storage is refused up front instead of its writes being silently dropped."""
+
+    class AsyncStorage:
+        async def save_message(self, conversation_id, user_id, type, content, timestamp=None):
+            return True
+
+        def load_messages(self, conversation_id, include=None, exclude=None, limit=None):
+            return []
+
+    with pytest.raises(TypeError, match="save_message"):
+        Config(llm=mock_llm, storage=AsyncStorage(), tools=[])
+
+
 def test_config_separation(mock_llm, mock_storage):
     """Config separates capabilities from runtime params."""
 
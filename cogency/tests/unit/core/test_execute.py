@@ -1,12 +1,23 @@
 """Execute tests - Tool execution pipeline coverage."""
 
-from unittest.mock import AsyncMock, MagicMock
+import asyncio
+import os
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from cogency.core.execute import _execute, create_results_event, execute_tools
-from cogency.core.protocols import Event, ToolResult
+from cogency.core.config import Config
+from cogency.core.execute import (
+    _execute,
+    create_results_event,
+    execute_tools,
+    offload,
+    stream_tools,
+)
+from cogency.core.protocols import Event, Tool, ToolResult
 from cogency.core.result import Err, Ok
+from cogency.tools.system import SystemShell
 
 
 @pytest.mark.asyncio
@@ -214,6 +225,24 @@ async def test_execute_sandbox_flag():
     mock_tool.execute.assert_called_with(filename="test.txt", sandbox=False)
 
 
+@pytest.mark.asyncio
+async def test_execute_leaves_call_args_untouched():
+    """Injected context reaches the tool, not the call dict the CALLS event records."""
+    mock_tool = AsyncMock()
+    mock_tool.name = "read"
+    mock_tool.execute.return_value = Ok(ToolResult("File content"))
+
+    mock_config = MagicMock()
+    mock_config.tools = [mock_tool]
+    mock_config.sandbox = True
+
+    call = {"name": "read", "args": {"filename": "test.txt"}}
+    await _execute(call, mock_config, "alice", conversation_id="conv")
+
+    assert call == {"name": "read", "args": {"filename": "test.txt"}}
+    mock_tool.execute.assert_called_with(filename="test.txt", sandbox=True, user_id="alice")
+
+
 def test_create_results_event():
     """Results event creation - event structure."""
     individual_results = ["result1", "result2", "error: failed"]
@@ -235,7 +264,6 @@ def test_create_results_event():
     assert event["results"] == individual_results
 
     # Timestamp is recent float
-    import time
 
     assert isinstance(event["timestamp"], float)
     assert abs(event["timestamp"] - time.time()) < 1.0  # Within 1 second
@@ -266,3 +294,171 @@ def test_create_results_event_complex():
     parsed = json.loads(event["content"])
     assert parsed == complex_results
     assert event["results"] == complex_results
+
+
+class SleepTool(Tool):
+    """Slow tool - waits without blocking the loop, like the file and web tools do I/O."""
+
+    def __init__(self, name, parallel=True, gate=None):
+        self._name = name
+        self._parallel = parallel
+        self.gate = gate  # Barrier every call must reach before any finishes
+
+    @property
+    def name(self):
+        return self._name
+
+    @property
+    def description(self):
+        return "sleep"
+
+    @property
+    def parallel(self):
+        return self._parallel
+
+    async def execute(self, seconds: float = 0.2, **kwargs):
+        if self.gate:
+            await self.gate()
+        await asyncio.sleep(seconds)
+        return Ok(ToolResult(f"{self._name} {seconds}"))
+
+
+def _barrier(parties: int):
+    """Awaitable that releases only once `parties` callers are waiting at the same time."""
+    arrived = []
+    ready = asyncio.Event()
+
+    async def wait():
+        arrived.append(1)
+        if len(arrived) == parties:
+            ready.set()
+        await asyncio.wait_for(ready.wait(), 1)
+
+    return wait
+
+
+@pytest.mark.asyncio
+async def test_parallel_fan_out():
+    """Independent calls run concurrently, in call order; side-effect calls stay serial."""
+    search = SleepTool("search", gate=_barrier(3))
+    config = Config(
+        llm=None,
+        storage=None,
+        tools=[search, SleepTool("write", parallel=False)],
+        parallel=True,
+    )
+    calls = [
+        {"name": "search", "args": {"seconds": 0.02}},
+        {"name": "search", "args": {"seconds": 0.01}},
+        {"name": "search", "args": {"seconds": 0.02}},
+        {"name": "write", "args": {"seconds": 0}},
+    ]
+
+    # Sequential execution would time out at the barrier - all three must be in flight
+    results = await execute_tools(calls, config)
+
+    assert results == ["search 0.02", "search 0.01", "search 0.02", "write 0"]
+
+
+@pytest.mark.asyncio
+async def test_parallel_branch_budget():
+    """A branch over its time budget fails alone - the others still return."""
+    config = Config(llm=None, storage=None, tools=[SleepTool("search")], parallel=True)
+    calls = [
+        {"name": "search", "args": {"seconds": 0.3}},
+        {"name": "search", "args": {"seconds": 0}},
+    ]
+
+    with patch("cogency.tools.constants.PARALLEL_TOOL_TIMEOUT", 0.1):
+        results = await execute_tools(calls, config)
+
+    assert results == ["Tool search timed out after 0.1s", "search 0"]
+
+
+@pytest.mark.asyncio
+async def test_parallel_timeout_cancels_branch():
+    """A branch over budget is cancelled, not left running behind the turn."""
+    cancelled = asyncio.Event()
+
+    class HangTool(SleepTool):
+        async def execute(self, seconds: float = 0.2, **kwargs):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+    config = Config(
+        llm=None, storage=None, tools=[HangTool("scrape"), SleepTool("search")], parallel=True
+    )
+    calls = [{"name": "scrape", "args": {}}, {"name": "search", "args": {"seconds": 0}}]
+
+    with patch("cogency.tools.constants.PARALLEL_TOOL_TIMEOUT", 0.05):
+        results = await execute_tools(calls, config)
+
+    assert results[0] == "Tool scrape timed out after 0.05s"
+    assert cancelled.is_set()
+
+
+@pytest.mark.asyncio
+async def test_stream_tools_progress_events():
+    """Per-call events stream as calls run; each result is saved on completion, then RESULTS."""
+    storage = MagicMock()
+    config = Config(
+        llm=None,
+        storage=storage,
+        tools=[SleepTool("search"), SystemShell()],
+        sandbox=False,
+    )
+    calls = [
+        {"name": "search", "args": {"seconds": 0}},
+        {"name": "shell", "args": {"command": "echo streamed"}},
+    ]
+
+    events = [e async for e in stream_tools(calls, config, "user", "conv")]
+
+    assert [(e["type"], e.get("index")) for e in events] == [
+        (Event.RESULT_STARTED, 0),
+        (Event.RESULT_DONE, 0),
+        (Event.RESULT_STARTED, 1),
+        (Event.RESULT_CHUNK, 1),
+        (Event.RESULT_DONE, 1),
+        (Event.RESULTS, None),
+    ]
+    assert events[3]["content"] == "streamed\n"
+    assert events[-1]["results"] == [events[1]["content"], events[4]["content"]]
+
+    saved = [c.args[2] for c in storage.save_message.call_args_list]
+    assert saved == [Event.RESULT_DONE, Event.RESULT_DONE, Event.RESULTS]
+
+
+@pytest.mark.asyncio
+async def test_offload_runs_in_worker_process():
+    """CPU-bound work runs in the shared pool, in another process."""
+    assert await offload(pow, 2, 10) == 1024
+    assert await offload(os.getpid) != os.getpid()
+
+
+@pytest.mark.asyncio
+async def test_offload_without_pool():
+    """With no workers configured, offloaded work falls back to a thread."""
+    with patch("cogency.tools.constants.CPU_POOL_WORKERS", 0):
+        assert await offload(os.getpid) == os.getpid()
+
+
+@pytest.mark.asyncio
+async def test_offload_cancelled_while_queued():
+    """A call cancelled while waiting for a slot never takes one - the queue stays whole."""
+    from cogency.core import execute
+
+    with patch("cogency.tools.constants.CPU_POOL_QUEUE", 1):
+        slots = execute._queue()
+        async with slots:  # Queue full
+            waiter = asyncio.create_task(offload(pow, 2, 3))
+            await asyncio.sleep(0.01)
+            waiter.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await waiter
+
+        assert not slots.locked()
+        assert await asyncio.wait_for(offload(pow, 2, 3), 10) == 8
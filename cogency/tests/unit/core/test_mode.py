@@ -1,5 +1,7 @@
 """Mode tests - Replay vs Inject execution patterns."""
 
+import json
+import os
 from unittest.mock import Mock, patch
 
 import pytest
@@ -8,6 +10,7 @@ from cogency.core.config import Config
 from cogency.core.protocols import Event
 from cogency.core.replay import stream as replay_stream
 from cogency.core.resume import stream as resume_stream
+from cogency.lib.tokens import Meter
 
 
 @pytest.mark.asyncio
@@ -86,7 +89,7 @@ async def test_inject_stateful_behavior(mock_llm, mock_storage):
 
     # Override with custom tokens for this test
 
-    mock_llm.receive.side_effect = mock_generator(["token1", "token2"])
+    mock_llm.receive.side_effect = mock_generator(["token1", "token2", Event.YIELD.delimiter])
 
     config = Config(llm=mock_llm, storage=mock_storage, tools=[], max_iterations=2)
 
@@ -126,7 +129,7 @@ async def test_inject_websocket_fallback():
         async def mock_replay_events(config, query, user_id, conversation_id):
             yield {"type": Event.RESPOND, "content": "fallback response"}
 
-        mock_replay.side_effect = lambda cfg, q, u, c: mock_replay_events(cfg, q, u, c)
+        mock_replay.side_effect = lambda cfg, q, u, c, meter=None: mock_replay_events(cfg, q, u, c)
 
         events = []
         async for event in resume_stream(config, "test", "user", "conv"):
@@ -136,6 +139,125 @@ async def test_inject_websocket_fallback():
         mock_replay.assert_called_once()
 
 
+class SocketLLM:
+    """Realtime provider stand-in - each receive() plays the next scripted response."""
+
+    resumable = True
+    stream_model = "socket-model"
+    api_key = "key"
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.connects = []
+        self.sent = []
+        self.closed = []
+
+    async def connect(self, messages):
+        self.connects.append(list(messages))
+        return {"id": len(self.connects)}
+
+    async def send(self, session, content):
+        self.sent.append(content)
+        return True
+
+    async def receive(self, session):
+        for token in self.responses.pop(0):
+            yield token
+
+    async def close(self, session):
+        self.closed.append(session["id"])
+        return True
+
+
+CONTEXT = [{"role": "system", "content": "sys"}, {"role": "user", "content": "q"}]
+
+
+@pytest.mark.asyncio
+async def test_resume_tool_turn_stays_in_session():
+    """Tool results go into the same session and its next response is received - no replay."""
+    llm = SocketLLM(
+        [
+            [Event.CALLS.delimiter + ' [{"name": "t", "args": {}}]', Event.YIELD.delimiter],
+            [Event.RESPOND.delimiter + " done", Event.YIELD.delimiter],
+        ]
+    )
+    config = Config(llm=llm, storage=Mock(), tools=[])
+    from tests.conftest import mock_generator
+
+    results = [{"type": "results", "content": "ok", "results": ["ok"]}]
+
+    with (
+        patch("cogency.core.resume.context") as mock_context,
+        patch("cogency.core.execute.stream_tools", mock_generator(results)),
+        patch("cogency.core.replay.stream") as mock_replay,
+    ):
+        mock_context.assemble.return_value = CONTEXT
+        events = [e async for e in resume_stream(config, "q", "user", "conv")]
+
+    mock_replay.assert_not_called()
+    assert llm.connects == [CONTEXT]
+    assert llm.sent == [json.dumps(["ok"])]
+    assert any(e["type"] == Event.RESPOND and e["content"].strip() == "done" for e in events)
+
+
+@pytest.mark.asyncio
+async def test_resume_meters_each_response():
+    """Each session response is its own ledger row, on the stream model and session key."""
+    llm = SocketLLM(
+        [
+            [Event.CALLS.delimiter + ' [{"name": "t", "args": {}}]', Event.YIELD.delimiter],
+            [Event.RESPOND.delimiter + " done", Event.YIELD.delimiter],
+        ]
+    )
+    config = Config(llm=llm, storage=Mock(), tools=[])
+    meter = Meter("gpt-4o-mini")
+    from tests.conftest import mock_generator
+
+    results = [{"type": "results", "content": "ok", "results": ["ok"]}]
+    keys = {"SOCKETLLM_API_KEY_1": "other", "SOCKETLLM_API_KEY_2": "key"}
+
+    with (
+        patch.dict(os.environ, keys),
+        patch.dict("cogency.lib.rotation._rotators", clear=True),
+        patch("cogency.core.resume.context") as mock_context,
+        patch("cogency.core.execute.stream_tools", mock_generator(results)),
+    ):
+        mock_context.assemble.return_value = CONTEXT
+        [e async for e in resume_stream(config, "q", "user", "conv", meter=meter)]
+
+    assert meter.requests == 2
+    assert [(r["model"], r["key"]) for r in meter.records] == [("socket-model", 1)] * 2
+    assert meter.records[1]["input"] == len(json.dumps(["ok"])) // 4  # Only the results sent
+
+
+@pytest.mark.asyncio
+async def test_resume_reconnects_with_held_transcript():
+    """A dropped session is replaced by one holding the context plus the partial reply."""
+    llm = SocketLLM(
+        [
+            [Event.RESPOND.delimiter + " par"],  # Drops before the response completes
+            ["tial", Event.YIELD.delimiter],
+        ]
+    )
+    config = Config(llm=llm, storage=Mock(), tools=[])
+
+    with (
+        patch("cogency.core.resume.context") as mock_context,
+        patch("cogency.core.replay.stream") as mock_replay,
+    ):
+        mock_context.assemble.return_value = CONTEXT
+        events = [e async for e in resume_stream(config, "q", "user", "conv")]
+
+    mock_replay.assert_not_called()
+    mock_context.assemble.assert_called_once()
+    assert llm.connects[1] == [
+        *CONTEXT,
+        {"role": "assistant", "content": Event.RESPOND.delimiter + " par"},
+    ]
+    assert llm.closed == [1]
+    assert any(e["type"] == Event.RESPOND and e["content"].strip() == "partial" for e in events)
+
+
 @pytest.mark.asyncio
 async def test_mode_tool_execution():
     from tests.conftest import mock_generator
@@ -161,10 +283,9 @@ async def test_mode_tool_execution():
                 ]
             )
 
-            with patch("cogency.core.execute.execute_tools_and_save") as mock_execute:
-                mock_execute.return_value = (
-                    ["tool result"],
-                    {"type": "results", "content": "test"},
+            with patch("cogency.core.execute.stream_tools") as mock_execute:
+                mock_execute.side_effect = mock_generator(
+                    [{"type": "results", "content": "test", "results": ["tool result"]}]
                 )
 
                 events = []
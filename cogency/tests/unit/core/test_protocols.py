@@ -39,9 +39,10 @@ class TestEventEnum:
         """Event enum behaves like enum - type safety."""
         # Enum iteration
         all_events = list(Event)
-        assert len(all_events) == 6
+        assert len(all_events) == 9
         assert Event.THINK in all_events
         assert Event.YIELD in all_events
+        assert Event.RESULT_DONE in all_events  # Tool progress - streamed, not parsed
 
         # Enum comparison
         assert Event.THINK != Event.CALLS
@@ -6,7 +6,9 @@ import pytest
 
 from cogency.core.config import Config
 from cogency.core.protocols import Event
+from cogency.core.result import Ok
 from cogency.core.stream import stream
+from cogency.lib.tokens import Usage
 
 
 @pytest.mark.asyncio
@@ -138,3 +140,31 @@ async def test_stream_auto_mode_fallback(mock_storage):
 
     # The actual fallback behavior is tested in integration
     # Unit test just verifies config accepts auto mode
+
+
+class UsageLLM:
+    """Streams one response and reports provider usage."""
+
+    llm_model = "gpt-4o"
+    resumable = False
+
+    async def stream(self, messages):
+        yield Ok("§RESPOND: hello")
+        yield Ok(Usage(12, 4, cached=2))
+        yield Ok("§YIELD")
+
+
+@pytest.mark.asyncio
+async def test_stream_records_usage(mock_storage):
+    """Each turn ends with a metrics event and writes its usage ledger rows."""
+    config = Config(llm=UsageLLM(), storage=mock_storage, tools=[], mode="replay", max_iterations=1)
+    events = [event async for event in stream(config, "hi", "alice", "conv")]
+
+    metrics = events[-1]
+    assert metrics["type"] == "metrics"
+    assert (metrics["input_tokens"], metrics["output_tokens"]) == (12, 4)
+
+    [record] = mock_storage.load_usage()
+    assert record["user_id"] == "alice" and record["conversation_id"] == "conv"
+    assert record["cached"] == 2 and not record["estimated"]
+    assert record["ttft"] is not None
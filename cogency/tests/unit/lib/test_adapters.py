@@ -0,0 +1,59 @@
+"""Payload adapter tests - native structures and incremental conversion."""
+
+from cogency.lib.llms import adapters
+from cogency.lib.llms.adapters import TOOL
+
+
+def _conversation():
+    return [
+        {"role": "system", "content": "rules"},
+        {"role": "user", "content": "hi"},
+        {"role": "assistant", "content": "calling"},
+        {"role": TOOL, "content": '["ok"]'},
+        {"role": "system", "content": "Final iteration"},
+    ]
+
+
+def test_anthropic_system_and_blocks():
+    """Leading system becomes system=, later system and tool turns merge into one user turn."""
+    payload = adapters.anthropic(_conversation())
+
+    assert payload["system"][0]["text"] == "rules"
+    assert payload["system"][0]["cache_control"] == {"type": "ephemeral"}
+    assert [turn["role"] for turn in payload["messages"]] == ["user", "assistant", "user"]
+    assert payload["messages"][-1]["content"] == [
+        {"type": "text", "text": '["ok"]'},
+        {"type": "text", "text": "Final iteration"},
+    ]
+
+
+def test_gemini_contents():
+    """System instruction in config, assistant turns as model, text parts."""
+    payload = adapters.gemini(_conversation())
+
+    assert payload["config"] == {"system_instruction": "rules"}
+    assert payload["contents"][0] == {"role": "user", "parts": [{"text": "hi"}]}
+    assert payload["contents"][1]["role"] == "model"
+    assert len(payload["contents"][2]["parts"]) == 2
+
+
+def test_openai_tool_results_as_user():
+    """Chat messages pass through; tool results become user turns."""
+    messages = adapters.openai(_conversation())["messages"]
+    assert [m["role"] for m in messages] == ["system", "user", "assistant", "user", "system"]
+
+
+def test_appended_messages_reuse_conversion():
+    """Appending to the same list converts only the new messages."""
+    messages = _conversation()[:2]
+    first = adapters.anthropic(messages)["messages"]
+    head = first[0]
+
+    messages.append({"role": TOOL, "content": "result"})
+    second = adapters.anthropic(messages)["messages"]
+    assert second[0] is head  # Earlier conversion reused, not rebuilt
+    assert second[0]["content"][-1]["text"] == "result"
+
+    # A different list never inherits another's conversion
+    other = adapters.anthropic([{"role": "user", "content": "fresh"}])["messages"]
+    assert other == [{"role": "user", "content": [{"type": "text", "text": "fresh"}]}]
@@ -0,0 +1,33 @@
+"""LRU cache tests - bounded eviction and recency."""
+
+import pytest
+
+from cogency.lib.cache import LRU
+
+
+def test_evicts_least_recent():
+    """Oldest untouched entry is evicted first."""
+    cache = LRU(maxsize=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.get("a")  # Touch a - b becomes least recent
+
+    evicted = cache.put("c", 3)
+
+    assert evicted == [("b", 2)]
+    assert "a" in cache
+    assert "c" in cache
+    assert len(cache) == 2
+
+
+def test_get_default():
+    """Missing keys return default."""
+    cache = LRU()
+    assert cache.get("missing") is None
+    assert cache.get("missing", 0) == 0
+
+
+def test_invalid_size():
+    """Cache must hold at least one entry."""
+    with pytest.raises(ValueError):
+        LRU(maxsize=0)
@@ -0,0 +1,97 @@
+"""Retention tests - policy scoping, export, bounded deletion and summaries."""
+
+import tempfile
+import time
+
+import pytest
+
+from cogency.context.conversation import history
+from cogency.lib.retention import ARCHIVE, Policy, archive, read_archive, summarize
+from cogency.lib.storage import load_messages, save_message
+
+DAY = 86400
+
+
+@pytest.fixture
+def temp_dir():
+    with tempfile.TemporaryDirectory() as tmp:
+        yield tmp
+
+
+def _seed(temp_dir, conversation_id, user_id, ages_days):
+    now = time.time()
+    for i, age in enumerate(ages_days):
+        msg_type = "user" if i % 2 == 0 else "respond"
+        assert save_message(
+            conversation_id, user_id, msg_type, f"msg {i}", temp_dir, now - age * DAY + i
+        )
+
+
+@pytest.mark.parametrize("format", ["jsonl", "columnar"])
+def test_archive_exports_and_deletes(temp_dir, format):
+    """Expired rows land in the archive file and leave the hot table."""
+    _seed(temp_dir, "conv", "alice", [100, 100, 100, 1])
+
+    stats = archive(Policy(max_age_days=30), base_dir=temp_dir, format=format, chunk_size=2)
+
+    assert stats["rows"] == 3
+    assert stats["conversations"] == 1
+    archived = list(read_archive(stats["path"]))
+    assert [row["content"] for row in archived] == ["msg 0", "msg 1", "msg 2"]
+    assert [m["content"] for m in load_messages("conv", temp_dir)] == ["msg 3"]
+
+
+def test_per_user_policy(temp_dir):
+    """User overrides extend or disable expiry."""
+    _seed(temp_dir, "a_conv", "alice", [100])
+    _seed(temp_dir, "b_conv", "bob", [100])
+    _seed(temp_dir, "c_conv", "carol", [100])
+
+    policy = Policy(max_age_days=30, users={"bob": 365, "carol": None})
+    stats = archive(policy, base_dir=temp_dir)
+
+    assert stats["rows"] == 1
+    assert load_messages("a_conv", temp_dir) == []
+    assert len(load_messages("b_conv", temp_dir)) == 1
+    assert len(load_messages("c_conv", temp_dir)) == 1
+
+
+def test_dry_run(temp_dir):
+    """Dry run counts without touching data."""
+    _seed(temp_dir, "conv", "alice", [100, 100])
+
+    stats = archive(Policy(max_age_days=30), base_dir=temp_dir, dry_run=True)
+
+    assert stats["rows"] == 2
+    assert stats["path"] is None
+    assert len(load_messages("conv", temp_dir)) == 2
+
+
+def test_summary_record_in_history(temp_dir):
+    """Summaries survive as one archive record that history always shows."""
+    from unittest.mock import patch
+
+    _seed(temp_dir, "conv", "alice", [200, 200])
+    archive(Policy(max_age_days=30), base_dir=temp_dir, summarizer=summarize)
+    _seed(temp_dir, "conv", "alice", [100, 100, 0])
+    archive(Policy(max_age_days=30), base_dir=temp_dir, summarizer=summarize)
+
+    messages = load_messages("conv", temp_dir)
+    assert [m["type"] for m in messages] == [ARCHIVE, "user"]
+    assert messages[0]["content"].count("Earlier topics") == 2
+
+    with patch(
+        "cogency.context.conversation.load_messages",
+        return_value=[
+            *messages,
+            {"type": "respond", "content": "Answer"},
+            {"type": "user", "content": "Now"},
+        ],
+    ):
+        assert history("conv").startswith("ARCHIVED: Earlier topics: msg 0")
+
+
+def test_invalid_format(temp_dir):
+    """Unknown export formats are rejected."""
+    with pytest.raises(ValueError, match="format"):
+        archive(Policy(), base_dir=temp_dir, format="csv")
@@ -1,11 +1,21 @@
 """Minimal rotation tests - essential coverage only."""
 
+import asyncio
 import os
 from unittest.mock import patch
 
 import pytest
 
-from cogency.lib.rotation import Rotator, _rotators, with_rotation
+from cogency.core.result import Err, Ok
+from cogency.lib.rotation import (
+    STREAM_RETRY,
+    ClientRegistry,
+    Rotator,
+    _rotators,
+    rotate,
+    with_rotation,
+)
+from cogency.lib.tokens import Usage
 
 
 def setup_function():
@@ -68,3 +78,150 @@ async def test_provider_integration():
 
         result = await with_rotation("GEMINI", _generate)
         assert result == "Generated text"
+
+
+class Client:
+    def __init__(self, name):
+        self.name = name
+        self.closed = False
+
+    async def aclose(self):
+        self.closed = True
+
+
+@pytest.mark.asyncio
+async def test_registry_bounded():
+    """Least recently used clients beyond the limit are closed."""
+    registry = ClientRegistry(maxsize=2)
+    made = {}
+
+    async def use(name):
+        async with registry.lease(name, lambda: made.setdefault(name, Client(name))) as client:
+            return client
+
+    a = await use("a")
+    await use("b")
+    assert await use("a") is a  # Cached - and now most recent
+    await use("c")
+
+    assert "b" not in registry and made["b"].closed
+    assert "a" in registry and not a.closed
+    assert len(registry) == 2
+
+    await registry.aclose()
+    assert len(registry) == 0
+    assert made["a"].closed and made["c"].closed
+
+
+@pytest.mark.asyncio
+async def test_registry_idle_waits_for_lease():
+    """Idle clients are evicted, but never closed under a running call."""
+    registry = ClientRegistry(idle=0)
+
+    async with registry.lease("busy", lambda: Client("busy")) as busy:
+        async with registry.lease("other", lambda: Client("other")):
+            pass
+        assert not busy.closed
+
+    async with registry.lease("next", lambda: Client("next")):
+        pass
+    assert busy.closed
+    assert "busy" not in registry
+
+
+def test_registry_scoped_per_loop():
+    """A client created on one event loop is never handed to another."""
+    registry = ClientRegistry()
+
+    async def use():
+        async with registry.lease("key", lambda: Client("key")) as client:
+            return client
+
+    first = asyncio.run(use())
+    second = asyncio.run(use())
+    assert first is not second
+
+
+class Streamer:
+    """Provider whose streams follow a script of chunk lists, one per request."""
+
+    def __init__(self, *scripts):
+        self.scripts = list(scripts)
+        self.requests = []
+
+    def _create_client(self, api_key):
+        return api_key
+
+    @rotate
+    async def stream(self, client, messages):
+        self.requests.append(messages)
+        for item in self.scripts.pop(0):
+            yield item
+
+
+async def _collect(provider, messages):
+    with (
+        patch.dict(os.environ, {"STREAMER_API_KEY": "key"}, clear=True),
+        patch.dict(STREAM_RETRY, base_delay=0),
+    ):
+        items = [item async for item in provider.stream(messages)]
+    # Key stamps are ledger metadata, not text
+    return [item for item in items if item.failure or not isinstance(item.unwrap(), Usage)]
+
+
+@pytest.mark.asyncio
+async def test_stream_resumes_with_prefill():
+    """A mid-stream failure continues from the emitted text without duplicates."""
+    provider = Streamer(
+        [Ok("Hello "), Ok("wor"), Err("Stream Error: overloaded")],
+        [Ok("ld"), Ok("!")],
+    )
+    items = await _collect(provider, [{"role": "user", "content": "hi"}])
+
+    assert "".join(item.unwrap() for item in items) == "Hello world!"
+    assert provider.requests[1][-1] == {"role": "assistant", "content": "Hello wor"}
+
+
+@pytest.mark.asyncio
+async def test_stream_stamps_key_index():
+    """Each attempt reports which rotated key served it."""
+    provider = Streamer([Ok("hi")])
+    with patch.dict(os.environ, {"STREAMER_API_KEY_1": "a", "STREAMER_API_KEY_2": "b"}, clear=True):
+        items = [item.unwrap() async for item in provider.stream([])]
+    assert items == [Usage(key=0), "hi"]
+
+
+@pytest.mark.asyncio
+async def test_stream_restart_suppresses_replay():
+    """A provider that ignores the prefill and starts over is de-duplicated."""
+    provider = Streamer(
+        [Ok("Hello "), Err("Connection reset")],
+        [Ok("Hel"), Ok("lo wor"), Ok("ld")],
+    )
+    items = await _collect(provider, [{"role": "user", "content": "hi"}])
+    assert "".join(item.unwrap() for item in items) == "Hello world"
+
+
+@pytest.mark.asyncio
+async def test_stream_short_continuation_flushed():
+    """A continuation that ends while still matching the emitted start is not dropped."""
+    provider = Streamer(
+        [Ok("na na "), Err("Connection reset")],
+        [Ok("na")],
+    )
+    items = await _collect(provider, [{"role": "user", "content": "hi"}])
+    assert "".join(item.unwrap() for item in items) == "na na na"
+
+
+@pytest.mark.asyncio
+async def test_stream_retry_bounded():
+    """Permanent errors pass through at once; transient ones stop after the limit."""
+    provider = Streamer([Ok("partial"), Err("invalid api key")])
+    items = await _collect(provider, [])
+    assert [item.failure for item in items] == [False, True]
+    assert len(provider.requests) == 1
+
+    provider = Streamer(*[[Err("503 service unavailable")]] * STREAM_RETRY["attempts"])
+    items = await _collect(provider, [])
+    assert len(items) == 1 and items[0].failure
+    assert len(provider.requests) == STREAM_RETRY["attempts"]
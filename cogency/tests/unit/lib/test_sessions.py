@@ -0,0 +1,115 @@
+"""Session pool tests - warm priming, live reuse, health and bounds."""
+
+import asyncio
+
+import pytest
+
+from cogency.lib.sessions import SessionPool
+
+
+class LiveLLM:
+    """WebSocket provider stand-in - sessions are plain dicts."""
+
+    stream_model = "live-model"
+    api_key = "key"
+
+    def __init__(self):
+        self.connects = []
+        self.primed = []
+        self.closed = []
+
+    async def connect(self, messages):
+        session = {"id": len(self.connects), "messages": list(messages)}
+        self.connects.append(messages)
+        return session
+
+    async def prime(self, session, messages):
+        session["messages"] = list(messages)
+        self.primed.append(session["id"])
+        return True
+
+    async def close(self, session):
+        self.closed.append(session["id"])
+        return True
+
+
+async def _settle():
+    for _ in range(3):
+        await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_warm_session_primed():
+    """After the first connect, the next conversation gets a pre-warmed session."""
+    pool = SessionPool(warm=1)
+    llm = LiveLLM()
+    messages = [{"role": "user", "content": "hi"}]
+
+    first = await pool.open(llm, messages)
+    await _settle()  # Background refill
+    assert llm.connects == [messages, []]
+
+    second = await pool.open(llm, messages)
+    assert second is not first
+    assert llm.primed == [second["id"]]
+    assert second["messages"] == messages
+
+    await _settle()
+    await pool.close()
+    assert len(llm.closed) == 1  # The refilled warm session
+
+
+@pytest.mark.asyncio
+async def test_live_session_reused():
+    """A completed turn's session is handed back for the same conversation only."""
+    pool = SessionPool(warm=0)
+    llm = LiveLLM()
+
+    session = await pool.open(llm, [])
+    await pool.release(llm, "conv", session)
+
+    assert await pool.resume(llm, "other") is None
+    assert await pool.resume(llm, "conv") is session
+    assert await pool.resume(llm, "conv") is None  # Taken - exclusive per turn
+
+
+@pytest.mark.asyncio
+async def test_unhealthy_sessions_recycled():
+    """Idle sessions are closed, and live sessions are bounded."""
+    pool = SessionPool(warm=0, live=1, idle=0.01)
+    llm = LiveLLM()
+
+    a = await pool.open(llm, [])
+    b = await pool.open(llm, [])
+    await pool.release(llm, "a", a)
+    await pool.release(llm, "b", b)
+    assert llm.closed == [a["id"]]  # Over the live limit
+
+    await asyncio.sleep(0.02)
+    assert await pool.resume(llm, "b") is None
+    assert llm.closed == [a["id"], b["id"]]
+
+
+@pytest.mark.asyncio
+async def test_reconnect_replays_held_transcript():
+    """Sends and streamed replies are tracked, and a reconnect loads exactly those."""
+    pool = SessionPool(warm=0)
+    llm = LiveLLM()
+    messages = [{"role": "user", "content": "hi"}]
+
+    session = await pool.open(llm, messages)
+    pool.record(session, "assistant", "hel")
+    pool.record(session, "assistant", "lo")
+    pool.record(session, "user", "results")
+    pool.record(session, "assistant", "par")
+
+    fresh = await pool.reconnect(llm, session)
+    held = [
+        *messages,
+        {"role": "assistant", "content": "hello"},
+        {"role": "user", "content": "results"},
+        {"role": "assistant", "content": "par"},
+    ]
+    assert llm.closed == [session["id"]]
+    assert fresh["messages"] == held
+    assert pool.held(fresh) == held
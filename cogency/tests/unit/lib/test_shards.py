@@ -0,0 +1,183 @@
+"""Sharded storage tests - routing, group commit and shard isolation."""
+
+import os
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+import cogency
+from cogency.lib.shards import Sharded, shard_dirs, shard_for
+from cogency.lib.storage import DB, get_db_path
+
+
+@pytest.fixture
+def sharded():
+    with tempfile.TemporaryDirectory() as tmp:
+        storage = Sharded(tmp, shards=4)
+        yield storage
+        storage.close()
+
+
+def _rows(shard_dir) -> int:
+    with DB.connect(shard_dir) as db:
+        return db.execute("SELECT COUNT(*) FROM messages").fetchone()[0]
+
+
+def test_routes_by_user(sharded):
+    """A user's messages and profile land on one shard - the hashed one."""
+    sharded.save_message("conv_a", "alice", "user", "hello")
+    sharded.save_message("conv_b", "alice", "user", "again")
+    sharded.save_profile("alice", {"who": "dev"})
+
+    shard = shard_for("alice", 4)
+    assert _rows(sharded.dirs[shard]) == 2
+    assert sum(_rows(d) for d in sharded.dirs) == 2
+    assert sharded.load_profile("alice") == {"who": "dev"}
+
+
+def test_conversation_found_across_processes(sharded):
+    """A fresh instance locates existing conversations by probing the shards."""
+    sharded.save_message("conv", "alice", "user", "hello")
+    sharded.save_message("conv", "bob", "respond", "same conversation, other user")
+
+    fresh = Sharded(str(sharded.root.parent), shards=4)
+    messages = fresh.load_messages("conv")
+    fresh.close()
+
+    assert [m["content"] for m in messages] == ["hello", "same conversation, other user"]
+    assert fresh.load_messages("missing") == []
+
+
+def test_concurrent_writes_group_commit(sharded):
+    """Concurrent writers all commit, with gapless per-conversation sequences."""
+
+    def write(i):
+        return sharded.save_message(f"conv_{i % 8}", f"user_{i % 8}", "user", f"m{i}")
+
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        assert all(pool.map(write, range(400)))
+
+    for i in range(8):
+        assert len(sharded.load_messages(f"conv_{i}")) == 50
+    with sqlite3.connect(get_db_path(sharded.dirs[shard_for("user_0", 4)])) as db:
+        seqs = db.execute(
+            "SELECT seq FROM conversations WHERE conversation_id = 'conv_0' ORDER BY seq"
+        ).fetchall()
+    assert [row[0] for row in seqs] == list(range(1, 51))
+
+
+def test_failed_write_rolls_back_alone(sharded):
+    """A failing write in a batch does not take its neighbours down."""
+    sharded.save_message("conv", "alice", "user", "first")
+    writer = sharded._writer(shard_for("alice", 4))
+
+    def boom(db):
+        db.execute("INSERT INTO messages (id) VALUES (NULL)")  # NOT NULL violation
+
+    with pytest.raises(sqlite3.IntegrityError):
+        writer.submit(boom).result()
+    assert sharded.save_message("conv", "alice", "user", "second")
+    assert [m["content"] for m in sharded.load_messages("conv")] == ["first", "second"]
+
+
+def test_concurrent_writes_share_commit(sharded):
+    """Writers queued behind a running batch commit together, each told it succeeded."""
+    started, gate = threading.Event(), threading.Event()
+    writer = sharded._writer(shard_for("alice", 4))
+    writer.submit(lambda db: (started.set(), gate.wait(5)))
+    started.wait(5)
+
+    batches = []
+    commit = writer._commit
+    with patch.object(
+        writer, "_commit", lambda db, jobs: (batches.append(len(jobs)), commit(db, jobs))
+    ):
+        with ThreadPoolExecutor(max_workers=5) as pool:
+            saves = [
+                pool.submit(sharded.save_message, "conv", "alice", "user", f"m{i}")
+                for i in range(5)
+            ]
+            while writer._jobs.qsize() < 5:
+                time.sleep(0.001)
+            gate.set()
+            assert all(save.result() for save in saves)
+
+    assert batches == [5]
+    assert len(sharded.load_messages("conv")) == 5
+
+
+def test_failed_write_returns_false(sharded):
+    """A write that fails to commit reports False to its caller."""
+    with patch("cogency.lib.shards._insert_message", side_effect=sqlite3.OperationalError("boom")):
+        assert not sharded.save_message("conv", "alice", "user", "lost")
+    assert sharded.load_messages("conv") == []
+
+
+def test_writes_durable_without_close(tmp_path):
+    """A process that exits without closing its store keeps every acknowledged write."""
+    script = (
+        "import sys; from cogency.lib.shards import Sharded; "
+        "s = Sharded(sys.argv[1], shards=4); "
+        "assert all(s.save_message(f'c{i % 7}', f'u{i % 5}', 'user', 'x') for i in range(200))"
+    )
+    src = str(Path(cogency.__file__).parents[1])
+    env = {**os.environ, "PYTHONPATH": src}
+    subprocess.run([sys.executable, "-c", script, str(tmp_path)], check=True, env=env)
+
+    assert sum(_rows(d) for d in Sharded(str(tmp_path), shards=4).dirs) == 200
+
+
+def test_new_conversation_skips_probe(sharded, monkeypatch):
+    """The first write of a new conversation opens no shard connections to look for it."""
+    from cogency.lib import shards
+
+    def probe(*args, **kwargs):
+        raise AssertionError("probed shards on a write")
+
+    sharded._writer(shard_for("alice", 4))  # Writer start-up migrates its shard
+    monkeypatch.setattr(shards.DB, "connect", probe)
+    assert sharded.save_message("new_conv", "alice", "user", "hello")
+    monkeypatch.undo()
+    assert [m["content"] for m in sharded.load_messages("new_conv")] == ["hello"]
+
+
+class _Failing:
+    """Connection stand-in whose statement `fails` raises - e.g. BEGIN on a locked file."""
+
+    in_transaction = True
+
+    def __init__(self, fails: str, after: int = 0):
+        self.fails, self.after = fails, after
+
+    def execute(self, sql, *args):
+        if sql == self.fails:
+            if not self.after:
+                raise sqlite3.OperationalError("database is locked")
+            self.after -= 1
+
+
+@pytest.mark.parametrize("fails, after", [("BEGIN IMMEDIATE", 0), ("SAVEPOINT write", 1)])
+def test_failed_batch_resolves_every_write(sharded, fails, after):
+    """Writes a failed batch never reached fail too, instead of waiting forever."""
+    writer = sharded._writer(shard_for("alice", 4))
+    futures = [Future() for _ in range(3)]
+
+    writer._commit(_Failing(fails, after), [(lambda db: None, None, f) for f in futures])
+
+    assert all(isinstance(f.exception(timeout=0), sqlite3.OperationalError) for f in futures)
+
+
+def test_shard_count_fixed(sharded):
+    """Reopening with a different shard count is refused."""
+    base_dir = str(sharded.root.parent)
+    assert len(shard_dirs(base_dir)) == 4
+    with pytest.raises(ValueError):
+        Sharded(base_dir, shards=2)
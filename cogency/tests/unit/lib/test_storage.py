@@ -6,13 +6,22 @@ from pathlib import Path
 import pytest
 
 from cogency.lib.storage import (
+    SCHEMA_VERSION,
+    Memory,
+    SQLite,
     clear_messages,
+    compact_profiles,
+    count_user_messages,
     get_cogency_dir,
     get_db_path,
+    last_conversation,
     load_messages,
     load_profile,
+    load_user_messages,
+    profile_version,
     save_message,
     save_profile,
+    vacuum,
 )
 
 
@@ -222,3 +231,288 @@ def test_profile_with_embedded_metadata(temp_dir):
     assert loaded_profile["style"] == "clean, minimal"
     assert loaded_profile["_meta"]["last_learned_at"] == 1234567890.0
     assert loaded_profile["_meta"]["messages_processed"] == 42
+
+
+def test_profile_cache_populated_on_save(temp_dir):
+    """Saved profile is served from memory without a database read."""
+    from unittest.mock import patch
+
+    assert save_profile("cached_user", {"who": "dev"}, temp_dir)
+
+    with patch("cogency.lib.storage.DB.connect") as mock_connect:
+        assert load_profile("cached_user", temp_dir) == {"who": "dev"}
+        assert profile_version("cached_user", temp_dir) == 1
+        mock_connect.assert_not_called()
+
+
+def test_profile_cache_returns_copies(temp_dir):
+    """Mutating a loaded profile does not corrupt the cache."""
+    assert save_profile("copy_user", {"who": "dev"}, temp_dir)
+
+    loaded = load_profile("copy_user", temp_dir)
+    loaded["who"] = "mutated"
+
+    assert load_profile("copy_user", temp_dir) == {"who": "dev"}
+
+
+def test_profile_cache_sees_external_writes(temp_dir):
+    """Another writer's new version is picked up after the revalidation window."""
+    import sqlite3
+    from unittest.mock import patch
+
+    assert save_profile("shared_user", {"who": "old"}, temp_dir)
+    assert load_profile("shared_user", temp_dir) == {"who": "old"}
+
+    # Simulate another process writing directly to the database
+    with sqlite3.connect(get_db_path(temp_dir)) as db:
+        db.execute(
+            "INSERT INTO profiles (user_id, version, data, created_at, char_count) VALUES (?, ?, ?, ?, ?)",
+            ("shared_user", 2, '{"who": "new"}', 0.0, 14),
+        )
+
+    with patch.dict("cogency.lib.storage.PROFILE_CACHE", {"revalidate": 0}):
+        assert load_profile("shared_user", temp_dir) == {"who": "new"}
+        assert profile_version("shared_user", temp_dir) == 2
+
+
+def test_save_profile_versions_sequential(temp_dir):
+    """Each save gets the next version from inside the insert."""
+    for i in range(3):
+        assert save_profile("versioned_user", {"n": i}, temp_dir)
+
+    assert profile_version("versioned_user", temp_dir) == 3
+
+
+def test_compact_profiles_retention(temp_dir):
+    """Compaction keeps the newest N versions and anything inside the time window."""
+    import sqlite3
+    from unittest.mock import patch
+
+    with patch.dict("cogency.lib.storage.PROFILE_RETENTION", {"compact_every": 1000}):
+        for i in range(8):
+            assert save_profile("old_user", {"n": i}, temp_dir)
+
+    # Age every version out of the time window
+    with sqlite3.connect(get_db_path(temp_dir)) as db:
+        db.execute("UPDATE profiles SET created_at = 0")
+
+    deleted = compact_profiles(temp_dir, keep_versions=3, keep_days=30)
+    assert deleted == 5
+
+    with sqlite3.connect(get_db_path(temp_dir)) as db:
+        versions = [row[0] for row in db.execute("SELECT version FROM profiles ORDER BY version")]
+    assert versions == [6, 7, 8]
+    assert load_profile("old_user", temp_dir) == {"n": 7}
+
+
+def test_compact_profiles_batched(temp_dir):
+    """Compaction deletes in bounded batches until every user is inside retention."""
+    import sqlite3
+    from unittest.mock import patch
+
+    with patch.dict("cogency.lib.storage.PROFILE_RETENTION", {"compact_every": 1000}):
+        for user in ("a", "b"):
+            for i in range(6):
+                assert save_profile(user, {"n": i}, temp_dir)
+    with sqlite3.connect(get_db_path(temp_dir)) as db:
+        db.execute("UPDATE profiles SET created_at = 0")
+
+    with patch.dict("cogency.lib.storage.PROFILE_RETENTION", {"batch": 3}):
+        assert compact_profiles(temp_dir, keep_versions=1, keep_days=30) == 10
+
+    with sqlite3.connect(get_db_path(temp_dir)) as db:
+        rows = db.execute("SELECT user_id, version FROM profiles ORDER BY user_id").fetchall()
+    assert rows == [("a", 6), ("b", 6)]
+
+
+def test_compact_profiles_keeps_recent(temp_dir):
+    """Versions inside the time window survive compaction."""
+    for i in range(8):
+        assert save_profile("recent_user", {"n": i}, temp_dir)
+
+    assert compact_profiles(temp_dir, keep_versions=1, keep_days=30) == 0
+
+
+def test_vacuum(temp_dir):
+    """Vacuum leaves the database incremental and intact."""
+    import sqlite3
+
+    assert save_message("conv", "user", "user", "Hello", temp_dir)
+    vacuum(temp_dir)
+    vacuum(temp_dir)
+
+    with sqlite3.connect(get_db_path(temp_dir)) as db:
+        assert db.execute("PRAGMA auto_vacuum").fetchone()[0] == 2
+    assert load_messages("conv", temp_dir)[0]["content"] == "Hello"
+
+
+def test_same_timestamp_messages(temp_dir):
+    """Events sharing a timestamp are kept, in insertion order."""
+    for content in ["first", "second", "third"]:
+        assert save_message("conv", "user", "user", content, temp_dir, timestamp=1.0)
+
+    assert [m["content"] for m in load_messages("conv", temp_dir)] == ["first", "second", "third"]
+
+
+def test_user_messages(temp_dir):
+    """User-turn queries span conversations and skip other event types."""
+    save_message("conv_a", "alice", "user", "one", temp_dir, timestamp=1.0)
+    save_message("conv_a", "alice", "respond", "reply", temp_dir, timestamp=2.0)
+    save_message("conv_b", "alice", "user", "two", temp_dir, timestamp=3.0)
+    save_message("conv_c", "bob", "user", "other", temp_dir, timestamp=4.0)
+
+    assert count_user_messages("alice", base_dir=temp_dir) == 2
+    assert count_user_messages("alice", since=1.0, base_dir=temp_dir) == 1
+    assert load_user_messages("alice", base_dir=temp_dir) == ["one", "two"]
+    assert load_user_messages("alice", limit=1, base_dir=temp_dir) == ["one"]
+    assert last_conversation("alice", temp_dir) == "conv_b"
+    assert last_conversation("nobody", temp_dir) is None
+
+
+def test_schema_indexes(temp_dir):
+    """Events carry two secondary indexes, both used by the hot queries."""
+    import sqlite3
+
+    save_message("conv", "user", "user", "Hello", temp_dir)
+
+    with sqlite3.connect(get_db_path(temp_dir)) as db:
+        indexes = {
+            row[0]
+            for row in db.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'messages'"
+                " AND sql IS NOT NULL"
+            )
+        }
+        plan = db.execute(
+            "EXPLAIN QUERY PLAN SELECT COUNT(*) FROM messages"
+            " WHERE user_key = 1 AND type = 'user' AND timestamp > 0"
+        ).fetchall()
+
+    assert indexes == {"idx_messages_conversation", "idx_messages_user"}
+    assert "idx_messages_user" in str(plan)
+
+
+def test_migrate_legacy_database(temp_dir):
+    """TEXT-keyed v1 databases are migrated in place on first connect."""
+    import sqlite3
+
+    with sqlite3.connect(get_db_path(temp_dir)) as db:
+        db.executescript("""
+            CREATE TABLE conversations (
+                conversation_id TEXT NOT NULL,
+                user_id TEXT NOT NULL,
+                type TEXT NOT NULL,
+                content TEXT NOT NULL,
+                timestamp REAL NOT NULL,
+                PRIMARY KEY (conversation_id, timestamp)
+            );
+            CREATE INDEX idx_conversations_id ON conversations(conversation_id);
+            INSERT INTO conversations VALUES ('conv', 'alice', 'respond', 'later', 2.0);
+            INSERT INTO conversations VALUES ('conv', 'alice', 'user', 'earlier', 1.0);
+            INSERT INTO conversations VALUES ('other', 'bob', 'user', 'hi', 1.5);
+        """)
+
+    assert [m["content"] for m in load_messages("conv", temp_dir)] == ["earlier", "later"]
+    assert save_message("conv", "alice", "user", "new", temp_dir)
+    assert load_messages("conv", temp_dir)[-1]["content"] == "new"
+    assert count_user_messages("bob", base_dir=temp_dir) == 1
+
+    with sqlite3.connect(get_db_path(temp_dir)) as db:
+        assert db.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION
+        seqs = db.execute(
+            "SELECT seq FROM conversations WHERE conversation_id = 'conv' ORDER BY seq"
+        ).fetchall()
+        legacy = db.execute(
+            "SELECT name FROM sqlite_master WHERE name LIKE '%conversations_%'"
+        ).fetchall()
+
+    assert [row[0] for row in seqs] == [1, 2, 3]
+    assert legacy == []
+
+
+@pytest.fixture(params=["sqlite", "memory", "sharded"])
+def backend(request, temp_dir):
+    """Each Storage implementation, behind the same protocol."""
+    if request.param == "sharded":
+        from cogency.lib.shards import Sharded
+
+        storage = Sharded(temp_dir, shards=2)
+        yield storage
+        storage.close()
+    else:
+        yield SQLite(temp_dir) if request.param == "sqlite" else Memory()
+
+
+def test_backend_messages(backend):
+    """Messages load in order, filtered and tail-limited, per conversation."""
+    for i, msg_type in enumerate(["user", "think", "respond", "user", "respond"]):
+        assert backend.save_message("conv", "alice", msg_type, f"m{i}", timestamp=1.0)
+    backend.save_message("other", "alice", "user", "elsewhere")
+
+    assert [m["content"] for m in backend.load_messages("conv")] == ["m0", "m1", "m2", "m3", "m4"]
+    assert [m["content"] for m in backend.load_messages("conv", limit=2)] == ["m3", "m4"]
+    assert [m["content"] for m in backend.load_messages("conv", include=["user"])] == ["m0", "m3"]
+    assert [m["content"] for m in backend.load_messages("conv", exclude=["think"], limit=3)] == [
+        "m2",
+        "m3",
+        "m4",
+    ]
+    assert backend.load_messages("missing") == []
+
+
+def test_backend_user_messages(backend):
+    """User-turn queries and search span conversations, ranked alike."""
+    backend.save_message("conv_a", "alice", "user", "python tips", timestamp=1.0)
+    backend.save_message("conv_a", "alice", "respond", "python python", timestamp=2.0)
+    backend.save_message("conv_b", "alice", "user", "python and more python", timestamp=3.0)
+    backend.save_message("conv_c", "alice", "user", "current python", timestamp=4.0)
+    backend.save_message("conv_d", "bob", "user", "python", timestamp=5.0)
+
+    assert backend.count_user_messages("alice") == 3
+    assert backend.count_user_messages("alice", since=1.0) == 2
+    assert backend.load_user_messages("alice", since=1.0, limit=1) == ["python and more python"]
+
+    matches = backend.search_user_messages("alice", "python", exclude_conversation="conv_c")
+    assert [(content, conv) for content, _, conv in matches] == [
+        ("python and more python", "conv_b"),
+        ("python tips", "conv_a"),
+    ]
+
+
+def test_backend_profiles(backend):
+    """Profiles are versioned and returned as copies."""
+    assert backend.load_profile("alice") == {}
+    assert backend.profile_version("alice") == 0
+
+    backend.save_profile("alice", {"who": "v1"})
+    backend.save_profile("alice", {"who": "v2"})
+
+    loaded = backend.load_profile("alice")
+    loaded["who"] = "mutated"
+    assert backend.load_profile("alice") == {"who": "v2"}
+    assert backend.profile_version("alice") == 2
+
+
+def test_backend_usage(backend):
+    """Usage records round-trip with their conversation and user."""
+    record = {
+        "model": "gpt-4o",
+        "key": 1,
+        "input": 120,
+        "output": 30,
+        "cached": 64,
+        "estimated": False,
+        "cost": 0.0006,
+        "ttft": 0.4,
+        "latency": 1.2,
+        "timestamp": 1000.0,
+    }
+    assert backend.save_usage("conv", "alice", [record, {**record, "timestamp": 2000.0}])
+    assert backend.save_usage("conv", "alice", [])
+
+    loaded = backend.load_usage(since=1500)
+    assert len(loaded) == 1
+    assert loaded[0]["conversation_id"] == "conv"
+    assert loaded[0]["user_id"] == "alice"
+    assert loaded[0]["cached"] == 64
+    assert not loaded[0]["estimated"]
@@ -1,8 +1,21 @@
 """Tokens tests - Cost calculation coverage."""
 
+import re
+from unittest.mock import patch
+
 import pytest
 
-from cogency.lib.tokens import PRICING, Tokens, calculate_cost, count_tokens
+from cogency.core.result import Ok
+from cogency.lib.tokens import (
+    PRICING,
+    Meter,
+    Tokens,
+    Usage,
+    _Counter,
+    _encoder,
+    calculate_cost,
+    count_tokens,
+)
 
 
 def test_count():
@@ -86,3 +99,56 @@ def test_pricing():
         assert "output" in pricing
         assert isinstance(pricing["input"], int | float)
         assert isinstance(pricing["output"], int | float)
+
+
+class WordEncoder:
+    """tiktoken's whitespace splitting, one token per piece - words keep one leading space."""
+
+    def encode(self, text, disallowed_special=()):
+        return re.findall(r"\s?\S+|\s+(?!\S)|\s+", text)
+
+
+async def _stream(*items):
+    for item in items:
+        yield item
+
+
+def test_encoder_cached():
+    """Encoders are built once per model."""
+    _encoder.cache_clear()
+    count_tokens("one", "gpt-4o")
+    count_tokens("two", "gpt-4o")
+    assert _encoder.cache_info().misses == 1
+
+
+def test_counter_chunk_boundaries():
+    """Chunked counting matches counting the whole text, wherever chunks split."""
+    text = "Streaming tokens arrive in  arbitrary pieces\nsplitting words mid way."
+    with patch("cogency.lib.tokens._encoder", return_value=WordEncoder()):
+        expected = count_tokens(text, "gpt-4o")
+        for size in [1, 3, 7, len(text)]:
+            counter = _Counter("gpt-4o")
+            for i in range(0, len(text), size):
+                counter.feed(text[i : i + size])
+            assert counter.close() == expected
+
+
+@pytest.mark.asyncio
+async def test_meter_prefers_provider_usage():
+    """Provider usage replaces local estimates and never reaches the consumer."""
+    meter = Meter("gpt-4o")
+    messages = [{"role": "user", "content": "hello there"}]
+
+    items = [i async for i in meter.wrap(messages, _stream(Ok("hi"), Ok(Usage(120, 7))))]
+    assert [i.unwrap() for i in items] == ["hi"]
+    assert (meter.input, meter.output) == (120, 7)
+
+    # No usage reported - estimated
+    [i async for i in meter.wrap(messages, _stream(Ok("a longer reply")))]
+    assert meter.input > 120 and meter.output > 7
+
+    event = meter.event()
+    assert event["type"] == "metrics"
+    assert event["requests"] == 2
+    assert event["input_tokens"] == meter.input
+    assert event["cost"] == meter.cost()
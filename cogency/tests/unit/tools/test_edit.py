@@ -0,0 +1,112 @@
+"""FileEdit / FileWrite tests - unique-match splicing, batches and atomic replacement."""
+
+import os
+from unittest.mock import patch
+
+import pytest
+
+from cogency.tools.file.edit import FileEdit
+from cogency.tools.file.write import FileWrite
+
+
+@pytest.mark.asyncio
+async def test_edit_unique_match(tmp_path):
+    """A unique match is replaced; the rest of the file streams through unchanged."""
+    path = tmp_path / "gen.py"
+    body = "x = 1\n" * 50_000
+    path.write_text(body + "TARGET = 'old'\n" + body)
+    os.chmod(path, 0o640)
+
+    result = await FileEdit().execute(str(path), "TARGET = 'old'", "TARGET = 'new'", sandbox=False)
+
+    assert result.unwrap().outcome == f"File edited: {path} (1 replacement)"
+    assert path.read_text() == body + "TARGET = 'new'\n" + body
+    assert path.stat().st_mode & 0o777 == 0o640
+    assert [p.name for p in tmp_path.iterdir()] == ["gen.py"]  # No temp file left
+
+
+@pytest.mark.asyncio
+async def test_edit_multiple_and_missing(tmp_path):
+    """Ambiguous matches report line context; missing text is an error."""
+    path = tmp_path / "a.txt"
+    path.write_text("one\nfoo\ntwo\nthree\nfoo\n")
+
+    result = await FileEdit().execute(str(path), "foo", "bar", sandbox=False)
+    assert result.failure
+    assert "Found 2 matches for 'foo'" in result.error
+    assert "    1: one\n>   2: foo\n    3: two" in result.error
+    assert "    4: three\n>   5: foo" in result.error
+
+    missing = await FileEdit().execute(str(path), "nope", "bar", sandbox=False)
+    assert missing.error.startswith("Text not found: 'nope'")
+    assert path.read_text() == "one\nfoo\ntwo\nthree\nfoo\n"
+
+
+@pytest.mark.asyncio
+async def test_edit_batch(tmp_path):
+    """A list of edits lands in one pass; any bad edit leaves the file untouched."""
+    path = tmp_path / "conf.py"
+    path.write_text("a = 1\nb = 2\nc = 3\n")
+
+    edits = [{"old": "c = 3", "new": "c = 30"}, {"old": "a = 1", "new": "a = 10"}]
+    result = await FileEdit().execute(str(path), edits=edits, sandbox=False)
+    assert result.unwrap().outcome == f"File edited: {path} (2 replacements)"
+    assert path.read_text() == "a = 10\nb = 2\nc = 30\n"
+
+    missing = [{"old": "b = 2", "new": "b = 20"}, {"old": "d = 4", "new": ""}]
+    result = await FileEdit().execute(str(path), edits=missing, sandbox=False)
+    assert result.error.startswith("Edit 2: Text not found: 'd = 4'")
+
+    overlap = [{"old": "b = 2\nc", "new": "x"}, {"old": "c = 30", "new": "y"}]
+    result = await FileEdit().execute(str(path), edits=overlap, sandbox=False)
+    assert result.error.startswith("Edits 1 and 2 overlap")
+    assert path.read_text() == "a = 10\nb = 2\nc = 30\n"
+
+
+@pytest.mark.asyncio
+async def test_edit_crash_keeps_original(tmp_path):
+    """A failure mid-write leaves the original file intact and no temp file behind."""
+    path = tmp_path / "a.txt"
+    path.write_text("keep me\n")
+
+    with patch.object(FileEdit, "_copy", side_effect=OSError("disk full")):
+        result = await FileEdit().execute(str(path), "keep", "lose", sandbox=False)
+
+    assert result.failure
+    assert path.read_text() == "keep me\n"
+    assert [p.name for p in tmp_path.iterdir()] == ["a.txt"]
+
+
+@pytest.mark.asyncio
+async def test_write_atomic(tmp_path):
+    """Writes create or replace the file whole, with a normal file mode."""
+    path = tmp_path / "out.txt"
+
+    assert (await FileWrite().execute(str(path), "first", sandbox=False)).success
+    assert (await FileWrite().execute(str(path), "second", sandbox=False)).success
+
+    assert path.read_text() == "second"
+    assert path.stat().st_mode & 0o777 == 0o666 & ~_umask()
+    assert [p.name for p in tmp_path.iterdir()] == ["out.txt"]
+
+
+@pytest.mark.asyncio
+async def test_write_batch(tmp_path):
+    """Several files in one call; an unsafe entry rejects the batch before any write."""
+    files = [
+        {"filename": str(tmp_path / "a.txt"), "content": "alpha"},
+        {"filename": str(tmp_path / "b.txt"), "content": "beta"},
+    ]
+    result = await FileWrite().execute(files=files, sandbox=False)
+    assert result.unwrap().outcome == "Wrote 2 files"
+    assert (tmp_path / "b.txt").read_text() == "beta"
+
+    files = [{"filename": str(tmp_path / "c.txt"), "content": "ok"}, {"filename": ""}]
+    assert (await FileWrite().execute(files=files, sandbox=False)).failure
+    assert not (tmp_path / "c.txt").exists()
+
+
+def _umask() -> int:
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
@@ -0,0 +1,55 @@
+"""FileList tests - glob, depth and entry caps, snapshot invalidation."""
+
+from unittest.mock import patch
+
+import pytest
+
+from cogency.tools.file.list import FileList
+
+
+@pytest.fixture
+def sandbox(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    root = tmp_path / ".sandbox"
+    (root / "src" / "pkg" / "deep").mkdir(parents=True)
+    (root / "main.py").write_text("print()")
+    (root / "notes.md").write_text("# notes")
+    (root / ".hidden").write_text("x")
+    (root / "src" / "app.py").write_text("app")
+    (root / "src" / "pkg" / "mod.py").write_text("mod")
+    (root / "src" / "pkg" / "deep" / "leaf.py").write_text("leaf")
+    return root
+
+
+@pytest.mark.asyncio
+async def test_list_glob_and_depth(sandbox):
+    """fnmatch globs, hidden files skipped, depth bounds the walk."""
+    result = (await FileList().execute(pattern="*.py")).unwrap()
+    assert result.content == "src/\n  app.py [code] 3B\nmain.py [code] 7B"
+
+    deep = (await FileList().execute(pattern="*.py", depth=4)).unwrap()
+    assert "leaf.py" in deep.content
+    assert deep.outcome == "Directory listed (4 items)"
+
+    substring = (await FileList().execute(pattern="NOTE")).unwrap()
+    assert substring.content == "notes.md [docs] 7B"
+
+
+@pytest.mark.asyncio
+async def test_list_entry_cap(sandbox):
+    """Traversal stops at the entry cap and says so."""
+    with patch("cogency.tools.file.list.LIST_MAX_ENTRIES", 2):
+        result = (await FileList().execute(depth=4)).unwrap()
+
+    assert result.outcome == "Directory listed (2 items)"
+    assert "[Listing stopped at 2 files" in result.content
+
+
+@pytest.mark.asyncio
+async def test_list_snapshot_invalidated(sandbox):
+    """A directory snapshot is reused until the directory changes."""
+    await FileList().execute()
+    (sandbox / "new.txt").write_text("fresh")
+
+    result = (await FileList().execute()).unwrap()
+    assert "new.txt [docs] 5B" in result.content
@@ -0,0 +1,164 @@
+"""FileRead tests - line windows, newline index, output cap, binary detection, batches."""
+
+import mmap
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+
+from cogency.tools.file.read import FileRead, _LineIndex
+
+
+def _file(tmp_path, name, data: bytes):
+    path = tmp_path / name
+    path.write_bytes(data)
+    return path
+
+
+def test_line_index_offsets(tmp_path):
+    """Offsets from the block index match a naive scan, across many tiny blocks."""
+    lines = [f"line {i}" + "x" * (i % 13) for i in range(200)]
+    data = "\n".join(lines).encode()
+    path = _file(tmp_path, "lines.txt", data)
+    starts = [0] + [i + 1 for i, b in enumerate(data) if b == ord("\n")]
+
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        index = _LineIndex(len(data), block=7)
+        for line in [150, 0, 3, 199, 42]:
+            assert index.offset(mm, line) == starts[line]
+        assert index.offset(mm, 200) is None
+
+
+def test_line_index_shared_across_threads(tmp_path):
+    """Concurrent lookups on one index grow it once, with consistent block counts."""
+    data = "".join(f"{i}\n" for i in range(5000)).encode()
+    path = _file(tmp_path, "shared.txt", data)
+    starts = [0] + [i + 1 for i, b in enumerate(data) if b == ord("\n")]
+
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        index = _LineIndex(len(data), block=16)
+        lines = list(range(4999, 0, -7)) * 4
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            offsets = list(pool.map(lambda line: index.offset(mm, line), lines))
+
+    assert offsets == [starts[line] for line in lines]
+    assert list(index.counts) == [data[: i * 16].count(b"\n") for i in range(len(index.counts))]
+
+
+@pytest.mark.asyncio
+async def test_read_crlf_lines(tmp_path):
+    """CRLF files read like text mode: line windows have no carriage returns."""
+    path = _file(tmp_path, "dos.txt", b"one\r\ntwo\r\nthree\r\n")
+
+    assert (await FileRead().execute(str(path), sandbox=False)).unwrap().content == (
+        "one\ntwo\nthree"
+    )
+    tail = await FileRead().execute(str(path), start=-1, sandbox=False)
+    assert tail.unwrap().content == "three"
+
+
+@pytest.mark.asyncio
+async def test_read_window(tmp_path):
+    """start/lines returns exactly that window."""
+    path = _file(tmp_path, "log.txt", "".join(f"row {i}\n" for i in range(1000)).encode())
+
+    result = await FileRead().execute(str(path), start=500, lines=3, sandbox=False)
+    assert result.unwrap().content == "row 500\nrow 501\nrow 502"
+
+    past = await FileRead().execute(str(path), start=5000, lines=3, sandbox=False)
+    assert past.unwrap().content == ""
+
+
+@pytest.mark.asyncio
+async def test_read_capped(tmp_path):
+    """Whole-file reads stop at the cap and say where to continue."""
+    path = _file(tmp_path, "big.txt", "".join(f"row {i}\n" for i in range(100)).encode())
+
+    with patch("cogency.tools.file.read.READ_MAX_BYTES", 50):
+        content = (await FileRead().execute(str(path), sandbox=False)).unwrap().content
+
+    assert content.startswith("row 0\nrow 1\n")
+    assert "row 7\n\n[Output capped at 50 bytes of 690 - continue with start=8]" in content
+
+
+@pytest.mark.asyncio
+async def test_read_binary_and_empty(tmp_path):
+    """Binary files are refused from the first block; empty files read as empty."""
+    binary = _file(tmp_path, "blob.bin", b"\x89PNG\0\0data")
+    result = await FileRead().execute(str(binary), sandbox=False)
+    assert result.failure
+    assert "binary" in result.error
+
+    empty = _file(tmp_path, "empty.txt", b"")
+    assert (await FileRead().execute(str(empty), sandbox=False)).unwrap().content == ""
+
+
+@pytest.mark.asyncio
+async def test_read_tail(tmp_path):
+    """Negative start counts back from the end, with or without a trailing newline."""
+    for data in ["a\nb\nc\nd\n", "a\nb\nc\nd"]:
+        path = _file(tmp_path, "tail.txt", data.encode())
+        result = await FileRead().execute(str(path), start=-2, sandbox=False)
+        assert result.unwrap().content == "c\nd"
+
+    result = await FileRead().execute(str(path), start=-10, lines=2, sandbox=False)
+    assert result.unwrap().content == "a\nb"
+
+
+@pytest.mark.asyncio
+async def test_read_bytes(tmp_path):
+    """Byte windows from the start or, with a negative offset, from the end."""
+    path = _file(tmp_path, "bytes.txt", b"0123456789")
+
+    assert (
+        await FileRead().execute(str(path), offset=2, size=3, sandbox=False)
+    ).unwrap().content == "234"
+    assert (
+        await FileRead().execute(str(path), offset=-4, sandbox=False)
+    ).unwrap().content == "6789"
+
+
+@pytest.mark.asyncio
+async def test_read_search(tmp_path):
+    """Literal and regex search, grep-style context, zero-indexed line numbers."""
+    rows = ["boot", "ERROR disk", "retry", "ok", "ok", "ok", "ERROR net", "done"]
+    path = _file(tmp_path, "app.log", "\n".join(rows).encode())
+
+    result = await FileRead().execute(str(path), pattern="ERROR", context=1, sandbox=False)
+    assert result.unwrap().outcome == f"Found 2 matching lines for 'ERROR' in {path}"
+    assert result.unwrap().content == "0-boot\n1:ERROR disk\n2-retry\n--\n5-ok\n6:ERROR net\n7-done"
+
+    result = await FileRead().execute(
+        str(path), pattern=r"^ERROR (\w+)$", regex=True, sandbox=False
+    )
+    assert result.unwrap().content == "1:ERROR disk\n6:ERROR net"
+
+    bad = await FileRead().execute(str(path), pattern="(", regex=True, sandbox=False)
+    assert bad.failure
+
+
+@pytest.mark.asyncio
+async def test_read_search_capped(tmp_path):
+    """The scan stops at the match cap."""
+    path = _file(tmp_path, "many.txt", "hit\n".join("" for _ in range(10)).encode())
+
+    with patch("cogency.tools.file.read.READ_MAX_MATCHES", 3):
+        result = await FileRead().execute(str(path), pattern="hit", sandbox=False)
+
+    assert result.unwrap().content.startswith("0:hit\n1:hit\n2:hit\n\n[Stopped at 3")
+
+
+@pytest.mark.asyncio
+async def test_read_many(tmp_path):
+    """Several files in one call - one section each, failures reported inline."""
+    a = _file(tmp_path, "a.txt", b"alpha\n")
+    b = _file(tmp_path, "b.txt", b"beta\n")
+    missing = str(tmp_path / "missing.txt")
+
+    result = await FileRead().execute(files=[str(a), str(b), missing], sandbox=False)
+    content = result.unwrap().content
+    assert result.unwrap().outcome == "Read 2 of 3 files"
+    assert content.startswith(f"=== {a} ===\nalpha\n\n=== {b} ===\nbeta")
+    assert f"=== {missing} ===\n[Error] File not found" in content
+
+    assert (await FileRead().execute(files=[missing], sandbox=False)).failure
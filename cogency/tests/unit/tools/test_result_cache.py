@@ -0,0 +1,66 @@
+"""Result cache tests - policy validation, eviction, invalidation through execute."""
+
+from unittest.mock import patch
+
+import pytest
+
+from cogency.core.config import Config
+from cogency.core.execute import execute_tools
+from cogency.tools.cache import ResultCache, results
+from cogency.tools.file import FileRead, FileWrite
+
+
+def test_key_is_canonical():
+    """Argument order does not matter; storage is never part of the key."""
+    a = ResultCache.key("read", {"file": "a.txt", "start": 1, "storage": object()})
+    b = ResultCache.key("read", {"start": 1, "file": "a.txt"})
+    assert a == b
+
+
+def test_state_ttl_and_eviction():
+    """Hits need a matching state and a live TTL; the LRU bound evicts the oldest."""
+    cache = ResultCache(maxsize=2)
+
+    cache.put("a", {"state": (1, 10)}, "A")
+    assert cache.get("a", {"state": (1, 10)}) == "A"
+    assert cache.get("a", {"state": (2, 10)}) is None  # File changed
+    assert cache.get("a", {"state": (1, 10)}) is None  # Stale entry was dropped
+
+    with patch("cogency.tools.cache.time.time", return_value=1000.0):
+        cache.put("web", {"ttl": 60}, "W")
+    with patch("cogency.tools.cache.time.time", return_value=1059.0):
+        assert cache.get("web", {"ttl": 60}) == "W"
+    with patch("cogency.tools.cache.time.time", return_value=1061.0):
+        assert cache.get("web", {"ttl": 60}) is None
+
+    for key in "xyz":
+        cache.put(key, {}, key)
+    stats = cache.stats()
+    assert stats["size"] == 2
+    assert stats["evictions"] == 1
+    assert (stats["hits"], stats["misses"]) == (2, 3)
+
+
+@pytest.mark.asyncio
+async def test_execute_reuses_reads_until_write(tmp_path):
+    """Repeated reads are served from cache; a write invalidates before the next read."""
+    path = tmp_path / "notes.txt"
+    path.write_text("v1")
+    read = FileRead()
+    config = Config(llm=None, storage=None, tools=[read, FileWrite()], sandbox=False, cache=True)
+    call = {"name": "read", "args": {"file": str(path)}}
+    results.clear()
+
+    with patch.object(FileRead, "execute", wraps=read.execute) as spy:
+        first = await execute_tools([dict(call, args=dict(call["args"]))], config)
+        second = await execute_tools([dict(call, args=dict(call["args"]))], config)
+        assert first == second
+        assert spy.call_count == 1
+
+        write = {"name": "write", "args": {"filename": str(path), "content": "v2"}}
+        await execute_tools([write], config)
+        third = await execute_tools([dict(call, args=dict(call["args"]))], config)
+
+    assert "v2" in third[0]
+    assert spy.call_count == 2
+    assert results.stats()["invalidations"] == 1
@@ -0,0 +1,56 @@
+"""Security tests - pattern scanning and sandbox path checks."""
+
+from unittest.mock import patch
+
+import pytest
+
+from cogency.core.config import Config
+from cogency.core.execute import _execute
+from cogency.tools.file import FileWrite
+from cogency.tools.security import Scanner, safe_path, validate_input
+
+
+def test_scanner_case_and_window_boundary():
+    """Matches are case-insensitive, including ones split across scan windows."""
+    assert validate_input("please SHUTDOWN now") is False
+    assert validate_input("x" * 10_000) is True
+    assert validate_input("") is True
+
+    with patch("cogency.tools.security.SCAN_WINDOW", 8):
+        scanner = Scanner(("rm -rf",))
+        assert scanner.find("abcdefRM -RF /") == "rm -rf"  # Window edge falls inside the match
+        assert scanner.find("abcdefgh" * 4) is None
+
+
+def test_custom_and_disabled_policy():
+    """A policy replaces the defaults; an empty policy scans nothing."""
+    assert validate_input("DROP TABLE users", ("drop table",)) is False
+    assert validate_input("rm -rf /", ("drop table",)) is True
+    assert validate_input("rm -rf /", ()) is True
+    assert Scanner(("../", "../../")).patterns == ("../",)  # Longer pattern is redundant
+
+
+def test_safe_path_sibling_prefix(tmp_path, monkeypatch):
+    """A sibling sharing the sandbox name as a prefix is outside it."""
+    monkeypatch.chdir(tmp_path)
+
+    assert safe_path(tmp_path / ".sandbox", "a/b.txt") == tmp_path / ".sandbox" / "a" / "b.txt"
+    with pytest.raises(ValueError):
+        safe_path(tmp_path / ".sandbox", "../.sandbox2/x")
+    with pytest.raises(ValueError):
+        safe_path(tmp_path / ".sandbox", "")
+
+
+@pytest.mark.asyncio
+async def test_agent_policy_reaches_tools(tmp_path):
+    """Config.security is what write checks content against."""
+    path = tmp_path / "q.sql"
+    config = Config(
+        llm=None, storage=None, tools=[FileWrite()], sandbox=False, security=("drop table",)
+    )
+
+    blocked = {"name": "write", "args": {"filename": str(path), "content": "DROP TABLE x"}}
+    assert "unsafe patterns" in (await _execute(blocked, config)).error
+
+    allowed = {"name": "write", "args": {"filename": str(path), "content": "rm -rf build"}}
+    assert (await _execute(allowed, config)).success
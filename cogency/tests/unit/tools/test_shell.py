@@ -0,0 +1,131 @@
+"""SystemShell tests - fresh processes and the persistent per-conversation worker."""
+
+import os
+import subprocess
+import sys
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from cogency.core.config import Config
+from cogency.core.execute import _execute
+from cogency.tools.system import SystemShell
+from cogency.tools.system import shell as shell_module
+from cogency.tools.system.worker import Worker
+
+pytestmark = pytest.mark.skipif(os.name != "posix", reason="worker needs POSIX rlimits")
+
+
+@pytest.fixture
+def sandbox(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / ".sandbox" / "sub").mkdir(parents=True)
+    yield tmp_path / ".sandbox"
+    shell_module._close_workers()
+    shell_module._workers.clear()
+
+
+async def _run(shell, command, conversation="conv", **kwargs):
+    return await shell.execute(command, conversation_id=conversation, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_fresh_process_streams_chunks(sandbox):
+    """Without a worker, stdout still reaches on_chunk while the command runs."""
+    chunks = []
+    result = await SystemShell().execute("echo hi", on_chunk=chunks.append)
+
+    assert result.unwrap().content == "hi"
+    assert chunks == ["hi\n"]
+    assert (await SystemShell().execute("cd sub")).failure  # Builtins need a worker
+
+
+@pytest.mark.asyncio
+async def test_worker_keeps_cwd_and_env(sandbox):
+    """cd and export carry over between calls; each conversation has its own worker."""
+    shell = SystemShell(persistent=True)
+
+    assert (await _run(shell, "cd sub")).success
+    assert (await _run(shell, "export GREETING=hello")).success
+    assert (await _run(shell, "pwd")).unwrap().content == str(sandbox.resolve() / "sub")
+    env = (await _run(shell, "env")).unwrap().content
+    assert "GREETING=hello" in env.splitlines()
+
+    other = (await _run(shell, "pwd", conversation="other")).unwrap().content
+    assert other == str(sandbox.resolve())
+    assert len(shell_module._workers) == 2
+
+
+@pytest.mark.asyncio
+async def test_worker_confines_cd_and_limits_cpu(sandbox):
+    """cd cannot leave the sandbox; a CPU-bound command is stopped by its rlimit."""
+    shell = SystemShell(persistent=True)
+
+    escape = await _run(shell, "cd ../..")
+    assert "outside the sandbox" in escape.error
+
+    with patch.object(shell_module, "SHELL_WORKER_CPU", 1):
+        spin = await _run(shell, "python -c 'while True: pass'", conversation="cpu")
+    assert spin.failure
+    assert "exit: -" in spin.error  # Killed by SIGXCPU
+
+
+@pytest.mark.asyncio
+async def test_idle_worker_exits_and_respawns(sandbox):
+    """An idle worker reaps itself; the next command gets a fresh one."""
+    shell = SystemShell(persistent=True)
+
+    with patch.object(shell_module, "SHELL_WORKER_IDLE", 0.2):
+        assert (await _run(shell, "cd sub")).success
+        worker = shell_module._workers.get(("conv", True))
+        time.sleep(0.5)
+        assert not worker.alive
+
+        pwd = (await _run(shell, "pwd")).unwrap().content
+    assert pwd == str(sandbox.resolve())  # State went with the old worker
+
+
+@pytest.mark.asyncio
+async def test_worker_gone_before_ack_retries(sandbox):
+    """A worker that reads the request and exits without acknowledging it is replaced."""
+    stale = Worker.__new__(Worker)
+    stale.lock = threading.Lock()
+    stale.proc = subprocess.Popen(
+        [sys.executable, "-c", "import sys; sys.stdin.readline()"],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    shell_module._workers.put(("conv", True), stale)
+
+    pwd = await _run(SystemShell(persistent=True), "pwd")
+    assert pwd.unwrap().content == str(sandbox.resolve())
+    assert shell_module._workers.get(("conv", True)) is not stale
+
+
+@pytest.mark.asyncio
+async def test_worker_refuses_protected_env(sandbox):
+    """PATH and loader hooks stay as the worker started - via export, unset or env."""
+    shell = SystemShell(persistent=True)
+
+    for command in ("export PATH=/tmp", "export LD_PRELOAD=/tmp/x.so", "unset PATH"):
+        result = await _run(shell, command)
+        assert "protected variable" in result.error
+    assert (await _run(shell, "export OK=1")).success
+    assert (await _run(shell, "pwd")).success
+
+    for command in ("env LD_PRELOAD=/tmp/x.so ls", "env PATH=/tmp ls", "env -u HOME ls"):
+        assert "takes no arguments" in (await _run(shell, command)).error
+    assert "OK=1" in (await _run(shell, "env")).unwrap().content.splitlines()
+
+
+@pytest.mark.asyncio
+async def test_execute_keys_worker_on_conversation(sandbox):
+    """Tool execution passes the conversation through to the shell."""
+    config = Config(llm=None, storage=None, tools=[SystemShell(persistent=True)])
+    call = {"name": "shell", "args": {"command": "pwd"}}
+
+    assert (await _execute(call, config, "user", conversation_id="c1")).success
+    assert ("c1", True) in shell_module._workers
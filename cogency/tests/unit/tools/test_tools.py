@@ -56,3 +56,21 @@ def test_shell_tools():
     """Shell tools are present."""
     shell_tools = [t for t in TOOLS if "shell" in t.name.lower()]
     assert len(shell_tools) > 0
+
+
+@pytest.mark.asyncio
+async def test_recall_uses_configured_storage(mock_storage):
+    """Recall searches the injected storage, skipping the current conversation."""
+    from unittest.mock import Mock
+
+    from cogency.core.execute import execute_tools
+
+    mock_storage.save_message("old_conv", "alice", "user", "deploy the rust service")
+    mock_storage.save_message("this_conv", "alice", "user", "rust question right now")
+
+    config = Mock(tools=TOOLS, sandbox=True, storage=mock_storage)
+    calls = [{"name": "recall", "args": {"query": "rust", "conversation_id": "this_conv"}}]
+    results = await execute_tools(calls, config, user_id="alice")
+
+    assert "deploy the rust service" in results[0]
+    assert "right now" not in results[0]